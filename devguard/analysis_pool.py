@@ -0,0 +1,121 @@
+# analysis_pool.py
+
+import os
+import queue
+import threading
+from collections import Counter
+
+from fingerprints import FingerprintGate
+
+# Files analyzed concurrently by the watcher.
+WATCHER_MAX_WORKERS = int(os.getenv("WATCHER_MAX_WORKERS", 4))
+
+# Distinct files allowed to wait for a worker; further submissions block (backpressure).
+WATCHER_MAX_PENDING = int(os.getenv("WATCHER_MAX_PENDING", 256))
+
+_STOP = object()
+
+class AnalysisPool:
+    """
+    Bounded worker pool with one job slot per file.
+
+    Independent files are analyzed concurrently, but a file is never analyzed by two
+    workers at once. A newer change to a file that is still queued reuses the queued
+    job; a newer change to a file that is being analyzed supersedes the running job,
+    whose result is dropped and the file analyzed again, so stale results are never
+    published after fresh ones. When `max_pending` files are waiting, `submit` blocks.
+    With a `gate`, a file whose content is identical to its last analysis is not
+    analyzed again; its previous results are republished instead.
+
+    Args:
+        analyze (callable): `analyze(path)` returning the results for a file.
+        publish (callable): `publish(path, results)` called with each up-to-date result.
+        max_workers (int): Number of worker threads.
+        max_pending (int): Maximum number of files waiting for a worker.
+        gate (FingerprintGate | None): Content fingerprints used to skip unchanged files.
+    """
+
+    def __init__(self, analyze, publish, max_workers: int = WATCHER_MAX_WORKERS,
+                 max_pending: int = WATCHER_MAX_PENDING, gate: FingerprintGate | None = None):
+        self.analyze = analyze
+        self.publish = publish
+        self.gate = gate
+        self.stats = Counter()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._generations: dict[str, int] = {}
+        self._queued: set[str] = set()
+        self._running: set[str] = set()
+        self._lock = threading.Lock()
+        self._workers = [threading.Thread(target=self._work, name=f"watcher-worker-{i}", daemon=True)
+                         for i in range(max_workers)]
+
+    def start(self) -> "AnalysisPool":
+        for worker in self._workers:
+            worker.start()
+        return self
+
+    def stop(self) -> None:
+        for _ in self._workers:
+            self._queue.put(_STOP)
+
+    def submit(self, path: str) -> None:
+        """Schedule an analysis of `path`, superseding any queued or running job for it."""
+        with self._lock:
+            self._generations[path] = self._generations.get(path, 0) + 1
+            self.stats["submitted"] += 1
+            if path in self._queued:
+                self.stats["coalesced"] += 1
+                return
+            if path in self._running:
+                # The running worker sees the new generation and analyzes again
+                self.stats["superseded"] += 1
+                return
+            self._queued.add(path)
+        if self._queue.full():
+            self.stats["backpressure_waits"] += 1
+        self._queue.put(path)
+
+    def pending(self) -> int:
+        """Number of files waiting for a worker."""
+        return self._queue.qsize()
+
+    def _work(self) -> None:
+        while True:
+            path = self._queue.get()
+            if path is _STOP:
+                return
+            with self._lock:
+                self._queued.discard(path)
+                self._running.add(path)
+            self._run_current(path)
+
+    def _run_current(self, path: str) -> None:
+        """Analyze `path` until the result matches its latest change, then publish it."""
+        while True:
+            with self._lock:
+                generation = self._generations[path]
+            fingerprint = self.gate.fingerprint(path) if self.gate is not None else None
+            results = self.gate.unchanged_results(path, fingerprint) if self.gate is not None else None
+            if results is not None:
+                self.stats["unchanged"] += 1
+            else:
+                try:
+                    results = self.analyze(path)
+                except Exception as e:
+                    print(f"❌ Analysis failed for {path}: {e}")
+                    results = None
+            with self._lock:
+                current = self._generations[path] == generation
+                done = current or not os.path.isfile(path)
+                if done:
+                    # Release the slot atomically, so a later change queues a fresh job
+                    self._running.discard(path)
+            if not done:
+                self.stats["dropped_stale"] += 1
+                continue
+            if current and results is not None:
+                if self.gate is not None:
+                    self.gate.record(path, fingerprint, results)
+                self.stats["published"] += 1
+                self.publish(path, results)
+            return
@@ -1,16 +1,18 @@
 # app.py
 
 import streamlit as st
-import threading
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 from utils import load_tool_metadata, build_tool_render_map
 from frontend.llm_assistant_ui import render_chat_interface
 from tools.library_license_checker.main import check_licenses
 from tools.internal_guideline_compliance_checker.main import check_compliance
-from file_watcher import start_file_watcher
-from file_event_queue import file_event_queue  # Shared queue between thread and UI
+from tools.library_license_checker.directory_scan import scan_files_licenses
+from file_watcher import watcher_service, ALLOWED_FILE_DIR
+from devguard.tools.library_license_checker.license_warmer import start_license_cache_warmer
+from result_store import file_results  # Results bus shared by the watcher and every session
 import hydralit_components as hc
 
 # --- Streamlit Page Setup ---
@@ -24,7 +26,7 @@ st.markdown("""
 
 st.title("DevHero 🦸🏼‍♀️")
 
-def on_file_change(file_path):
+def analyze_file(file_path):
     print(f"📂 Detected file change: {file_path}")
     file_ext = os.path.splitext(file_path)[1]
     results = []
@@ -38,30 +40,61 @@ def on_file_change(file_path):
         license_result = check_licenses(file_path)
         print("📜 Library License Check", license_result)
         results.append(("📜 Library License Check", license_result))
-
-    # Add result to shared queue for Streamlit to pick up
-    file_event_queue.put({
-        "file": file_path,
-        "results": results
-    })
-    print("file event queue", file_event_queue) 
-
-# --- Start Watcher Thread ONCE ---
-if "watcher_started" not in st.session_state:
-    threading.Thread(target=start_file_watcher, args=(on_file_change,), daemon=True).start()
-    st.session_state["watcher_started"] = True
-
-# --- Check for file changes from Queue ---
-if not file_event_queue.empty():
-    results_from_queue = file_event_queue.get() # Renamed for clarity
-    print("🚨 get file event queue", results_from_queue)
-    # Now, update the UI using results_from_queue
-    # Option 1: Simple markdown (as you had)
-    # st.markdown(results_from_queue)
-
-    # Option 2: Store in session_state to use your existing display logic
-    st.session_state["latest_tool_outputs"] = results_from_queue
-    st.rerun() # if you want to force an immediate refresh to show changes
+    return results
+
+def analyze_batch(files):
+    # One parallel scan for a burst of changes; each unique package is resolved once
+    print(f"📂 Detected {len(files)} file changes")
+    with ThreadPoolExecutor() as pool:
+        compliance_results = list(pool.map(lambda path: check_compliance(path, output_format="json"), files))
+    violations = [v for result in compliance_results if isinstance(result, list) for v in result]
+    license_report, _ = scan_files_licenses(files)
+    summary = {
+        "files": len(files),
+        "violations": len(violations),
+        "packages": len(license_report),
+        "risky_packages": sum(1 for r in license_report if r.get("rating") == "❌ Risky"),
+    }
+    return [
+        ("🗂️ Batch Summary", [summary]),
+        ("📏 Guideline Compliance Check", violations),
+        ("📜 Library License Check", license_report),
+    ]
+
+def publish_results(file_path, results):
+    # Replace the file's previous result; Streamlit picks up everything newer than its cursor
+    version = file_results.put(file_path, results)
+    print(f"📬 Published results for {file_path} (version {version})")
+
+def retract_results(file_path):
+    # Batched files are covered by the batch summary; their old per-file entry is outdated
+    file_results.discard(file_path)
+
+# --- Warm the license cache in the background (once per process) ---
+start_license_cache_warmer(ALLOWED_FILE_DIR)
+
+# --- Start the process-wide watcher (no-op once any session started it) ---
+watcher_service.start(analyze_file, publish_results, analyze_batch, retract_results)
+
+# Seconds between checks for new watcher results; only the Auto Check region reruns.
+AUTO_CHECK_REFRESH_SECONDS = float(os.getenv("AUTO_CHECK_REFRESH_SECONDS", 0.5))
+
+# Most recent files rendered in the Auto Check region.
+AUTO_CHECK_MAX_RENDERED = int(os.getenv("AUTO_CHECK_MAX_RENDERED", 20))
+
+def drain_new_results():
+    # Everything published since this session's last look, newest entry per file
+    if "results_subscription" not in st.session_state:
+        st.session_state["results_subscription"] = file_results.subscribe()
+    new_results = st.session_state["results_subscription"].poll()
+    if new_results:
+        outputs = st.session_state.setdefault("latest_tool_outputs", {})
+        for entry in new_results:
+            outputs.pop(entry["file"], None)
+            if entry["results"] is not None:
+                outputs[entry["file"]] = entry
+        while len(outputs) > file_results.max_files:
+            outputs.pop(next(iter(outputs)))
 
 ### HERE WE NEED TO PUT THE CODE CHECK RESULTS
 def show_inforcards(code_check_results):
@@ -116,14 +149,28 @@ with col1:
 
 
 # --- Display Auto Results from Watcher ---
-if "latest_tool_outputs" in st.session_state:
-    file_path = st.session_state["latest_tool_outputs"]["file"]
-    st.markdown("### 🕵️ Auto Check: File Changed")
-    st.success(f"📄 `{file_path}` changed")
-
-    for label, result in st.session_state["latest_tool_outputs"]["results"]:
+def render_tool_outputs(entry):
+    for label, result in entry["results"]:
         st.markdown(f"#### {label}")
         if isinstance(result, list) and result:
             st.dataframe(pd.DataFrame(result), use_container_width=True)
         else:
-            st.warning("⚠️ No data found or invalid format.")
\ No newline at end of file
+            st.warning("⚠️ No data found or invalid format.")
+
+@st.fragment(run_every=AUTO_CHECK_REFRESH_SECONDS)
+def render_auto_check():
+    # Reruns on its own timer, so new results appear without rebuilding the rest of the page
+    drain_new_results()
+    if not st.session_state.get("latest_tool_outputs"):
+        return
+    # Newest first; the most recent change is expanded
+    entries = sorted(st.session_state["latest_tool_outputs"].values(), key=lambda e: e["version"], reverse=True)
+    st.markdown(f"### 🕵️ Auto Check: {len(entries)} File{'s' if len(entries) != 1 else ''} Changed")
+    st.success(f"📄 `{entries[0]['file']}` changed")
+    for i, entry in enumerate(entries[:AUTO_CHECK_MAX_RENDERED]):
+        with st.expander(f"📄 {entry['file']}", expanded=(i == 0)):
+            render_tool_outputs(entry)
+    if len(entries) > AUTO_CHECK_MAX_RENDERED:
+        st.caption(f"{len(entries) - AUTO_CHECK_MAX_RENDERED} older files not shown")
+
+render_auto_check()
\ No newline at end of file
@@ -0,0 +1,129 @@
+# burst_router.py
+
+import os
+import threading
+import time
+from collections import Counter, deque
+
+# More than this many settled files within WATCHER_BURST_WINDOW seconds switches to batch mode.
+WATCHER_BURST_THRESHOLD = int(os.getenv("WATCHER_BURST_THRESHOLD", 20))
+WATCHER_BURST_WINDOW = float(os.getenv("WATCHER_BURST_WINDOW", 1.0))
+
+# Seconds files are collected in batch mode before they are scanned together.
+WATCHER_BATCH_WINDOW = float(os.getenv("WATCHER_BATCH_WINDOW", 2.0))
+
+class BurstRouter:
+    """
+    Routes settled file changes to interactive analysis or, during bursts, to batch scans.
+
+    Normally every file goes to `submit` (the per-file analysis pool). When more than
+    `threshold` files settle within `burst_window` seconds (a checkout, pull or code
+    generator), the router switches to batch mode: files are collected for
+    `batch_window` seconds, the most recently modified one is still submitted
+    interactively, and the rest are handed to `analyze_batch(files)` in one call whose
+    results are published as a single summary entry. Their earlier per-file results
+    describe content that has changed since, so `retract(files)` is called before the
+    scan. Batch mode ends with the flush; a continuing burst re-enters it immediately.
+
+    Args:
+        submit (callable): Per-file interactive path, called with a file path.
+        analyze_batch (callable): `analyze_batch(files)` returning the results for a batch.
+        publish (callable): `publish(label, results)` receiving each batch summary.
+        retract (callable | None): `retract(files)` invalidating the per-file results of batched files.
+        threshold (int): Files per `burst_window` above which batch mode starts.
+        burst_window (float): Seconds over which the file rate is measured.
+        batch_window (float): Seconds files are collected before a batch scan.
+    """
+
+    def __init__(self, submit, analyze_batch, publish, retract=None, threshold: int = WATCHER_BURST_THRESHOLD,
+                 burst_window: float = WATCHER_BURST_WINDOW, batch_window: float = WATCHER_BATCH_WINDOW):
+        self.submit = submit
+        self.analyze_batch = analyze_batch
+        self.publish = publish
+        self.retract = retract
+        self.threshold = threshold
+        self.burst_window = burst_window
+        self.batch_window = batch_window
+        self.stats = Counter()
+        self._recent: deque[float] = deque()
+        self._batch: set[str] = set()
+        self._batch_deadline: float | None = None
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="watcher-batch", daemon=True)
+
+    def start(self) -> "BurstRouter":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    @property
+    def batching(self) -> bool:
+        with self._cond:
+            return self._batch_deadline is not None
+
+    def dispatch(self, path: str) -> None:
+        """Route one settled file change."""
+        now = time.monotonic()
+        with self._cond:
+            self._recent.append(now)
+            while self._recent and self._recent[0] <= now - self.burst_window:
+                self._recent.popleft()
+            if self._batch_deadline is None and len(self._recent) > self.threshold:
+                self._batch_deadline = now + self.batch_window
+                self.stats["bursts"] += 1
+                print(f"🌊 Burst detected ({len(self._recent)} files in {self.burst_window}s), collecting a batch")
+                self._cond.notify()
+            if self._batch_deadline is not None:
+                self._batch.add(path)
+                self.stats["batched"] += 1
+                return
+        self.stats["interactive"] += 1
+        self.submit(path)
+
+    def _take_batch(self) -> list[str]:
+        """Wait for the current batch window to close, then remove and return its files."""
+        with self._cond:
+            while not self._stopped:
+                if self._batch_deadline is None:
+                    self._cond.wait()
+                    continue
+                remaining = self._batch_deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                files, self._batch = sorted(self._batch), set()
+                self._batch_deadline = None
+                return files
+            return []
+
+    def _run(self) -> None:
+        while not self._stopped:
+            files = [path for path in self._take_batch() if os.path.isfile(path)]
+            if not files:
+                continue
+            # The file the user touched last is analyzed on its own, ahead of the batch
+            latest = max(files, key=_mtime)
+            self.submit(latest)
+            files.remove(latest)
+            if not files:
+                continue
+            self.stats["batches"] += 1
+            label = f"🗂️ Batch of {len(files)} files under {os.path.commonpath(files)}"
+            print(f"📦 Scanning {label}")
+            if self.retract is not None:
+                self.retract(files)
+            try:
+                self.publish(label, self.analyze_batch(files))
+            except Exception as e:
+                print(f"❌ Batch analysis failed for {len(files)} files: {e}")
+
+def _mtime(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
@@ -0,0 +1,78 @@
+# event_pipeline.py
+
+import os
+import threading
+import time
+
+# Seconds a path must stay quiet before its change is dispatched.
+WATCHER_QUIET_WINDOW = float(os.getenv("WATCHER_QUIET_WINDOW", 0.3))
+
+class DebouncedEventPipeline:
+    """
+    Coalesces raw filesystem events into one dispatch per file.
+
+    Editors emit several events per save (truncate, write, chmod, atomic rename).
+    Every event for a path pushes its deadline back by `quiet_window`; once the path
+    has been quiet that long, `dispatch(path)` is called once on the pipeline thread.
+
+    Args:
+        dispatch (callable): Called with the path of each settled change.
+        quiet_window (float): Seconds without new events before a path is dispatched.
+    """
+
+    def __init__(self, dispatch, quiet_window: float = WATCHER_QUIET_WINDOW):
+        self.dispatch = dispatch
+        self.quiet_window = quiet_window
+        self.events_received = 0
+        self.events_dispatched = 0
+        self._deadlines: dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="watcher-debounce", daemon=True)
+
+    def start(self) -> "DebouncedEventPipeline":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def submit(self, path: str) -> None:
+        """Record an event for `path`, restarting its quiet window."""
+        path = os.path.abspath(path)
+        with self._cond:
+            self.events_received += 1
+            self._deadlines[path] = time.monotonic() + self.quiet_window
+            self._cond.notify()
+
+    def discard(self, path: str) -> None:
+        """Forget a pending change, e.g. because the file was deleted."""
+        with self._cond:
+            self._deadlines.pop(os.path.abspath(path), None)
+
+    def _take_due(self) -> list[str]:
+        """Wait until at least one path has settled, then remove and return the settled paths."""
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                due = [path for path, deadline in self._deadlines.items() if deadline <= now]
+                if due:
+                    for path in due:
+                        del self._deadlines[path]
+                    return due
+                timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                self._cond.wait(timeout)
+            return []
+
+    def _run(self) -> None:
+        while not self._stopped:
+            for path in self._take_due():
+                if not os.path.isfile(path):
+                    continue
+                self.events_dispatched += 1
+                try:
+                    self.dispatch(path)
+                except Exception as e:
+                    print(f"❌ Analysis failed for {path}: {e}")
@@ -1,37 +1,184 @@
 # file_watcher.py
 
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 import os
+import threading
+import time
 from dotenv import load_dotenv
 from tools.library_license_checker.main import check_licenses
 from tools.internal_guideline_compliance_checker.main import check_compliance
-from file_event_queue import file_event_queue
+from event_pipeline import DebouncedEventPipeline
+from analysis_pool import AnalysisPool
+from path_filter import PathFilter
+from fingerprints import FingerprintGate, WATCHER_SNAPSHOT_PATH
+from burst_router import BurstRouter
+from watch_manager import WatchManager, WATCHER_ROOTS, scan_files
+from devguard.tools.library_license_checker.license_warmer import start_license_cache_warmer
+from devguard.ruleset_version import ruleset_fingerprint
 
 load_dotenv()
 
 ALLOWED_FILE_DIR = os.getenv("ALLOWED_FILE_DIR", ".")
 
-observer_instance = None  # Global to prevent re-adding
-
 class FileChangeHandler(FileSystemEventHandler):
-    def __init__(self, callback):
-        self.callback = callback
+    """
+    Feeds file events into the debounced pipeline instead of analyzing on the observer thread.
+    Paths rejected by the filter are dropped before they are queued.
+    """
+
+    def __init__(self, pipeline: DebouncedEventPipeline, path_filter: PathFilter):
+        self.pipeline = pipeline
+        self.path_filter = path_filter
+        self.events_filtered = 0
+
+    def _submit(self, path: str) -> None:
+        if self.path_filter.matches(path):
+            self.pipeline.submit(path)
+        else:
+            self.events_filtered += 1
 
     def on_modified(self, event):
-        print("🚨 ON MODIFIED", event)
         if not event.is_directory:
-            self.callback(event.src_path)
+            self._submit(event.src_path)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._submit(event.src_path)
+
+    def on_moved(self, event):
+        # Atomic-save editors write a temp file and rename it over the target
+        if not event.is_directory:
+            self.pipeline.discard(event.src_path)
+            self._submit(event.dest_path)
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self.pipeline.discard(event.src_path)
+
+class WatcherService:
+    """
+    The single file watcher of this process, shared by every Streamlit session.
+
+    `start` is idempotent and guarded by a process-level lock, so however many
+    sessions call it, only one set of observers, analysis workers and snapshot exists
+    and each change is analyzed once. Sessions read the results from the shared
+    results bus (`result_store.file_results`).
+
+    `state` is "stopped", "starting" (setup runs in the background), "running" or
+    "failed". A failed setup stops whatever it had started, and the next `start` retries.
+    """
+
+    def __init__(self):
+        self.watch_manager = None
+        self.event_pipeline = None
+        self.analysis_pool = None
+        self.burst_router = None
+        self.gate = None
+        self._lock = threading.Lock()
+        self.state = "stopped"
+
+    @property
+    def running(self) -> bool:
+        return self.state == "running"
+
+    def start(self, analyze, publish, analyze_batch=None, retract=None) -> None:
+        """
+        Start watching `WATCHER_ROOTS` (default `ALLOWED_FILE_DIR`) in the background, once per process.
+
+        Args:
+            analyze (callable): `analyze(path)` returning the results for a changed file.
+            publish (callable): `publish(path, results)` receiving each up-to-date result.
+            analyze_batch (callable | None): `analyze_batch(files)` used for bursts of changes;
+                without it every file is analyzed individually.
+            retract (callable | None): `retract(path)` withdrawing the published results of a
+                file that is about to be scanned as part of a batch.
+        """
+        with self._lock:
+            if self.state in ("starting", "running"):
+                return
+            self.state = "starting"
+        threading.Thread(target=self._start_in_background, args=(analyze, publish, analyze_batch, retract),
+                         name="watcher-setup", daemon=True).start()
+
+    def _start_in_background(self, analyze, publish, analyze_batch, retract) -> None:
+        try:
+            self._setup(analyze, publish, analyze_batch, retract)
+        except Exception as e:
+            print(f"❌ Watcher setup failed: {e}")
+            self.stop(state="failed")
+            return
+        with self._lock:
+            self.state = "running"
+
+    def stop(self, state: str = "stopped") -> None:
+        """Stop the watches and background threads started so far; a later `start` starts afresh."""
+        for component in (self.watch_manager, self.event_pipeline, self.burst_router, self.analysis_pool):
+            if component is not None:
+                component.stop()
+        self.watch_manager = self.event_pipeline = self.burst_router = self.analysis_pool = None
+        with self._lock:
+            self.state = state
+
+    def _setup(self, analyze, publish, analyze_batch, retract) -> None:
+        self.gate = FingerprintGate(WATCHER_SNAPSHOT_PATH, ruleset=ruleset_fingerprint())
+        self.analysis_pool = AnalysisPool(analyze, publish, gate=self.gate).start()
+        dispatch = self.analysis_pool.submit
+        if analyze_batch is not None:
+            self.burst_router = BurstRouter(self.analysis_pool.submit, analyze_batch, publish,
+                                            retract=lambda files: self.retract_batched(files, retract)).start()
+            dispatch = self.burst_router.dispatch
+        self.event_pipeline = DebouncedEventPipeline(dispatch).start()
+        roots = WATCHER_ROOTS or [ALLOWED_FILE_DIR]
+        self.watch_manager = WatchManager(
+            roots,
+            make_handler=lambda path_filter: FileChangeHandler(self.event_pipeline, path_filter),
+            on_change=self.event_pipeline.submit,
+            on_delete=self.event_pipeline.discard,
+        ).start()
+        print(f"👀 Watching for changes in: {', '.join(roots)} (quiet window {self.event_pipeline.quiet_window}s)")
+
+        # Catch up on edits made while the app was down; unchanged files keep their stored results
+        self.reconcile_snapshot(publish)
+
+        # Pre-resolve workspace dependency licenses so the first checks hit the cache
+        start_license_cache_warmer(ALLOWED_FILE_DIR)
+
+    def retract_batched(self, files: list[str], retract=None) -> None:
+        """
+        Invalidate the per-file state of files that are scanned as a batch.
+
+        A batch only publishes a summary, so the fingerprints and per-file results
+        recorded for these files would otherwise keep describing their old content. The
+        fingerprints are dropped, so the next change or restart analyzes each file again.
+
+        Args:
+            files (list[str]): Files of the batch.
+            retract (callable | None): `retract(path)` withdrawing each file's published results.
+        """
+        self.gate.forget(files)
+        if retract is not None:
+            for path in files:
+                retract(path)
+
+    def reconcile_snapshot(self, publish) -> None:
+        """
+        Compare the persisted snapshot with the watched tree using only `stat`.
 
-def start_file_watcher(on_file_change):
-    global observer_instance
+        Unchanged files republish their stored results; new and modified files are
+        queued for analysis.
 
-    if observer_instance is not None and observer_instance.is_alive():
-        print("🔁 Watcher already running.")
-        return
+        Args:
+            publish (callable): `publish(path, results)` receiving the stored results.
+        """
+        started = time.perf_counter()
+        stats = scan_files(self.watch_manager.filters)
+        unchanged, changed = self.gate.reconcile(stats, self.watch_manager.roots)
+        for entry in unchanged:
+            publish(entry["file"], entry["results"])
+        for path in changed:
+            self.analysis_pool.submit(path)
+        print(f"🗃️ Snapshot reconciled in {time.perf_counter() - started:.2f}s: "
+              f"{len(unchanged)} unchanged, {len(changed)} queued")
 
-    event_handler = FileChangeHandler(on_file_change)
-    observer_instance = Observer()
-    observer_instance.schedule(event_handler, path=ALLOWED_FILE_DIR, recursive=True)
-    observer_instance.start()
-    print(f"👀 Watching for changes in: {ALLOWED_FILE_DIR}")
\ No newline at end of file
+# One watcher per process, whichever session starts it first
+watcher_service = WatcherService()
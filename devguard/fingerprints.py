@@ -0,0 +1,173 @@
+# fingerprints.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from devguard.tools.library_license_checker.cache import CACHE_DIR
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Fingerprints and last results of watched files, kept across restarts.
+WATCHER_SNAPSHOT_PATH = os.getenv("WATCHER_SNAPSHOT_PATH", os.path.join(CACHE_DIR, "watcher_snapshot.json"))
+
+# Seconds between a recorded result and the snapshot being written.
+WATCHER_SNAPSHOT_INTERVAL = float(os.getenv("WATCHER_SNAPSHOT_INTERVAL", 5.0))
+
+def hash_file(path: str) -> str:
+    """Return the BLAKE2b digest of a file's content."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class FingerprintGate:
+    """
+    Remembers the content last analyzed for each file, so unchanged saves skip analysis.
+
+    A file whose size and mtime match the recorded ones is unchanged without being read.
+    Otherwise its content is hashed; an identical hash (e.g. `touch`, format-on-save with
+    no edits, a checkout restoring the same file) is still unchanged, and only the stat
+    fields are refreshed. Results are recorded together with the fingerprint they belong to.
+
+    With a `snapshot_path`, the fingerprints and results are loaded at startup and
+    written back (atomically, at most every `save_interval` seconds) after changes.
+    The snapshot records the `ruleset` it was produced with; a snapshot written under
+    a different ruleset is discarded, so every file is analyzed again with the current rules.
+
+    Args:
+        snapshot_path (str | None): JSON file persisting the fingerprints, or None to keep them in memory.
+        save_interval (float): Seconds to wait after a change before writing the snapshot.
+        ruleset (str | None): Version of the rules and tables producing the results.
+    """
+
+    def __init__(self, snapshot_path: str | None = None, save_interval: float = WATCHER_SNAPSHOT_INTERVAL,
+                 ruleset: str | None = None):
+        self.snapshot_path = snapshot_path
+        self.save_interval = save_interval
+        self.ruleset = ruleset
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._save_timer = None
+        self.hashed = 0
+        if snapshot_path:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("ruleset") != self.ruleset:
+                print(f"🗃️ Watcher snapshot was written with other rules, discarding {len(data.get('files', {}))} entries")
+                return
+            self._entries = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            self._entries = {}
+
+    def save(self) -> None:
+        """Write the snapshot file now, replacing the previous one atomically."""
+        if not self.snapshot_path:
+            return
+        with self._lock:
+            self._save_timer = None
+            data = json.dumps({"saved_at": time.time(), "ruleset": self.ruleset, "files": self._entries}, default=str)
+        tmp_path = f"{self.snapshot_path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"⚠️ Could not write watcher snapshot {self.snapshot_path}: {e}")
+
+    def _schedule_save(self) -> None:
+        # Caller holds the lock
+        if self.snapshot_path and self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_interval, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def reconcile(self, stats: dict[str, tuple[int, int]], roots: list[str]) -> tuple[list[dict], list[str]]:
+        """
+        Compare the snapshot with a stat-only walk of the watched roots.
+
+        Files whose size and mtime match the snapshot keep their stored results.
+        New or modified files are returned for analysis, and files under the roots
+        that no longer exist are dropped from the snapshot.
+
+        Args:
+            stats (dict[str, tuple[int, int]]): `path → (size, mtime_ns)` of the files found.
+            roots (list[str]): Roots that were walked.
+
+        Returns:
+            tuple:
+                - list[dict]: `{"file", "results", "analyzed_at"}` per unchanged file, oldest first.
+                - list[str]: Paths of new or changed files.
+        """
+        prefixes = tuple(os.path.join(os.path.abspath(root), "") for root in roots)
+        unchanged, changed = [], []
+        with self._lock:
+            for path in [p for p in self._entries if p.startswith(prefixes) and p not in stats]:
+                del self._entries[path]
+            for path, (size, mtime_ns) in stats.items():
+                entry = self._entries.get(path)
+                if entry and entry["size"] == size and entry["mtime_ns"] == mtime_ns:
+                    unchanged.append({"file": path, "results": entry["results"],
+                                      "analyzed_at": entry.get("analyzed_at", 0)})
+                else:
+                    changed.append(path)
+            self._schedule_save()
+        unchanged.sort(key=lambda item: item["analyzed_at"])
+        return unchanged, changed
+
+    def fingerprint(self, path: str) -> dict | None:
+        """
+        Return the current fingerprint of `path`, hashing only when size or mtime changed.
+
+        Returns:
+            dict | None: `{"size", "mtime_ns", "hash"}`, or None if the file cannot be read.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": entry["hash"]}
+        try:
+            content_hash = hash_file(path)
+        except OSError:
+            return None
+        self.hashed += 1
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": content_hash}
+
+    def unchanged_results(self, path: str, fingerprint: dict | None):
+        """Return the recorded results if `fingerprint` matches the last analyzed content, else None."""
+        if fingerprint is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry["hash"] != fingerprint["hash"]:
+                return None
+            # Same content under new stat fields: skip hashing next time
+            entry["size"], entry["mtime_ns"] = fingerprint["size"], fingerprint["mtime_ns"]
+            return entry["results"]
+
+    def record(self, path: str, fingerprint: dict | None, results: list) -> None:
+        """Remember `results` as the analysis of the content described by `fingerprint`."""
+        if fingerprint is None:
+            return
+        with self._lock:
+            self._entries[path] = {**fingerprint, "results": results, "analyzed_at": time.time()}
+            self._schedule_save()
+
+    def forget(self, paths: list[str]) -> None:
+        """Drop the recorded fingerprints and results of `paths`, so they are analyzed again."""
+        with self._lock:
+            for path in paths:
+                self._entries.pop(path, None)
+            self._schedule_save()
@@ -0,0 +1,312 @@
+"""
+File name: history_scan.py
+
+Description: Git-history scanning for the compliance and license checkers.
+Commits are walked without checking anything out: trees and file contents are read
+straight from the object store through one long-running `git cat-file --batch`
+process. Unchanged subtrees are listed once, and every blob is analyzed once per
+file type, with results cached by blob hash (in memory and on disk), so a file that
+is identical across hundreds of commits costs a single analysis. The scan emits a
+per-commit time series of compliance violations and dependency license risk.
+
+    python -m devguard.history_scan /path/to/repo --rev main --max-commits 500 --output history.csv
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from devguard.tools.internal_guideline_compliance_checker.utils import apply_compliance_rules_with_count
+from devguard.tools.library_license_checker.cache import DiskCache
+from devguard.tools.library_license_checker.directory_scan import (SKIPPED_DIRS,
+                                                                   DEFAULT_MAX_WORKERS,
+                                                                   is_license_source_file,
+                                                                   extract_content_packages,
+                                                                   resolve_package)
+from devguard.tools.library_license_checker.exporters import export_results
+from devguard.tools.library_license_checker.maven_versions import resolve_latest_versions
+from devguard.tools.library_license_checker.tracing import in_trace_context
+from devguard.ruleset_version import ruleset_fingerprint
+
+COMPLIANCE_EXTENSIONS = (".py", ".java", ".xml")
+
+# Rating labels counted in the license-risk series.
+RISK_LEVELS = ("Trusted", "Caution", "Risky", "Unknown")
+
+class GitObjectReader:
+    """
+    Reads git objects through a single `git cat-file --batch` process.
+
+    Args:
+        repo (str): Path to the repository (work tree or bare).
+    """
+
+    def __init__(self, repo: str):
+        self._proc = subprocess.Popen(["git", "-C", repo, "cat-file", "--batch"],
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def read(self, sha: str) -> tuple[str, bytes]:
+        """
+        Return the (type, raw content) of an object.
+
+        Raises:
+            KeyError: If the object does not exist.
+        """
+        self._proc.stdin.write(sha.encode("ascii") + b"\n")
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if len(header) < 3:
+            raise KeyError(sha)
+        size = int(header[2])
+        data = self._proc.stdout.read(size)
+        self._proc.stdout.read(1)  # trailing newline
+        return header[1].decode("ascii"), data
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            self._proc.wait()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+def list_commits(repo: str, rev: str = "HEAD", max_commits: int | None = None,
+                 first_parent: bool = True) -> list[dict]:
+    """
+    List commits reachable from `rev`, oldest first.
+
+    Args:
+        repo (str): Repository path.
+        rev (str): Revision or range (e.g. "main", "v1.0..HEAD").
+        max_commits (int | None): Keep only the most recent N commits.
+        first_parent (bool): Follow only the first parent of merges (mainline history).
+
+    Returns:
+        list[dict]: Commits with 'commit', 'tree', 'timestamp' and 'subject'.
+    """
+    cmd = ["git", "-C", repo, "log", "--reverse", "--format=%H%x09%T%x09%ct%x09%s"]
+    if first_parent:
+        cmd.append("--first-parent")
+    if max_commits:
+        cmd.append(f"--max-count={max_commits}")
+    cmd.append(rev)
+    output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    commits = []
+    for line in output.splitlines():
+        sha, tree, timestamp, subject = (line.split("\t", 3) + [""])[:4]
+        commits.append({"commit": sha, "tree": tree, "timestamp": int(timestamp), "subject": subject})
+    return commits
+
+def parse_tree(data: bytes) -> list[tuple[str, str, str]]:
+    """Parse a raw tree object into (mode, name, sha) entries."""
+    entries = []
+    pos = 0
+    while pos < len(data):
+        space = data.index(b" ", pos)
+        nul = data.index(b"\0", space)
+        mode = data[pos:space].decode("ascii")
+        name = data[space + 1:nul].decode("utf-8", errors="surrogateescape")
+        sha = data[nul + 1:nul + 21].hex()
+        entries.append((mode, name, sha))
+        pos = nul + 21
+    return entries
+
+def is_history_file(path: str) -> bool:
+    """Return True if either checker analyzes the file."""
+    return path.lower().endswith(COMPLIANCE_EXTENSIONS) or is_license_source_file(path)
+
+def file_kind(path: str) -> str:
+    """Return the analysis kind of a file: its extension, or its name for manifests and lockfiles."""
+    name = os.path.basename(path).lower()
+    if is_license_source_file(path) and not name.endswith((".py", ".java")):
+        return "pom.xml" if name.endswith(".xml") else name
+    return os.path.splitext(name)[-1]
+
+class HistoryScanner:
+    """
+    Scans commits for compliance violations and dependency license risk.
+
+    Args:
+        repo (str): Repository path.
+        compliance (bool): Run the internal guideline compliance rules.
+        licenses (bool): Extract dependencies and resolve their licenses.
+        max_workers (int): Thread pool size for license lookups.
+    """
+
+    def __init__(self, repo: str, compliance: bool = True, licenses: bool = True,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        self.repo = repo
+        self.compliance = compliance
+        self.licenses = licenses
+        self.max_workers = max_workers
+        self.stats = Counter()
+        self._trees: dict[str, list[tuple[str, str]]] = {}
+        self._blobs: dict[str, dict] = {}
+        self._blob_cache = DiskCache("history_blobs")
+        self._package_results: dict[tuple, dict] = {}
+
+    def _list_files(self, reader: GitObjectReader, tree_sha: str) -> list[tuple[str, str]]:
+        """Return (path, blob sha) of the analyzable files in a tree; unchanged subtrees are listed once."""
+        cached = self._trees.get(tree_sha)
+        if cached is not None:
+            self.stats["trees_reused"] += 1
+            return cached
+
+        _, data = reader.read(tree_sha)
+        self.stats["trees_read"] += 1
+        files = []
+        for mode, name, sha in parse_tree(data):
+            if mode == "40000":
+                if name not in SKIPPED_DIRS:
+                    files.extend((f"{name}/{path}", blob) for path, blob in self._list_files(reader, sha))
+            elif mode.startswith("100") and is_history_file(name):
+                files.append((name, sha))
+        self._trees[tree_sha] = files
+        return files
+
+    def _analyze_blob(self, reader: GitObjectReader, path: str, sha: str) -> dict:
+        """Analyze one blob for its file kind, reusing results cached by blob hash and ruleset."""
+        # The ruleset fingerprint retires cached results when rules, maps or aliases change
+        key = f"{ruleset_fingerprint()}:{file_kind(path)}:{int(self.compliance)}{int(self.licenses)}:{sha}"
+        result = self._blobs.get(key)
+        if result is None:
+            result = self._blob_cache.get(key)
+            if result is None:
+                _, content = reader.read(sha)
+                result = self._analyze_content(path, content)
+                self._blob_cache.set(key, result)
+                self.stats["blobs_analyzed"] += 1
+            else:
+                self.stats["blobs_from_disk_cache"] += 1
+            self._blobs[key] = result
+        else:
+            self.stats["blobs_reused"] += 1
+        return result
+
+    def _analyze_content(self, path: str, content: bytes) -> dict:
+        result = {"violations": 0, "rules": {}, "packages": []}
+        ext = os.path.splitext(path)[-1].lower()
+        if self.compliance and ext in COMPLIANCE_EXTENSIONS:
+            try:
+                violations, _ = apply_compliance_rules_with_count(content.decode("utf-8"), ext[1:])
+                result["violations"] = len(violations)
+                result["rules"] = dict(Counter(v["id"] for v in violations))
+            except (UnicodeDecodeError, SyntaxError, ValueError) as e:
+                print(f"[WARN] Could not check {path}: {e}")
+        if self.licenses and is_license_source_file(path):
+            result["packages"] = [list(k) for k in dict.fromkeys(extract_content_packages(path, content))]
+        return result
+
+    def _resolve_packages(self, keys: set[tuple]) -> None:
+        """Resolve the licenses of packages not seen in earlier commits."""
+        new_keys = sorted((k for k in keys if k not in self._package_results), key=lambda k: (k[0], k[1], str(k[2])))
+        if not new_keys:
+            return
+        resolve_latest_versions([tuple(name.split(":", 1)) for ecosystem, name, version in new_keys
+                                 if ecosystem == "maven" and version == "latest"])
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for key, result in zip(new_keys, pool.map(in_trace_context(resolve_package), new_keys)):
+                self._package_results[key] = result
+
+    def scan(self, commits: list[dict]) -> list[dict]:
+        """
+        Scan commits in order and return one time-series row per commit.
+
+        Returns:
+            list[dict]: Rows with the commit, its date and subject, files checked,
+            violation count, package count and package counts per license rating.
+        """
+        series = []
+        with GitObjectReader(self.repo) as reader:
+            for index, commit in enumerate(commits, start=1):
+                files = self._list_files(reader, commit["tree"])
+                violations = 0
+                rules = Counter()
+                packages = set()
+                for path, sha in files:
+                    result = self._analyze_blob(reader, path, sha)
+                    violations += result["violations"]
+                    rules.update(result["rules"])
+                    packages.update(tuple(k) for k in result["packages"])
+
+                row = {
+                    "commit": commit["commit"],
+                    "date": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(commit["timestamp"])),
+                    "subject": commit["subject"],
+                    "files": len(files),
+                }
+                if self.compliance:
+                    row["violations"] = violations
+                    row["top_rules"] = ", ".join(f"{rule}={count}" for rule, count in rules.most_common(5))
+                if self.licenses:
+                    self._resolve_packages(packages)
+                    ratings = Counter(_risk_level(self._package_results[k]["rating"]) for k in packages)
+                    row["packages"] = len(packages)
+                    for level in RISK_LEVELS:
+                        row[level.lower()] = ratings.get(level, 0)
+                series.append(row)
+                print(f"[INFO] [{index}/{len(commits)}] {commit['commit'][:10]} {len(files)} files")
+        return series
+
+def _risk_level(rating: str) -> str:
+    for level in RISK_LEVELS:
+        if level in rating:
+            return level
+    return "Unknown"
+
+def scan_history(repo: str, rev: str = "HEAD", max_commits: int | None = None, compliance: bool = True,
+                 licenses: bool = True, output_path: str | None = None) -> list[dict]:
+    """
+    Scan the history of a git repository and return a per-commit time series.
+
+    Args:
+        repo (str): Repository path.
+        rev (str): Revision or range to walk (first-parent history).
+        max_commits (int | None): Only scan the most recent N commits.
+        compliance (bool): Count internal guideline violations.
+        licenses (bool): Count dependencies per license rating.
+        output_path (str | None): Write the series to .json, .csv, .xlsx or .parquet.
+
+    Returns:
+        list[dict]: One row per commit, oldest first.
+    """
+    commits = list_commits(repo, rev, max_commits)
+    print(f"[INFO] Scanning {len(commits)} commits of {repo} ({rev})")
+    started = time.perf_counter()
+    scanner = HistoryScanner(repo, compliance=compliance, licenses=licenses)
+    series = scanner.scan(commits)
+    stats = scanner.stats
+    print(f"[INFO] History scan finished in {time.perf_counter() - started:.1f}s: "
+          f"{stats['blobs_analyzed']} blobs analyzed, {stats['blobs_reused'] + stats['blobs_from_disk_cache']} reused, "
+          f"{stats['trees_read']} trees read, {stats['trees_reused']} reused")
+
+    if output_path:
+        if output_path.lower().endswith(".json"):
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(series, f, indent=2)
+        else:
+            export_results(series, output_path, columns=list(series[0]) if series else None)
+        print(f"[INFO] Time series written to: {output_path}")
+    return series
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-commit compliance and license-risk time series from git history")
+    parser.add_argument("repo", help="Path to the git repository")
+    parser.add_argument("--rev", default="HEAD", help="Revision or range to scan (first-parent history)")
+    parser.add_argument("--max-commits", type=int, default=None, help="Only scan the most recent N commits")
+    parser.add_argument("--no-compliance", action="store_true", help="Skip the compliance rules")
+    parser.add_argument("--no-licenses", action="store_true", help="Skip dependency license resolution")
+    parser.add_argument("--output", default=None, help="Write the series to .json, .csv, .xlsx or .parquet")
+    args = parser.parse_args()
+
+    series = scan_history(args.repo, args.rev, args.max_commits, compliance=not args.no_compliance,
+                          licenses=not args.no_licenses, output_path=args.output)
+    for row in series:
+        print(json.dumps(row))
@@ -0,0 +1,129 @@
+# path_filter.py
+
+import fnmatch
+import os
+
+from devguard.tools.library_license_checker.cache import CACHE_DIR
+from fingerprints import WATCHER_SNAPSHOT_PATH
+
+try:
+    import pathspec
+except ImportError:  # Optional: fall back to the built-in gitignore-style matcher
+    pathspec = None
+
+def _split_env(name: str, default: str = "") -> list[str]:
+    return [item.strip() for item in os.getenv(name, default).split(",") if item.strip()]
+
+# Extensions the watcher analyzes.
+WATCHER_EXTENSIONS = tuple(_split_env("WATCHER_EXTENSIONS", ".py,.java,.xml"))
+
+# Extra gitignore-style patterns; only matching paths are watched when includes are given.
+WATCHER_INCLUDE = _split_env("WATCHER_INCLUDE")
+WATCHER_EXCLUDE = _split_env("WATCHER_EXCLUDE")
+
+# Ignore files read from the watch root, with gitignore semantics.
+WATCHER_IGNORE_FILES = _split_env("WATCHER_IGNORE_FILES", ".gitignore,.devguardignore")
+
+# Never worth analyzing, and partly written by the toolkit itself.
+DEFAULT_EXCLUDES = [
+    ".git/", "__pycache__/", "venv/", ".venv/", "env/", "node_modules/", ".idea/", ".vscode/",
+    "target/", "build/", "dist/", ".mypy_cache/", ".pytest_cache/",
+    "reports/", "*.log", "license_report.*", "license_check_results.*",
+    "*.pyc", "*.swp", "*.swx", "*.tmp", "*~", ".#*",
+]
+
+def watcher_output_paths() -> list[str]:
+    """Paths the toolkit writes to while it runs; changes there must never trigger analysis."""
+    return [os.path.abspath("reports"), CACHE_DIR, WATCHER_SNAPSHOT_PATH]
+
+class _FallbackSpec:
+    """Minimal gitignore-style matcher used when `pathspec` is not installed."""
+
+    def __init__(self, patterns: list[str]):
+        self.rules = []
+        for pattern in patterns:
+            negate = pattern.startswith("!")
+            pattern = pattern[1:] if negate else pattern
+            dir_only = pattern.endswith("/")
+            anchored = "/" in pattern.rstrip("/")
+            pattern = pattern.strip("/")
+            self.rules.append((pattern, negate, dir_only, anchored))
+
+    def match_file(self, rel_path: str) -> bool:
+        parts = rel_path.split("/")
+        matched = False
+        for pattern, negate, dir_only, anchored in self.rules:
+            # Directory patterns match any parent directory; file patterns also match the file itself
+            candidates = range(1, len(parts)) if dir_only else range(1, len(parts) + 1)
+            for end in candidates:
+                target = "/".join(parts[:end]) if anchored else parts[end - 1]
+                if fnmatch.fnmatchcase(target, pattern):
+                    matched = not negate
+                    break
+        return matched
+
+def _compile(patterns: list[str]):
+    if pathspec is not None:
+        return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    return _FallbackSpec(patterns)
+
+def _read_ignore_file(path: str) -> list[str]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [line.rstrip("\n") for line in f if line.strip() and not line.startswith("#")]
+    except OSError:
+        return []
+
+class PathFilter:
+    """
+    Decides which paths under a watch root may produce analysis events.
+
+    Exclusions combine the built-in defaults, the root's ignore files, `WATCHER_EXCLUDE`
+    and the toolkit's own output locations. When include patterns are given, only
+    matching paths pass. Only files with a watched extension pass.
+
+    Args:
+        root (str): Watch root that patterns are relative to.
+        include (list[str] | None): Gitignore-style include patterns.
+        exclude (list[str] | None): Extra gitignore-style exclude patterns.
+        extensions (tuple[str, ...]): File extensions to analyze.
+        ignore_files (list[str] | None): Ignore files to read from `root`.
+        extra_excludes (list[str] | None): Absolute paths (files or directories) to exclude.
+    """
+
+    def __init__(self, root: str, include: list[str] | None = None, exclude: list[str] | None = None,
+                 extensions: tuple[str, ...] = WATCHER_EXTENSIONS, ignore_files: list[str] | None = None,
+                 extra_excludes: list[str] | None = None):
+        self.root = os.path.abspath(root)
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        patterns = list(DEFAULT_EXCLUDES)
+        for name in (WATCHER_IGNORE_FILES if ignore_files is None else ignore_files):
+            patterns.extend(_read_ignore_file(os.path.join(self.root, name)))
+        patterns.extend(WATCHER_EXCLUDE if exclude is None else exclude)
+        for path in (watcher_output_paths() if extra_excludes is None else extra_excludes):
+            rel = os.path.relpath(os.path.abspath(path), self.root)
+            if not rel.startswith(".."):
+                patterns.append("/" + rel.replace(os.sep, "/") + ("/" if os.path.isdir(path) else ""))
+        include = WATCHER_INCLUDE if include is None else include
+        self._exclude = _compile(patterns)
+        self._include = _compile(include) if include else None
+
+    def _relative(self, path: str) -> str | None:
+        rel = os.path.relpath(os.path.abspath(path), self.root)
+        if rel == "." or rel.startswith(".."):
+            return None
+        return rel.replace(os.sep, "/")
+
+    def excludes_dir(self, path: str) -> bool:
+        """Return True if nothing below the directory can pass the filter."""
+        rel = self._relative(path)
+        return rel is not None and self._exclude.match_file(rel + "/")
+
+    def matches(self, path: str) -> bool:
+        """Return True if a change to this file should be analyzed."""
+        if not path.lower().endswith(self.extensions):
+            return False
+        rel = self._relative(path)
+        if rel is None or self._exclude.match_file(rel):
+            return False
+        return self._include is None or self._include.match_file(rel)
@@ -0,0 +1,130 @@
+# result_store.py
+
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+# Files whose latest results are kept; the least recently updated are evicted first.
+RESULT_STORE_MAX_FILES = int(os.getenv("RESULT_STORE_MAX_FILES", 500))
+
+class LatestResultStore:
+    """
+    Bounded store of the latest watcher result per file, published to any number of readers.
+
+    Every `put` stamps the entry with a monotonically increasing version and replaces
+    the file's previous entry, so a burst of changes to one file never accumulates.
+    Readers keep the last version they saw and fetch everything newer with `since`,
+    or `subscribe` to get a `Subscription` that tracks its own cursor. Reading never
+    consumes entries, so every session sees every result.
+
+    Args:
+        max_files (int): Maximum number of files kept.
+    """
+
+    def __init__(self, max_files: int = RESULT_STORE_MAX_FILES):
+        self.max_files = max_files
+        self._entries: OrderedDict[str, dict] = OrderedDict()  # ordered by version
+        self._version = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._subscriptions = weakref.WeakSet()
+
+    @property
+    def version(self) -> int:
+        """Version of the most recent entry (0 if nothing was stored yet)."""
+        with self._lock:
+            return self._version
+
+    def put(self, file_path: str, results: list) -> int:
+        """Store the latest results for a file and return the new version."""
+        with self._lock:
+            self._version += 1
+            self._entries.pop(file_path, None)
+            self._entries[file_path] = {
+                "file": file_path,
+                "results": results,
+                "version": self._version,
+                "time": time.time(),
+            }
+            while len(self._entries) > self.max_files:
+                self._entries.popitem(last=False)
+            self._changed.notify_all()
+            return self._version
+
+    def discard(self, file_path: str) -> int:
+        """
+        Retract a file's results, e.g. after it was scanned as part of a batch.
+
+        The entry is replaced by one with `results` None, so readers that already
+        showed the old results learn to drop them. Returns the new version.
+        """
+        return self.put(file_path, None)
+
+    def since(self, version: int) -> list[dict]:
+        """Return the entries newer than `version`, oldest first."""
+        with self._lock:
+            return self._since(version)
+
+    def _since(self, version: int) -> list[dict]:
+        newer = []
+        for entry in reversed(self._entries.values()):
+            if entry["version"] <= version:
+                break
+            newer.append(entry)
+        newer.reverse()
+        return newer
+
+    def wait(self, version: int, timeout: float | None = None) -> list[dict]:
+        """Block until entries newer than `version` exist (or `timeout` passes) and return them."""
+        with self._changed:
+            self._changed.wait_for(lambda: self._version > version, timeout)
+            return self._since(version)
+
+    def subscribe(self, from_start: bool = True) -> "Subscription":
+        """
+        Create a reader with its own cursor.
+
+        Args:
+            from_start (bool): Replay the entries already stored, or only receive newer ones.
+        """
+        subscription = Subscription(self, 0 if from_start else self.version)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    @property
+    def subscribers(self) -> int:
+        """Number of live subscriptions."""
+        with self._lock:
+            return len(self._subscriptions)
+
+class Subscription:
+    """
+    One reader's view of a `LatestResultStore`, e.g. a browser session.
+
+    Args:
+        store (LatestResultStore): Store to read from.
+        cursor (int): Version of the last entry already seen.
+    """
+
+    def __init__(self, store: LatestResultStore, cursor: int = 0):
+        self.store = store
+        self.cursor = cursor
+
+    def poll(self) -> list[dict]:
+        """Return the entries published since the last call, without blocking."""
+        return self._advance(self.store.since(self.cursor))
+
+    def wait(self, timeout: float | None = None) -> list[dict]:
+        """Return new entries, blocking up to `timeout` seconds until there are some."""
+        return self._advance(self.store.wait(self.cursor, timeout))
+
+    def _advance(self, entries: list[dict]) -> list[dict]:
+        if entries:
+            self.cursor = entries[-1]["version"]
+        return entries
+
+# Process-wide results bus shared by the watcher threads and every Streamlit session
+file_results = LatestResultStore()
@@ -0,0 +1,37 @@
+# ruleset_version.py
+
+import hashlib
+import os
+from functools import lru_cache
+
+from devguard.tools.library_license_checker.alias_index import JAVA_ALIASES_FILES
+
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools")
+
+# Tools whose code and tables decide analysis results (rules, license maps, aliases, parsers).
+RULESET_TOOLS = ("internal_guideline_compliance_checker", "library_license_checker")
+
+@lru_cache(maxsize=1)
+def ruleset_fingerprint() -> str:
+    """
+    Return a short hash of everything that can change analysis results.
+
+    Covers the Python sources of the compliance and license checkers, including their
+    rule, license-map and alias tables, plus the contents of `JAVA_ALIASES_FILES`.
+    Results cached under a different fingerprint must not be reused.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    paths = []
+    for tool in RULESET_TOOLS:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(TOOLS_DIR, tool)):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            paths.extend(os.path.join(dirpath, name) for name in sorted(filenames) if name.endswith(".py"))
+    paths.extend(JAVA_ALIASES_FILES)
+    for path in paths:
+        digest.update(os.path.relpath(path, TOOLS_DIR).encode("utf-8"))
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
@@ -1,8 +1,9 @@
 import ast
 import xml.etree.ElementTree as ET
-from tools.internal_guideline_compliance_checker.config.python_guidelines import NODE_LEVEL_RULES, TREE_LEVEL_RULES
-from tools.internal_guideline_compliance_checker.config.java_guidelines import JAVA_NODE_LEVEL_RULES, JAVA_TREE_LEVEL_RULES
-from tools.internal_guideline_compliance_checker.config.xml_guidelines import XML_TREE_LEVEL_RULES, XML_NODE_LEVEL_RULES
+from devguard.tools.internal_guideline_compliance_checker.config.python_guidelines import NODE_LEVEL_RULES, TREE_LEVEL_RULES
+from devguard.tools.internal_guideline_compliance_checker.config.java_guidelines import JAVA_NODE_LEVEL_RULES, JAVA_TREE_LEVEL_RULES
+from devguard.tools.internal_guideline_compliance_checker.config.xml_guidelines import XML_TREE_LEVEL_RULES, XML_NODE_LEVEL_RULES
+from devguard.tools.library_license_checker.pom_parser import parse_xml_with_lines
 
 def apply_python_compliance_rules(code: str) -> list[dict]:
     try:
@@ -74,13 +75,14 @@ def apply_java_compliance_rules(code: str) -> list[dict]:
 
     return violations
 
-def apply_xml_compliance_rules(code: str) -> list[dict]:
+def apply_xml_compliance_rules(code: str, tree: ET.ElementTree | None = None) -> list[dict]:
     violations = []
 
-    try:
-        tree = ET.ElementTree(ET.fromstring(code))
-    except ET.ParseError as e:
-        return [{"id": "XML_SYNTAX", "message": f"XML ParseError: {e}", "line": 0}]
+    if tree is None:
+        try:
+            tree = parse_xml_with_lines(code)
+        except ET.ParseError as e:
+            return [{"id": "XML_SYNTAX", "message": f"XML ParseError: {e}", "line": 0}]
 
     for rule_fn in XML_TREE_LEVEL_RULES:
         results = rule_fn(tree)
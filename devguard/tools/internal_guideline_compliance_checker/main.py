@@ -9,6 +9,7 @@ from devguard.tools.internal_guideline_compliance_checker.utils import (
     gather_supported_files,
     generate_markdown_report,
 )
+from devguard.tools.library_license_checker.pom_parser import load_pom_model
 
 def check_compliance(path: str, output_format: str = "text") -> str | list[dict]:
     files = gather_supported_files(path)
@@ -25,7 +26,9 @@ def check_compliance(path: str, output_format: str = "text") -> str | list[dict]
         with open(file_path, "r", encoding="utf-8") as f:
             code = f.read()
 
-        violations, function_count = apply_compliance_rules_with_count(code, filetype)
+        # XML files share the cached single-parse model with the license checker
+        xml_tree = load_pom_model(file_path).tree if filetype == "xml" else None
+        violations, function_count = apply_compliance_rules_with_count(code, filetype, xml_tree=xml_tree)
         for v in violations:
             v["file"] = file_path
         all_violations.extend(violations)
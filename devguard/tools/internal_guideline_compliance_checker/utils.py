@@ -14,7 +14,7 @@ def print_violations(violations: list[dict], file=sys.stdout):
         line_info = f"Line {v.get('line', '?')}"
         print(f"- {v['id']} ({line_info}): {v['message']}", file=file)
         
-def apply_compliance_rules_with_count(code: str, filetype: str = "py") -> tuple[list[dict], int]:
+def apply_compliance_rules_with_count(code: str, filetype: str = "py", xml_tree=None) -> tuple[list[dict], int]:
     if filetype == "py":
         violations = apply_python_compliance_rules(code)
         function_count = code.count("def ")
@@ -22,7 +22,7 @@ def apply_compliance_rules_with_count(code: str, filetype: str = "py") -> tuple[
         violations = apply_java_compliance_rules(code)
         function_count = code.count("void ") + code.count("public ") + code.count("private ")
     elif filetype == "xml":
-        violations = apply_xml_compliance_rules(code)
+        violations = apply_xml_compliance_rules(code, tree=xml_tree)
         function_count = 1
     else:
         violations = [{"id": "UNSUPPORTED", "message": f"Unsupported file type: {filetype}", "line": 0}]
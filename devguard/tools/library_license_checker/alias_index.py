@@ -0,0 +1,116 @@
+"""
+File name: alias_index.py
+
+Description: Compiled longest-prefix index over Java import aliases for the Library License Checker tool.
+Import prefixes are stored in a trie keyed by package segment, so looking up the Maven
+coordinates of an import costs O(segments in the import) regardless of the table size.
+The built-in `JAVA_IMPORT_ALIASES` table can be extended with data files listed in
+`JAVA_ALIASES_FILES` (JSON objects or `prefix,groupId,artifactId` CSV rows).
+"""
+
+import csv
+import json
+import os
+import threading
+
+from devguard.tools.library_license_checker.config.java_aliases import JAVA_IMPORT_ALIASES
+
+# Extra alias data files, separated by os.pathsep.
+JAVA_ALIASES_FILES = [p for p in os.getenv("JAVA_ALIASES_FILES", "").split(os.pathsep) if p]
+
+class AliasTrie:
+    """
+    A package-segment trie mapping Java import prefixes to (groupId, artifactId) pairs.
+
+    Each node is a `[children, value]` pair where `children` maps the next package
+    segment to its node and `value` is the alias stored at that prefix, if any.
+    """
+
+    def __init__(self):
+        self._root = [{}, None]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, prefix: str, value: tuple[str, str]) -> None:
+        """Store `value` for an import prefix such as "org.apache.commons.io"."""
+        node = self._root
+        for segment in prefix.split("."):
+            node = node[0].setdefault(segment, [{}, None])
+        if node[1] is None:
+            self._size += 1
+        node[1] = value
+
+    def longest_prefix(self, name: str) -> tuple[str, str] | None:
+        """
+        Return the alias stored at the longest prefix of `name`, matched on whole segments.
+
+        Args:
+            name (str): A Java import such as "org.apache.commons.io.FileUtils".
+
+        Returns:
+            tuple[str, str] | None: (groupId, artifactId) or None if no prefix matches.
+        """
+        node = self._root
+        best = None
+        for segment in name.split("."):
+            node = node[0].get(segment)
+            if node is None:
+                break
+            if node[1] is not None:
+                best = node[1]
+        return best
+
+def load_alias_file(path: str):
+    """
+    Yield (prefix, (groupId, artifactId)) entries from an alias data file.
+
+    `.json` files hold a `{prefix: [groupId, artifactId]}` object; any other file is
+    read as CSV rows of `prefix,groupId,artifactId`, skipping blank and `#` lines.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            for prefix, (group, artifact) in json.load(f).items():
+                yield prefix, (group, artifact)
+            return
+        for row in csv.reader(f):
+            if not row or row[0].lstrip().startswith("#"):
+                continue
+            if len(row) < 3:
+                print(f"[WARNING] Skipping malformed alias row in {path}: {row}")
+                continue
+            yield row[0].strip(), (row[1].strip(), row[2].strip())
+
+def build_alias_index(aliases: dict[str, tuple[str, str]], data_files: list[str] = ()) -> AliasTrie:
+    """
+    Compile alias tables into a trie. Entries from data files override built-in ones.
+
+    Args:
+        aliases (dict): Import prefix → (groupId, artifactId).
+        data_files (list[str]): Extra alias data files to load on top.
+
+    Returns:
+        AliasTrie: The compiled index.
+    """
+    index = AliasTrie()
+    for prefix, value in aliases.items():
+        index.insert(prefix, value)
+    for path in data_files:
+        try:
+            for prefix, value in load_alias_file(path):
+                index.insert(prefix, value)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Failed to load Java alias file {path}: {e}")
+    return index
+
+_java_alias_index = None
+_java_alias_index_lock = threading.Lock()
+
+def get_java_alias_index() -> AliasTrie:
+    """Return the process-wide Java alias index, compiling it on first use."""
+    global _java_alias_index
+    with _java_alias_index_lock:
+        if _java_alias_index is None:
+            _java_alias_index = build_alias_index(JAVA_IMPORT_ALIASES, JAVA_ALIASES_FILES)
+        return _java_alias_index
@@ -0,0 +1,280 @@
+"""
+File name: archive_licenses.py
+
+Description: Offline license detection from locally vendored or mirrored package archives.
+Wheels, sdists and JARs found under `LICENSE_ARCHIVE_DIRS` are read with streaming
+zip/tar access, without extracting anything to disk:
+- wheels: `*.dist-info/METADATA` and bundled `LICENSE*` files
+- sdists: `PKG-INFO` and `LICENSE*` files
+- JARs: `META-INF/maven/**/pom.xml` (or `pom.properties` to confirm coordinates) and `LICENSE*` files
+
+It is used as the first tier of `fetch_license` / `fetch_java_license`, so air-gapped
+runners with a local mirror get license results without any network access.
+"""
+
+import os
+import re
+import tarfile
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from email.parser import HeaderParser
+
+from devguard.tools.library_license_checker.normalization import normalize_license_text
+from devguard.tools.library_license_checker.pom_resolver import strip_namespaces
+
+# Directories holding vendored or mirrored archives, separated by os.pathsep.
+LICENSE_ARCHIVE_DIRS = [os.path.expanduser(p) for p in os.getenv("LICENSE_ARCHIVE_DIRS", "").split(os.pathsep) if p]
+
+# Bytes read from a LICENSE file when only its title line is needed.
+LICENSE_HEAD_BYTES = 4096
+
+_WHEEL_PATTERN = re.compile(r"^(?P<name>[^-]+)-(?P<version>[^-]+)(?:-[^-]+)?-[^-]+-[^-]+-[^-]+\.whl$")
+_SDIST_PATTERN = re.compile(r"^(?P<name>.+)-(?P<version>\d[^-]*)\.(?:tar\.gz|tgz|zip)$")
+_JAR_PATTERN = re.compile(r"^(?P<artifact>.+?)-(?P<version>\d[^/]*)\.jar$")
+_LICENSE_FILE_PATTERN = re.compile(r"(^|/)(LICEN[CS]E|COPYING)[^/]*$", re.IGNORECASE)
+
+def canonicalize_name(name: str) -> str:
+    """Normalize a Python distribution name as in PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+# Exact LICENSE file titles (or opening sentences) and the license they identify.
+_LICENSE_TITLES = [
+    (re.compile(r"^(the )?mit license( \(mit\))?$"), "MIT"),
+    (re.compile(r"^permission is hereby granted, free of charge, to any person obtaining a copy"), "MIT"),
+    (re.compile(r"^apache license,? version 2\.0\b"), "Apache-2.0"),
+    (re.compile(r"^(the )?bsd 2-clause license$"), "BSD-2-Clause"),
+    (re.compile(r"^(the )?bsd 3-clause license$"), "BSD-3-Clause"),
+    (re.compile(r"^isc license$"), "ISC"),
+    (re.compile(r"^mozilla public license,? (version|v\.?) ?2\.0$"), "MPL-2.0"),
+    (re.compile(r"^eclipse public license - v(ersion)? ?2\.0$"), "EPL-2.0"),
+    (re.compile(r"^this is free and unencumbered software released into the public domain\.?$"), "Unlicense"),
+]
+
+# Titles whose version is stated on a following "Version N" line.
+_VERSIONED_TITLES = [
+    (re.compile(r"^apache license$"), "Apache"),
+    (re.compile(r"^gnu affero general public license$"), "AGPL"),
+    (re.compile(r"^gnu (lesser|library) general public license$"), "LGPL"),
+    (re.compile(r"^gnu general public license$"), "GPL"),
+]
+_VERSION_LINE = re.compile(r"^version (\d+(?:\.\d+)?)\b")
+
+def _license_from_text_head(data: bytes) -> str:
+    """
+    Identify a LICENSE file from its title (e.g. "MIT License").
+
+    Copyright lines are skipped and the first remaining line must be a known title;
+    GPL-family and Apache titles also need their "Version N" line. Anything else is
+    "Unknown" rather than a substring guess.
+    """
+    lines = [line.strip().lower() for line in data.decode("utf-8", errors="replace").splitlines()]
+    lines = [line for line in lines if line and not line.startswith(("copyright", "(c)", "©"))]
+    if not lines:
+        return "Unknown"
+    title = " ".join(lines[0].split())
+    for pattern, license_name in _LICENSE_TITLES:
+        if pattern.search(title):
+            return license_name
+    for pattern, family in _VERSIONED_TITLES:
+        if pattern.search(title):
+            for line in lines[1:4]:
+                match = _VERSION_LINE.search(line)
+                if match:
+                    version = match.group(1)
+                    if family == "Apache":
+                        return "Apache-2.0" if version in ("2", "2.0") else "Unknown"
+                    return f"{family}-{version if '.' in version else version + '.0'}"
+            return "Unknown"
+    return "Unknown"
+
+def license_from_metadata(text: str) -> str:
+    """
+    Extract a normalized license from core metadata (`METADATA` / `PKG-INFO`) headers.
+
+    Prefers `License-Expression`, then a short `License` field, then license classifiers.
+    """
+    headers = HeaderParser().parsestr(text, headersonly=True)
+    expression = headers.get("License-Expression")
+    if expression:
+        return normalize_license_text(expression)
+
+    license_field = (headers.get("License") or "").strip()
+    if license_field and license_field.upper() != "UNKNOWN" and len(license_field) < 200:
+        license_name = normalize_license_text(license_field.splitlines()[0])
+        if license_name != "Unknown":
+            return license_name
+
+    for classifier in headers.get_all("Classifier") or []:
+        if classifier.startswith("License ::"):
+            license_name = normalize_license_text(classifier.split("::")[-1].strip())
+            if license_name != "Unknown":
+                return license_name
+    return "Unknown"
+
+def _wheel_license(path: str) -> str:
+    with zipfile.ZipFile(path) as zf:
+        names = zf.namelist()
+        metadata = next((n for n in names if n.endswith(".dist-info/METADATA")), None)
+        if metadata:
+            license_name = license_from_metadata(zf.read(metadata).decode("utf-8", errors="replace"))
+            if license_name != "Unknown":
+                return license_name
+        license_file = next((n for n in names if ".dist-info/" in n and _LICENSE_FILE_PATTERN.search(n)), None)
+        if license_file:
+            with zf.open(license_file) as f:
+                return _license_from_text_head(f.read(LICENSE_HEAD_BYTES))
+    return "Unknown"
+
+def _sdist_license(path: str) -> str:
+    metadata_license = "Unknown"
+    file_license = "Unknown"
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path) as zf:
+            for name in zf.namelist():
+                if name.count("/") == 1 and name.endswith("/PKG-INFO"):
+                    metadata_license = license_from_metadata(zf.read(name).decode("utf-8", errors="replace"))
+                elif name.count("/") == 1 and _LICENSE_FILE_PATTERN.search(name) and file_license == "Unknown":
+                    with zf.open(name) as f:
+                        file_license = _license_from_text_head(f.read(LICENSE_HEAD_BYTES))
+        return metadata_license if metadata_license != "Unknown" else file_license
+
+    # Stream the tarball member by member; nothing is written to disk
+    with tarfile.open(path, "r|*") as tf:
+        for member in tf:
+            if not member.isfile() or member.name.count("/") != 1:
+                continue
+            if member.name.endswith("/PKG-INFO"):
+                metadata_license = license_from_metadata(tf.extractfile(member).read().decode("utf-8", errors="replace"))
+                if metadata_license != "Unknown":
+                    return metadata_license
+            elif _LICENSE_FILE_PATTERN.search(member.name) and file_license == "Unknown":
+                file_license = _license_from_text_head(tf.extractfile(member).read(LICENSE_HEAD_BYTES))
+    return metadata_license if metadata_license != "Unknown" else file_license
+
+def _jar_license(path: str, group: str | None, artifact: str) -> str | None:
+    """Return the JAR's license, "Unknown" if none is declared, or None if it is a different artifact."""
+    with zipfile.ZipFile(path) as zf:
+        names = zf.namelist()
+        maven_dirs = {n.rsplit("/", 1)[0] for n in names
+                      if n.startswith("META-INF/maven/") and n.endswith(("/pom.xml", "/pom.properties"))}
+        if maven_dirs:
+            wanted = f"META-INF/maven/{group}/{artifact}" if group else None
+            matching = [d for d in maven_dirs if d == wanted or (wanted is None and d.endswith(f"/{artifact}"))]
+            if not matching:
+                return None
+            pom_name = f"{matching[0]}/pom.xml"
+            if pom_name in names:
+                try:
+                    root = strip_namespaces(ET.fromstring(zf.read(pom_name)))
+                    licenses = [normalize_license_text(lic.text) for lic in root.findall("licenses/license/name") if lic.text]
+                    known = sorted({lic for lic in licenses if lic != "Unknown"})
+                    if known:
+                        return " / ".join(known)
+                except ET.ParseError:
+                    pass
+
+        license_file = next((n for n in names if n.startswith("META-INF/") and _LICENSE_FILE_PATTERN.search(n)), None)
+        if license_file:
+            with zf.open(license_file) as f:
+                return _license_from_text_head(f.read(LICENSE_HEAD_BYTES))
+    return "Unknown"
+
+class ArchiveLicenseIndex:
+    """
+    Filename index of the archives under a set of directories, built lazily on first lookup.
+
+    Args:
+        directories (list[str]): Directories to search recursively for archives.
+    """
+
+    def __init__(self, directories: list[str]):
+        self.directories = directories
+        self._python: dict[str, list[tuple[str, str]]] | None = None
+        self._java: dict[str, list[tuple[str, str]]] | None = None
+        self._licenses: dict[tuple, str | None] = {}
+        self._lock = threading.Lock()
+
+    def _build(self) -> None:
+        python, java = {}, {}
+        for directory in self.directories:
+            for dirpath, _, filenames in os.walk(directory):
+                for fname in filenames:
+                    path = os.path.join(dirpath, fname)
+                    match = _WHEEL_PATTERN.match(fname) or _SDIST_PATTERN.match(fname)
+                    if match:
+                        python.setdefault(canonicalize_name(match.group("name")), []).append((match.group("version"), path))
+                        continue
+                    match = _JAR_PATTERN.match(fname)
+                    if match and not fname.endswith(("-sources.jar", "-javadoc.jar")):
+                        java.setdefault(match.group("artifact"), []).append((match.group("version"), path))
+        self._python, self._java = python, java
+
+    def _ensure_built(self) -> None:
+        with self._lock:
+            if self._python is None:
+                self._build()
+
+    def _cached(self, key: tuple, compute) -> str | None:
+        with self._lock:
+            if key in self._licenses:
+                return self._licenses[key]
+        try:
+            license_name = compute()
+        except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+            print(f"[WARN] Could not read archive {key[-1]}: {e}")
+            license_name = None
+        with self._lock:
+            self._licenses[key] = license_name
+        return license_name
+
+    def python_license(self, package_name: str, version: str | None = None) -> str | None:
+        """
+        Return the license of a Python package found in a local wheel or sdist.
+
+        Returns:
+            str | None: Normalized license, or None if no archive of the package is available.
+        """
+        if not self.directories:
+            return None
+        self._ensure_built()
+        candidates = self._python.get(canonicalize_name(package_name), [])
+        if version:
+            candidates = [c for c in candidates if c[0] == version]
+        # Wheels first: their METADATA sits in the zip central directory
+        for _, path in sorted(candidates, key=lambda c: not c[1].endswith(".whl")):
+            reader = _wheel_license if path.endswith(".whl") else _sdist_license
+            license_name = self._cached(("python", path), lambda: reader(path))
+            if license_name and license_name != "Unknown":
+                return license_name
+        return None
+
+    def java_license(self, group: str, artifact: str, version: str | None = None) -> str | None:
+        """
+        Return the license of a Maven artifact found in a local JAR.
+
+        Returns:
+            str | None: Normalized license, or None if no JAR of the artifact is available.
+        """
+        if not self.directories:
+            return None
+        self._ensure_built()
+        candidates = self._java.get(artifact, [])
+        if version:
+            candidates = [c for c in candidates if c[0] == version]
+        for _, path in candidates:
+            license_name = self._cached(("java", group, artifact, path), lambda: _jar_license(path, group, artifact))
+            if license_name and license_name != "Unknown":
+                return license_name
+        return None
+
+_archive_index = None
+_archive_index_lock = threading.Lock()
+
+def get_archive_index() -> ArchiveLicenseIndex:
+    """Return the process-wide archive index over `LICENSE_ARCHIVE_DIRS`."""
+    global _archive_index
+    with _archive_index_lock:
+        if _archive_index is None:
+            _archive_index = ArchiveLicenseIndex(LICENSE_ARCHIVE_DIRS)
+        return _archive_index
@@ -0,0 +1,180 @@
+"""
+File name: benchmark.py
+
+Description: License-scan throughput benchmark for the Library License Checker tool.
+Generates synthetic workspaces (a requirements file plus a pom.xml) with 10/100/1000
+packages, points the checker at a local `MockRegistry`, and measures wall time,
+packages per second, request latency and cache hit ratio with a cold or warm cache
+and with sequential or concurrent lookups. Nothing touches the real registries.
+
+    python benchmark.py --sizes 10,100,1000 --latency 20 --workers 1,16 --json bench.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from devguard.tools.library_license_checker.mock_registry import MockRegistry
+
+def write_workspace(root: str, size: int) -> None:
+    """Write a requirements file and a pom.xml declaring `size` packages in total under `root`."""
+    os.makedirs(root, exist_ok=True)
+    python_count = size // 2
+    with open(os.path.join(root, "requirements.txt"), "w", encoding="utf-8") as f:
+        for i in range(python_count):
+            f.write(f"bench-pkg-{i}=={1 + i % 3}.{i % 10}.0\n")
+
+    deps = []
+    for i in range(size - python_count):
+        # Every fourth dependency leaves its version to latest-version resolution
+        version = "" if i % 4 == 0 else f"<version>1.{i % 7}.{i % 5}</version>"
+        deps.append(f"<dependency><groupId>org.bench.g{i % 10}</groupId>"
+                    f"<artifactId>bench-artifact-{i}</artifactId>{version}</dependency>")
+    with open(os.path.join(root, "pom.xml"), "w", encoding="utf-8") as f:
+        f.write('<project xmlns="http://maven.apache.org/POM/4.0.0"><groupId>org.bench</groupId>'
+                f"<artifactId>bench</artifactId><version>1.0</version><dependencies>{''.join(deps)}</dependencies></project>")
+
+def bench_cache_dir(work_dir: str) -> str:
+    """Return the license cache directory the benchmark uses inside `work_dir`."""
+    return os.path.join(work_dir, "cache")
+
+def _reset_caches(cache_dir: str, work_dir: str) -> None:
+    """
+    Drop every on-disk and in-memory license checker cache, for cold-cache runs.
+
+    Args:
+        cache_dir (str): The benchmark's cache directory, deleted from disk.
+        work_dir (str): Benchmark work directory; `cache_dir` must lie inside it.
+
+    Raises:
+        ValueError: If `cache_dir` is not inside `work_dir`, or the checker was imported
+            with a different `DEVGUARD_CACHE_DIR` (its real cache would stay warm).
+    """
+    from devguard.tools.library_license_checker import license_api, maven_versions
+    from devguard.tools.library_license_checker.cache import CACHE_DIR
+    from devguard.tools.library_license_checker.pom_resolver import get_pom_resolver
+
+    cache_dir, work_dir = os.path.realpath(cache_dir), os.path.realpath(work_dir)
+    if cache_dir == work_dir or os.path.commonpath([cache_dir, work_dir]) != work_dir:
+        raise ValueError(f"Refusing to delete {cache_dir}: not inside the benchmark work dir {work_dir}")
+    if os.path.realpath(CACHE_DIR) != cache_dir:
+        raise ValueError(f"The license checker caches under {CACHE_DIR}, not {cache_dir}; "
+                         "set DEVGUARD_CACHE_DIR before importing it")
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    with license_api._license_memory_lock:
+        license_api._license_memory.clear()
+    with maven_versions._memory_lock:
+        maven_versions._memory.clear()
+    resolver = get_pom_resolver()
+    with resolver._lock:
+        resolver._memory.clear()
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))], 1)
+
+def run_case(work_dir: str, workspace: str, size: int, warm: bool, workers: int) -> dict:
+    """
+    Scan one workspace and return its measurements.
+
+    Args:
+        work_dir (str): Benchmark work directory holding the cache (see `bench_cache_dir`).
+        workspace (str): Directory produced by `write_workspace`.
+        size (int): Number of packages in the workspace.
+        warm (bool): Populate the caches with an untimed scan first.
+        workers (int): Thread pool size for the scan.
+
+    Returns:
+        dict: Wall time, throughput, request count, latency percentiles and cache hit ratio.
+    """
+    from devguard.tools.library_license_checker.directory_scan import scan_directory_licenses
+    from devguard.tools.library_license_checker.tracing import trace_scan
+
+    _reset_caches(bench_cache_dir(work_dir), work_dir)
+    if warm:
+        scan_directory_licenses(workspace, max_workers=workers)
+
+    with trace_scan() as trace:
+        started = time.perf_counter()
+        results, _ = scan_directory_licenses(workspace, max_workers=workers)
+        elapsed = time.perf_counter() - started
+
+    summary = trace.summary()
+    latencies = [t.latency_ms for t in trace.requests]
+    return {
+        "packages": size,
+        "cache": "warm" if warm else "cold",
+        "workers": workers,
+        "resolved": len(results),
+        "unknown": sum(1 for r in results if r["license"] == "Unknown"),
+        "wall_s": round(elapsed, 3),
+        "packages_per_s": round(size / elapsed, 1) if elapsed else None,
+        "requests": summary["requests"],
+        "retries": sum(t.retries for t in trace.requests),
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "cache_hit_ratio": summary["cache"]["hit_ratio"],
+    }
+
+def print_table(rows: list[dict]) -> None:
+    print(f"{'packages':>8} {'cache':>5} {'workers':>7} {'wall_s':>8} {'pkg/s':>8} "
+          f"{'requests':>8} {'retries':>7} {'p50_ms':>7} {'p95_ms':>7} {'hit':>5}")
+    print("-" * 84)
+    for row in rows:
+        print(f"{row['packages']:>8} {row['cache']:>5} {row['workers']:>7} {row['wall_s']:>8} "
+              f"{row['packages_per_s']!s:>8} {row['requests']:>8} {row['retries']:>7} "
+              f"{row['p50_ms']!s:>7} {row['p95_ms']!s:>7} {row['cache_hit_ratio']!s:>5}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark license-scan throughput against a local mock registry")
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated package counts")
+    parser.add_argument("--workers", default="1,16", help="Comma-separated thread pool sizes")
+    parser.add_argument("--cache", default="cold,warm", help="Comma-separated cache states (cold, warm)")
+    parser.add_argument("--latency", type=float, default=20.0, help="Mean mock registry latency (ms)")
+    parser.add_argument("--jitter", type=float, default=5.0, help="Mock registry latency jitter (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 500 responses")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of HTTP 429 responses")
+    parser.add_argument("--json", default=None, help="Also write the measurements to this JSON file")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="license-bench-")
+    registry = MockRegistry(latency=args.latency / 1000, jitter=args.jitter / 1000,
+                            error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate).start()
+    # Must be set before the license checker modules are imported, as they read it at import time
+    os.environ.update(registry.env())
+    os.environ.update({
+        "DEVGUARD_CACHE_DIR": bench_cache_dir(work_dir),
+        "MAVEN_LOCAL_REPO": os.path.join(work_dir, "m2"),
+        "MAVEN_MIRROR_DIRS": "",
+        "LICENSE_ARCHIVE_DIRS": "",
+    })
+    print(f"[INFO] Mock registry at {registry.url}, workspaces under {work_dir}")
+
+    rows = []
+    try:
+        for size in (int(s) for s in args.sizes.split(",")):
+            workspace = os.path.join(work_dir, f"workspace-{size}")
+            write_workspace(workspace, size)
+            for cache_state in args.cache.split(","):
+                for workers in (int(w) for w in args.workers.split(",")):
+                    row = run_case(work_dir, workspace, size, cache_state.strip() == "warm", workers)
+                    rows.append(row)
+                    print(f"[INFO] {size} packages, {row['cache']} cache, {workers} workers: "
+                          f"{row['wall_s']}s ({row['packages_per_s']} pkg/s)")
+    finally:
+        registry.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print()
+    print_table(rows)
+    print(f"\n[INFO] Mock registry requests by endpoint: {dict(registry.requests)}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+        print(f"[INFO] Measurements written to: {args.json}")
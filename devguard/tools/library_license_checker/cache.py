@@ -0,0 +1,70 @@
+"""
+File name: cache.py
+
+Description: Small persistent JSON cache used by the Library License Checker tool.
+Entries are stored one file per key under a namespaced directory so lookups made by
+earlier runs (effective POMs, registry metadata, resolved licenses) survive restarts.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from devguard.tools.library_license_checker.tracing import record_cache
+
+CACHE_DIR = os.path.expanduser(os.getenv("DEVGUARD_CACHE_DIR", "~/.cache/devguard"))
+
+class DiskCache:
+    """
+    A thread-safe, namespaced key → JSON value cache backed by the filesystem.
+
+    Args:
+        namespace (str): Sub-directory of `CACHE_DIR` holding this cache's entries.
+        ttl (float | None): Seconds an entry stays fresh, or None to never expire.
+    """
+
+    def __init__(self, namespace: str, ttl: float | None = None):
+        self.namespace = namespace
+        self.directory = os.path.join(CACHE_DIR, namespace)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + ".json")
+
+    def get(self, key: str, default=None, allow_stale: bool = False):
+        """
+        Return the cached value for `key`, or `default` if missing or expired.
+
+        Args:
+            key (str): Cache key.
+            default: Value returned on a miss.
+            allow_stale (bool): Return expired entries instead of treating them as misses.
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            record_cache(self.namespace, False)
+            return default
+        if not allow_stale and self.ttl is not None and time.time() - entry.get("stored_at", 0) > self.ttl:
+            record_cache(self.namespace, False)
+            return default
+        record_cache(self.namespace, True)
+        return entry.get("value", default)
+
+    def set(self, key: str, value) -> None:
+        """Store a JSON-serializable value for `key`, replacing any earlier entry atomically."""
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "stored_at": time.time(), "value": value}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Could not write cache entry {key}: {e}")
@@ -0,0 +1,224 @@
+"""
+File name: directory_scan.py
+
+Description: Repository-wide license scanning for the Library License Checker tool.
+Extracts imports and POM dependencies from every supported file under a directory
+in parallel, merges them into one deduplicated package set, and resolves the
+license of each unique package exactly once.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from devguard.tools.library_license_checker.helpers import (extract_python_imports,
+                                                            extract_python_imports_from_source,
+                                                            extract_java_imports,
+                                                            find_java_alias_for_import,
+                                                            parse_pom_xml)
+from devguard.tools.library_license_checker.license_api import fetch_license, fetch_java_license_info
+from devguard.tools.library_license_checker.license_utils import rate_license
+from devguard.tools.library_license_checker.maven_versions import resolve_latest_versions
+from devguard.tools.library_license_checker.pom_parser import is_parent_pom, parse_pom_content
+from devguard.tools.library_license_checker.tracing import in_trace_context
+from devguard.tools.library_license_checker.lockfiles import (is_lockfile,
+                                                              iter_lockfile_packages,
+                                                              iter_lockfile_content)
+
+DEFAULT_MAX_WORKERS = 8
+
+# Directories that never contain first-party dependency declarations.
+SKIPPED_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules", "target", "build", "dist"}
+
+def is_license_source_file(file_path: str) -> bool:
+    """Return True if the license checker knows how to extract packages from the file."""
+    name = os.path.basename(file_path).lower()
+    ext = os.path.splitext(name)[-1]
+    return ext in (".py", ".java") or (ext == ".xml" and "pom" in name) or is_lockfile(file_path)
+
+def gather_license_files(root: str) -> list[str]:
+    """
+    Collect every file under `root` that the license checker can analyze.
+
+    Args:
+        root (str): Directory to walk.
+
+    Returns:
+        list[str]: Sorted list of file paths.
+    """
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+        for fname in filenames:
+            path = os.path.join(dirpath, fname)
+            if is_license_source_file(path):
+                files.append(path)
+    return sorted(files)
+
+def extract_file_packages(file_path: str) -> list[tuple[str, str, str | None]]:
+    """
+    Extract the package keys declared or imported by a single file.
+
+    A package key is an `(ecosystem, name, version)` tuple:
+    - `("pypi", name, None)` for Python imports
+    - `("pypi", name, version)` for packages pinned in requirements files and lockfiles
+    - `("maven", "group:artifact", version)` for POM dependencies and mapped Java imports
+    - `("java-import", import_prefix, "?")` for Java imports without a known Maven alias
+
+    Args:
+        file_path (str): Path to a .py, .java, pom.xml, requirements or lock file.
+
+    Returns:
+        list[tuple]: Package keys found in the file.
+    """
+    ext = os.path.splitext(file_path)[-1].lower()
+    try:
+        if is_lockfile(file_path):
+            return [("pypi", name, version) for name, version in iter_lockfile_packages(file_path)]
+        if ext == ".py":
+            return [("pypi", pkg, None) for pkg in extract_python_imports(file_path)]
+        if ext == ".java":
+            return _java_import_keys(extract_java_imports(file_path))
+        if ext == ".xml":
+            if is_parent_pom(file_path):
+                return []
+            return [("maven", f"{group}:{artifact}", version or "latest")
+                    for group, artifact, version in parse_pom_xml(file_path)]
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        print(f"[WARN] Could not read {file_path}: {e}")
+    return []
+
+def _java_import_keys(imports: list[str]) -> list[tuple[str, str, str | None]]:
+    keys = []
+    for imp in imports:
+        group, artifact = find_java_alias_for_import(imp)
+        if group and artifact:
+            keys.append(("maven", f"{group}:{artifact}", "latest"))
+        else:
+            keys.append(("java-import", imp, "?"))
+    return keys
+
+def extract_content_packages(file_name: str, content: bytes) -> list[tuple[str, str, str | None]]:
+    """
+    Extract package keys from file contents already in memory (e.g. a git blob).
+
+    Same keys as `extract_file_packages`; `file_name` only selects the format.
+
+    Args:
+        file_name (str): File name or path the contents belong to.
+        content (bytes): Raw file contents.
+
+    Returns:
+        list[tuple]: Package keys found in the contents.
+    """
+    ext = os.path.splitext(file_name)[-1].lower()
+    try:
+        if is_lockfile(file_name):
+            return [("pypi", name, version) for name, version in iter_lockfile_content(file_name, content.decode("utf-8"))]
+        if ext == ".py":
+            return [("pypi", pkg, None) for pkg in extract_python_imports_from_source(content.decode("utf-8"))]
+        if ext == ".java":
+            return _java_import_keys(extract_java_imports(content.decode("utf-8")))
+        if ext == ".xml":
+            model = parse_pom_content(content)
+            if model.error or model.is_parent:
+                return []
+            return [("maven", f"{dep.group}:{dep.artifact}", dep.version or "latest")
+                    for dep in model.dependencies if dep.group and dep.artifact]
+    except (UnicodeDecodeError, ValueError) as e:
+        print(f"[WARN] Could not read {file_name}: {e}")
+    return []
+
+def resolve_package(key: tuple[str, str, str | None]) -> dict:
+    """
+    Resolve the license of one package key.
+
+    Args:
+        key (tuple): An `(ecosystem, name, version)` package key.
+
+    Returns:
+        dict: License info with 'name', 'version', 'license', 'rating' and 'source'.
+    """
+    ecosystem, name, version = key
+    if ecosystem == "pypi":
+        result = fetch_license(name, version=version)
+        if version:
+            result["version"] = version
+        return result
+    if ecosystem == "maven":
+        group, artifact = name.split(":", 1)
+        info = fetch_java_license_info(group, artifact, version)
+    else:
+        info = {"license": "Unknown", "source": "none"}
+    return {
+        "name": name,
+        "version": version,
+        "license": info["license"],
+        "rating": rate_license(info["license"]),
+        "source": info["source"],
+    }
+
+def package_label(key: tuple[str, str, str | None]) -> str:
+    """Return the human-readable index label for a package key."""
+    ecosystem, name, version = key
+    if version not in (None, "latest", "?"):
+        return f"{name}@{version}"
+    return name
+
+def scan_directory_licenses(root: str, max_workers: int = DEFAULT_MAX_WORKERS) -> tuple[list[dict], dict[str, list[str]]]:
+    """
+    Scan every supported file under a directory and resolve each unique package once.
+
+    Package extraction and license resolution both run on a thread pool, so a
+    full-repository audit costs one lookup per unique package rather than one
+    per import site.
+
+    Args:
+        root (str): Directory to scan.
+        max_workers (int): Number of worker threads for extraction and lookups.
+
+    Returns:
+        tuple:
+            - list[dict]: One license result per unique package, each with a 'files' list.
+            - dict[str, list[str]]: Package label → files that import or declare it.
+    """
+    files = gather_license_files(root)
+    print(f"[INFO] Scanning {len(files)} files under: {root}")
+    return scan_files_licenses(files, max_workers=max_workers)
+
+def scan_files_licenses(files: list[str], max_workers: int = DEFAULT_MAX_WORKERS) -> tuple[list[dict], dict[str, list[str]]]:
+    """
+    Scan an explicit list of files and resolve each unique package once.
+
+    Unsupported files in the list are ignored. Same output as `scan_directory_licenses`.
+
+    Args:
+        files (list[str]): Paths of the files to scan.
+        max_workers (int): Number of worker threads for extraction and lookups.
+
+    Returns:
+        tuple:
+            - list[dict]: One license result per unique package, each with a 'files' list.
+            - dict[str, list[str]]: Package label → files that import or declare it.
+    """
+    files = [path for path in files if is_license_source_file(path)]
+    package_files: dict[tuple, list[str]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for file_path, keys in zip(files, pool.map(extract_file_packages, files)):
+            for key in keys:
+                package_files.setdefault(key, []).append(file_path)
+
+        unique_keys = sorted(package_files, key=lambda k: (k[0], k[1], str(k[2])))
+        print(f"[INFO] Resolving {len(unique_keys)} unique packages")
+        # Warm the latest-version cache with batched queries before per-package lookups
+        resolve_latest_versions([tuple(name.split(":", 1)) for ecosystem, name, version in unique_keys
+                                 if ecosystem == "maven" and version == "latest"])
+        resolved = list(pool.map(in_trace_context(resolve_package), unique_keys))
+
+    report = []
+    index = {}
+    for key, result in zip(unique_keys, resolved):
+        label = package_label(key)
+        result["files"] = package_files[key]
+        index[label] = package_files[key]
+        report.append(result)
+    return report, index
@@ -0,0 +1,114 @@
+"""
+File name: exporters.py
+
+Description: Streaming report exporters for the Library License Checker tool.
+Rows are written incrementally as they are produced, so exports of tens of thousands
+of results run in constant memory. The format is chosen from the output file extension:
+`.xlsx` (xlsxwriter in constant-memory mode), `.csv`, or `.parquet` (pyarrow).
+"""
+
+import csv
+import itertools
+import os
+from typing import IO, Iterable
+
+# Columns written first, in this order; any other keys found on the first row follow.
+REPORT_COLUMNS = ("name", "version", "license", "rating", "source", "error")
+
+# Rows buffered per Parquet row group.
+PARQUET_BATCH_SIZE = 5000
+
+EXPORT_FORMATS = (".xlsx", ".csv", ".parquet")
+
+def _cell(value) -> str | None:
+    """Flatten a result value into a single cell."""
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, set)):
+        return "; ".join(str(v) for v in value)
+    return str(value)
+
+def _peek_columns(rows: Iterable[dict], columns: list[str] | None):
+    """Return (columns, rows) without consuming the first row of the iterator."""
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return list(columns or REPORT_COLUMNS), iter(())
+    if columns is None:
+        columns = list(REPORT_COLUMNS) + [key for key in first if key not in REPORT_COLUMNS]
+    return list(columns), itertools.chain([first], rows)
+
+def export_xlsx(rows: Iterable[dict], output: str | IO[bytes], columns: list[str] | None = None,
+                sheet_name: str = "Licenses") -> int:
+    """Write rows to an Excel workbook one row at a time. Returns the number of rows written."""
+    try:
+        import xlsxwriter
+    except ImportError as e:
+        raise ImportError("Excel export requires xlsxwriter: pip install xlsxwriter") from e
+
+    columns, rows = _peek_columns(rows, columns)
+    in_memory = not isinstance(output, (str, os.PathLike))
+    workbook = xlsxwriter.Workbook(output, {"in_memory": True} if in_memory else {"constant_memory": True})
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, columns)
+    count = 0
+    for count, row in enumerate(rows, start=1):
+        worksheet.write_row(count, 0, [_cell(row.get(col)) for col in columns])
+    workbook.close()
+    return count
+
+def export_csv(rows: Iterable[dict], output: str | IO[str], columns: list[str] | None = None) -> int:
+    """Write rows to a CSV file one row at a time. Returns the number of rows written."""
+    columns, rows = _peek_columns(rows, columns)
+    f = open(output, "w", encoding="utf-8", newline="") if isinstance(output, (str, os.PathLike)) else output
+    try:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        count = 0
+        for count, row in enumerate(rows, start=1):
+            writer.writerow([_cell(row.get(col)) for col in columns])
+    finally:
+        if f is not output:
+            f.close()
+    return count
+
+def export_parquet(rows: Iterable[dict], output: str | IO[bytes], columns: list[str] | None = None) -> int:
+    """Write rows to a Parquet file in fixed-size row groups. Returns the number of rows written."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from e
+
+    columns, rows = _peek_columns(rows, columns)
+    schema = pa.schema([(col, pa.string()) for col in columns])
+    count = 0
+    with pq.ParquetWriter(output, schema) as writer:
+        while True:
+            batch = list(itertools.islice(rows, PARQUET_BATCH_SIZE))
+            if not batch:
+                break
+            writer.write_table(pa.table({col: [_cell(row.get(col)) for row in batch] for col in columns}, schema=schema))
+            count += len(batch)
+    return count
+
+def export_results(rows: Iterable[dict], output_path: str, columns: list[str] | None = None) -> int:
+    """
+    Stream license results to a report file whose format matches its extension.
+
+    Args:
+        rows (Iterable[dict]): License results; may be a generator.
+        output_path (str): Destination ending in .xlsx, .csv or .parquet.
+        columns (list[str] | None): Columns to write; defaults to the standard report columns.
+
+    Returns:
+        int: Number of rows written.
+    """
+    ext = os.path.splitext(output_path)[-1].lower()
+    if ext == ".xlsx":
+        return export_xlsx(rows, output_path, columns)
+    if ext == ".csv":
+        return export_csv(rows, output_path, columns)
+    if ext == ".parquet":
+        return export_parquet(rows, output_path, columns)
+    raise ValueError(f"Unsupported export format '{ext}'. Use one of: {', '.join(EXPORT_FORMATS)}")
@@ -6,15 +6,20 @@ It is used by the Library License Checker tool to standardize license naming con
 across different sources before evaluating their trustworthiness.
 """
 
-import ast
+import io
 import os
-from devguard.tools.library_license_checker.config.java_aliases import JAVA_IMPORT_ALIASES
-import xml.etree.ElementTree as ET
-import requests
-
-from devguard.tools.library_license_checker.license_api import fetch_license, fetch_java_license
+from devguard.tools.library_license_checker.alias_index import get_java_alias_index
+from devguard.tools.library_license_checker.license_api import fetch_license, fetch_java_license_info
+from devguard.tools.library_license_checker.maven_versions import (resolve_latest_versions,
+                                                                   get_metadata_latest_version)
 
 from devguard.tools.library_license_checker.license_utils import rate_license
+from devguard.tools.library_license_checker.pom_parser import load_pom_model
+from devguard.tools.library_license_checker.lockfiles import iter_requirements_file
+from devguard.tools.library_license_checker.import_scanner import (AmbiguousImportError,
+                                                                   scan_java_imports,
+                                                                   scan_python_imports,
+                                                                   scan_python_source_imports)
 
 from typing import Union
 from pathlib import Path
@@ -23,8 +28,10 @@ def extract_python_imports(file_path):
     """
     Extract the top-level imported package names from a Python (.py) file.
 
-    This function parses the Python source code to identify all `import` and
-    `from ... import ...` statements, and collects the top-level module names
+    The file is streamed through a lightweight line lexer to find `import` and
+    `from ... import ...` statements without building an AST, and the top-level
+    module names are collected. A full AST parse is only used as a fallback when
+    the source is ambiguous.
 
     Args:
         file_path (str): The path to the Python file from which to extract imports.
@@ -33,25 +40,31 @@ def extract_python_imports(file_path):
         List[str]: A sorted list of unique top-level imported package names.
                    Returns an empty list if parsing fails due to syntax errors.
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        code_str = f.read()
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return sorted(scan_python_imports(f))
+    except AmbiguousImportError:
+        pass
+
+    return extract_python_imports_from_source(read_code_file(file_path))
+
+def extract_python_imports_from_source(code_str: str) -> list[str]:
+    """
+    Extract the top-level imported package names from Python source text.
+
+    Args:
+        code_str (str): Python source code.
 
+    Returns:
+        List[str]: A sorted list of unique top-level imported package names.
+                   Returns an empty list if parsing fails due to syntax errors.
+    """
     try:
-        tree = ast.parse(code_str)
+        return sorted(scan_python_source_imports(code_str))
     except SyntaxError as e:
         print("Syntax error while parsing:", e)
         return []
 
-    imports = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.add(alias.name.split('.')[0])
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.add(node.module.split('.')[0])
-    return sorted(list(imports))
-
 def read_code_file(file_path: str) -> str:
     """
     Read the contents of a Python (.py) source code file.
@@ -100,19 +113,14 @@ def parse_requirements_text(file_path: str):
     Returns:
         list[str]: A list of package names as strings, with version specifiers removed.
     """
-    packages = []
-    with open(file_path, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                pkg = line.split("==")[0].split(">=")[0].split("<=")[0]
-                packages.append(pkg)
-    return packages
+    return [name for name, _ in iter_requirements_file(file_path)]
 
 def parse_pom_xml(path: str) -> list[tuple[str, str, str]]:
     """
     Parses a Maven `pom.xml` file to extract dependencies.
 
+    Reads from the shared, cached `PomModel`, so the file is parsed once per version.
+
     Args:
         path (str): Path to the pom.xml file.
 
@@ -120,82 +128,86 @@ def parse_pom_xml(path: str) -> list[tuple[str, str, str]]:
         List[Tuple[str, str, str]]: A list of (groupId, artifactId, version) tuples.
     """
     deps = []
-    try:
-        tree = ET.parse(path)
-        root = tree.getroot()
-        ns = {'m': 'http://maven.apache.org/POM/4.0.0'}
-
-        for dep in root.findall(".//m:dependency", ns):
-            group_el = dep.find("m:groupId", ns)
-            artifact_el = dep.find("m:artifactId", ns)
-            version_el = dep.find("m:version", ns)
-
-            group = group_el.text.strip() if group_el is not None and group_el.text else None
-            artifact = artifact_el.text.strip() if artifact_el is not None and artifact_el.text else None
-            version = version_el.text.strip() if version_el is not None and version_el.text else None
-
-            if group and artifact:
-                deps.append((group, artifact, version))
-            else:
-                print(f"[WARNING] Skipping incomplete dependency in pom.xml: group={group}, artifact={artifact}")
-    except Exception as e:
-        print(f"[ERROR] Failed to parse pom.xml: {e}")
+    model = load_pom_model(path)
+    if model.error:
+        print(f"[ERROR] Failed to parse pom.xml: {model.error}")
+        return deps
+
+    for dep in model.dependencies:
+        if dep.group and dep.artifact:
+            deps.append((dep.group, dep.artifact, dep.version))
+        else:
+            print(f"[WARNING] Skipping incomplete dependency in pom.xml (line {dep.line}): group={dep.group}, artifact={dep.artifact}")
     return deps
 
 def extract_java_imports(input_data: Union[str, Path]) -> list[str]:
-    if isinstance(input_data, (str, Path)) and os.path.exists(str(input_data)):
-        # Treat as file path
-        with open(input_data, "r", encoding="utf-8") as f:
-            content = f.read()
-    else:
-        # Treat as raw string content
-        content = input_data
+    """
+    Extract imported package prefixes (up to three segments) from Java source.
+
+    Files are streamed line by line and scanning stops at the first type
+    declaration, since imports can only appear before it.
+
+    Args:
+        input_data (str | Path): Path to a .java file, or raw Java source text.
 
+    Returns:
+        list[str]: Sorted unique import prefixes.
+    """
     imports = set()
     try:
-        for line in content.splitlines():
-            line = line.strip()
-            if line.startswith("import ") and line.endswith(";"):
-                pkg = line[len("import "):].rstrip(";").strip()
-                parts = pkg.split(".")
-                if len(parts) >= 2:
-                    imports.add(".".join(parts[:3]))
+        if isinstance(input_data, (str, Path)) and os.path.exists(str(input_data)):
+            # Treat as file path
+            with open(input_data, "r", encoding="utf-8") as f:
+                targets = scan_java_imports(f)
+        else:
+            # Treat as raw string content
+            targets = scan_java_imports(io.StringIO(input_data))
+
+        for pkg in targets:
+            parts = pkg.split(".")
+            if len(parts) >= 2:
+                imports.add(".".join(parts[:3]))
     except Exception as e:
         print(f"[ERROR] Failed to parse Java imports: {e}")
     return sorted(list(imports))
 
 def find_java_alias_for_import(java_import: str):
-    # Find the longest matching prefix key in JAVA_IMPORT_ALIASES
-    candidates = [key for key in JAVA_IMPORT_ALIASES if java_import.startswith(key)]
-    if not candidates:
+    # Longest package-segment prefix match in the compiled alias index
+    alias = get_java_alias_index().longest_prefix(java_import)
+    if alias is None:
         return None, None
-    # Return the alias for the longest prefix match
-    best_match = max(candidates, key=len)
-    return JAVA_IMPORT_ALIASES[best_match]
+    return alias
 
 def check_java_import_file(file_path: str):
     raw_imports = extract_java_imports(file_path)
+    aliases = {imp: find_java_alias_for_import(imp) for imp in raw_imports}
+    # Resolve every mapped artifact's latest version in one batched lookup
+    latest_versions = resolve_latest_versions([alias for alias in aliases.values() if alias[0] and alias[1]])
     results = []
 
     for imp in raw_imports:
-        group, artifact = find_java_alias_for_import(imp)
+        group, artifact = aliases[imp]
         if not group or not artifact:
             results.append({
                 "name": imp,
                 "version": "?",
                 "license": "Unknown",
-                "rating": rate_license("Unknown")
+                "rating": rate_license("Unknown"),
+                "source": "none"
             })
             continue
 
-        license_name = fetch_java_license(group, artifact, "latest")  # assume latest for now
-        rating = rate_license(license_name)
+        version = latest_versions.get((group, artifact))
+        # Without a resolved version, "latest" still lets the offline archive tier answer
+        info = fetch_java_license_info(group, artifact, version or "latest")
+        rating = rate_license(info["license"])
 
         results.append({
             "name": f"{group}:{artifact}",
-            "version": "latest",
-            "license": license_name,
-            "rating": rating
+            "version": version or "latest",
+            "license": info["license"],
+            "rating": rating,
+            "source": info["source"]
         })
     return results
 
@@ -214,13 +226,14 @@ def check_java_licenses(file_path: str):
     deps = parse_pom_xml(file_path)
     results = []
     for group, artifact, version in deps:
-        license_name = fetch_java_license(group, artifact, version)
-        rating = rate_license(license_name)
+        info = fetch_java_license_info(group, artifact, version)
+        rating = rate_license(info["license"])
         results.append({
             "name": f"{group}:{artifact}",
             "version": version,
-            "license": license_name,
-            "rating": rating
+            "license": info["license"],
+            "rating": rating,
+            "source": info["source"]
         })
     return results
 
@@ -256,6 +269,8 @@ def get_latest_version(group: str, artifact: str) -> str | None:
     """
     Fetches the latest version of a Maven artifact from Maven Central.
 
+    Uses the cached `maven-metadata.xml`, revalidated with a conditional GET when stale.
+
     Args:
         group (str): Group ID of the artifact.
         artifact (str): Artifact ID.
@@ -263,18 +278,4 @@ def get_latest_version(group: str, artifact: str) -> str | None:
     Returns:
         str or None: Latest version string if found.
     """
-    try:
-        group_path = group.replace(".", "/")
-        url = f"https://repo1.maven.org/maven2/{group_path}/{artifact}/maven-metadata.xml"
-        response = requests.get(url, timeout=5)
-        if response.status_code != 200:
-            print(f"[WARN] Failed to fetch maven-metadata.xml for {group}:{artifact}")
-            return None
-
-        tree = ET.fromstring(response.text)
-        latest = tree.find("versioning/latest")
-        if latest is not None and latest.text:
-            return latest.text.strip()
-    except Exception as e:
-        print(f"[ERROR] Failed to get latest version for {group}:{artifact}: {e}")
-    return None
\ No newline at end of file
+    return get_metadata_latest_version(group, artifact)
\ No newline at end of file
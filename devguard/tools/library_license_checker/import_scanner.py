@@ -0,0 +1,179 @@
+"""
+File name: import_scanner.py
+
+Description: Streaming import scanners for the Library License Checker tool.
+Java sources are read line by line and scanning stops at the first type declaration,
+since imports cannot appear after it. Python sources are scanned with a lightweight line
+lexer for `import` / `from ... import` statements without building an AST; the AST is
+only used as a fallback when the source is ambiguous.
+"""
+
+import ast
+import io
+import re
+from typing import Iterable
+
+_JAVA_TYPE_DECLARATION = re.compile(
+    r"^(?:(?:public|protected|private|abstract|final|static|sealed|non-sealed|strictfp)\s+)*"
+    r"(?:class|interface|enum|record|@interface)\b"
+)
+
+_STATEMENT_START = re.compile(r"(?:import|from)\b")
+_FROM_IMPORT = re.compile(r"from\s+\.*\s*([A-Za-z_][\w.]*)?\s*import\b")
+_DOTTED_NAME = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+_INLINE_IMPORT = re.compile(r"[;:]\s*(?:import|from)\s")
+_TRIPLE_QUOTE = re.compile(r"\"\"\"|'''")
+
+class AmbiguousImportError(Exception):
+    """Raised when the source cannot be interpreted without a full parse."""
+
+def scan_java_imports(lines: Iterable[str]) -> list[str]:
+    """
+    Collect Java import targets, stopping at the first class/interface/enum/record declaration.
+
+    Args:
+        lines (Iterable[str]): Source lines; a file object is consumed lazily.
+
+    Returns:
+        list[str]: Imported names in source order, with `static` imports unwrapped.
+    """
+    imports = []
+    in_block_comment = False
+    for raw in lines:
+        line = raw.strip()
+        if in_block_comment:
+            if "*/" not in line:
+                continue
+            line = line.split("*/", 1)[1].strip()
+            in_block_comment = False
+        if line.startswith("/*"):
+            if "*/" not in line:
+                in_block_comment = True
+                continue
+            line = line.split("*/", 1)[1].strip()
+        if not line or line.startswith("//"):
+            continue
+        if line.startswith("import ") and line.endswith(";"):
+            target = line[len("import "):].rstrip(";").strip()
+            if target.startswith("static "):
+                target = target[len("static "):].strip()
+            imports.append(target)
+        elif _JAVA_TYPE_DECLARATION.match(line):
+            break
+    return imports
+
+def _strip_comment(line: str) -> str:
+    return line.split("#", 1)[0].strip()
+
+def _update_triple_quote_state(line: str, in_triple: str | None) -> str | None:
+    """
+    Track whether a line leaves us inside a triple-quoted string.
+
+    Raises:
+        AmbiguousImportError: If other quotes or comments make the string boundaries unclear.
+    """
+    pos = 0
+    while True:
+        if in_triple:
+            idx = line.find(in_triple, pos)
+            if idx < 0:
+                return in_triple
+            in_triple, pos = None, idx + 3
+            continue
+        match = _TRIPLE_QUOTE.search(line, pos)
+        segment = line[pos:match.start()] if match else line[pos:]
+        if "#" in segment:
+            segment = segment.split("#", 1)[0]
+            if match:
+                # A triple quote after a comment marker: unclear without a real lexer
+                raise AmbiguousImportError("Comment and triple-quoted string on one line")
+        if match and ("'" in segment or '"' in segment):
+            raise AmbiguousImportError("Mixed quotes around a triple-quoted string")
+        if not match:
+            return None
+        in_triple, pos = match.group(0), match.end()
+
+def _parse_import_line(statement: str) -> set[str]:
+    """Return top-level modules of a single-line `import` or `from ... import` statement."""
+    if statement.startswith("from"):
+        match = _FROM_IMPORT.match(statement)
+        if not match:
+            raise AmbiguousImportError(f"Unrecognized from-import: {statement!r}")
+        module = match.group(1)
+        return {module.split(".")[0]} if module else set()
+
+    modules = set()
+    for part in statement[len("import"):].split(","):
+        name = part.strip().split(" as ", 1)[0].strip()
+        if not _DOTTED_NAME.fullmatch(name):
+            raise AmbiguousImportError(f"Unrecognized import: {statement!r}")
+        modules.add(name.split(".")[0])
+    return modules
+
+def scan_python_imports(lines: Iterable[str]) -> set[str]:
+    """
+    Collect top-level module names of import statements with a lightweight line lexer.
+
+    Each line is checked for an import statement at its start, while triple-quoted
+    strings are tracked so that import-like lines inside docstrings are ignored.
+    No AST is built.
+
+    Args:
+        lines (Iterable[str]): Source lines; a file object is consumed lazily.
+
+    Returns:
+        set[str]: Top-level imported module names.
+
+    Raises:
+        AmbiguousImportError: If the source uses constructs the line lexer cannot
+            interpret reliably (continuations, one-line compound statements, mixed quotes).
+    """
+    imports = set()
+    in_triple = None
+    for line in lines:
+        if in_triple is None:
+            stripped = line.lstrip()
+            if stripped.startswith(("import", "from")) and _STATEMENT_START.match(stripped):
+                statement = _strip_comment(stripped)
+                # The module of a from-import precedes any parenthesized or continued name list
+                multi_line = statement.endswith("\\") and not statement.startswith("from")
+                if multi_line or ";" in statement:
+                    raise AmbiguousImportError(f"Multi-line or compound import: {statement!r}")
+                imports |= _parse_import_line(statement)
+                continue
+            if _INLINE_IMPORT.search(line):
+                raise AmbiguousImportError(f"Import inside a compound statement: {line.strip()!r}")
+        else:
+            # Code may follow the closing quote of a string opened on an earlier line
+            closing = line.find(in_triple)
+            if closing >= 0 and _INLINE_IMPORT.search(line, closing + 3):
+                raise AmbiguousImportError(f"Import after a triple-quoted string: {line.strip()!r}")
+        if '"""' in line or "'''" in line or in_triple:
+            in_triple = _update_triple_quote_state(line, in_triple)
+    return imports
+
+def scan_python_imports_ast(source: str) -> set[str]:
+    """Collect top-level imported module names with a full AST parse."""
+    imports = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.add(alias.name.split('.')[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.add(node.module.split('.')[0])
+    return imports
+
+def scan_python_source_imports(source: str) -> set[str]:
+    """
+    Collect top-level imported module names from Python source text.
+
+    Uses the line lexer and falls back to the AST when the source is ambiguous.
+
+    Raises:
+        SyntaxError: If the fallback AST parse fails.
+    """
+    try:
+        return scan_python_imports(io.StringIO(source))
+    except AmbiguousImportError:
+        return scan_python_imports_ast(source)
@@ -7,29 +7,43 @@ of imported packages against known standard libraries and aliases.
 """
 
 import os
-import requests
+import threading
 from dotenv import load_dotenv
 from devguard.tools.library_license_checker.license_utils import (rate_license,
-                           fetch_license_from_pypi)
+                           fetch_pypi_license_info)
 from devguard.tools.library_license_checker.normalization import normalize_license_text
+from devguard.tools.library_license_checker.pom_resolver import get_pom_resolver
+from devguard.tools.library_license_checker.maven_versions import resolve_latest_version
+from devguard.tools.library_license_checker.cache import DiskCache
+from devguard.tools.library_license_checker.archive_licenses import get_archive_index
+from devguard.tools.library_license_checker.tracing import record_cache, traced_get
 
 from devguard.tools.library_license_checker.config.license_map import (STANDARD_LIBS,
                                 PACKAGE_ALIASES)
 
-from tools.library_license_checker.config.java_aliases import (KNOWN_GOOD_JAVA_VERSIONS,
+from devguard.tools.library_license_checker.config.java_aliases import (KNOWN_GOOD_JAVA_VERSIONS,
                                  TRUSTED_LICENSES)
 
-import xml.etree.ElementTree as ET
-
 load_dotenv()
 
 API_KEY = os.getenv("LIBRARIES_IO_API_KEY")
-BASE_URL = "https://libraries.io/api"
+BASE_URL = os.getenv("LIBRARIES_IO_URL", "https://libraries.io/api")
+
+# Resolved licenses are reused for this many seconds before being looked up again.
+LICENSE_CACHE_TTL = float(os.getenv("LICENSE_CACHE_TTL", 7 * 24 * 3600))
+
+_license_cache = DiskCache("licenses", ttl=LICENSE_CACHE_TTL)
+_license_memory: dict[str, dict] = {}
+_license_memory_lock = threading.Lock()
 
 def fetch_java_license(group: str, artifact: str, version: str) -> str:
     """
-    Fetch license info for a Java dependency by downloading and parsing its POM file from Maven Central.
-    Falls back to a known stable version if the 'latest' version does not contain license info.
+    Fetch license info for a Java dependency from its effective POM.
+
+    A matching JAR under `LICENSE_ARCHIVE_DIRS` is checked first. Otherwise the POM is
+    resolved from the local Maven repository first and Maven Central otherwise;
+    licenses declared in parent POMs are inherited. Falls back to a
+    known stable version if the 'latest' version does not contain license info.
 
     Args:
         group (str): Maven groupId (e.g., "com.fasterxml.jackson.core")
@@ -39,60 +53,50 @@ def fetch_java_license(group: str, artifact: str, version: str) -> str:
     Returns:
         str: Normalized license name or "Unknown"
     """
+    return fetch_java_license_info(group, artifact, version)["license"]
+
+def fetch_java_license_info(group: str, artifact: str, version: str) -> dict:
+    """
+    Same lookup as `fetch_java_license`, also reporting where the license came from.
+
+    Returns:
+        dict: 'license' (normalized name or "Unknown") and 'source', one of "archive",
+        "maven-local", "maven-central", "cache", "trusted-map" or "none".
+    """
+    # Offline tier: vendored or mirrored JARs
+    archive_license = get_archive_index().java_license(group, artifact, None if version == "latest" else version)
+    if archive_license:
+        return {"license": archive_license, "source": "archive"}
+
     # Resolve latest version if needed
-    original_version = version
     if version == "latest":
-        try:
-            url = f"https://search.maven.org/solrsearch/select?q=g:{group}+AND+a:{artifact}&rows=1&wt=json"
-            response = requests.get(url)
-            data = response.json()
-            docs = data.get("response", {}).get("docs", [])
-            if docs:
-                version = docs[0].get("latestVersion", "Unknown")
-            else:
-                return "Unknown"
-        except Exception as e:
-            print(f"[ERROR] Failed to fetch latest version for {group}:{artifact}: {e}")
-            return "Unknown"
-
-    def fetch_license_for_version(ver: str) -> str:
-        group_path = group.replace('.', '/')
-        pom_url = f"https://repo1.maven.org/maven2/{group_path}/{artifact}/{ver}/{artifact}-{ver}.pom"
-
-        try:
-            response = requests.get(pom_url)
-            if response.status_code != 200:
-                return "Unknown"
-            
-            root = ET.fromstring(response.content)
-            # Strip namespaces
-            for elem in root.iter():
-                if '}' in elem.tag:
-                    elem.tag = elem.tag.split('}', 1)[1]
-            licenses = root.findall('.//licenses/license/name')
-            if licenses:
-                print("[DEBUG] Raw license names found:", [lic.text for lic in licenses if lic.text])
-                license_names = [normalize_license_text(lic.text) for lic in licenses if lic.text]
-                known_licenses = [lic for lic in license_names if lic != "Unknown"]
-                
-                if known_licenses:
-                    return " / ".join(sorted(set(known_licenses)))
-                else:
-                    return "Unknown"
-            else:
-                coord = f"{group}:{artifact}"
-                if coord in TRUSTED_LICENSES:
-                    return normalize_license_text(TRUSTED_LICENSES[coord])
-                return "Unknown"
+        version = resolve_latest_version(group, artifact)
+        if not version:
+            return {"license": "Unknown", "source": "none"}
+
+    def fetch_license_for_version(ver: str) -> dict:
+        pom = get_pom_resolver().resolve(group, artifact, ver)
+        if pom is None:
+            return {"license": "Unknown", "source": "none"}
 
-        except Exception as e:
-            print(f"[ERROR] Failed to fetch/parse POM for {group}:{artifact}:{ver}: {e}")
-            return "Unknown"
+        if pom["licenses"]:
+            license_names = [normalize_license_text(lic) for lic in pom["licenses"]]
+            known_licenses = [lic for lic in license_names if lic != "Unknown"]
+
+            if known_licenses:
+                return {"license": " / ".join(sorted(set(known_licenses))), "source": pom.get("source") or "maven"}
+            else:
+                return {"license": "Unknown", "source": "none"}
+        else:
+            coord = f"{group}:{artifact}"
+            if coord in TRUSTED_LICENSES:
+                return {"license": normalize_license_text(TRUSTED_LICENSES[coord]), "source": "trusted-map"}
+            return {"license": "Unknown", "source": "none"}
 
     # First attempt
-    license_name = fetch_license_for_version(version)
-    if license_name != "Unknown":
-        return license_name
+    info = fetch_license_for_version(version)
+    if info["license"] != "Unknown":
+        return info
 
     # Try fallback if defined
     coord = f"{group}:{artifact}"
@@ -100,27 +104,80 @@ def fetch_java_license(group: str, artifact: str, version: str) -> str:
     if fallback_version and fallback_version != version:
         return fetch_license_for_version(fallback_version)
 
-    return "Unknown"
+    return info
+
+def license_cache_key(package_name: str, platform: str = "pypi", version: str | None = None) -> str:
+    """Return the license cache key for a package, specific to its pinned version if any."""
+    actual_package = PACKAGE_ALIASES.get(package_name, package_name)
+    return f"{platform}:{actual_package.lower()}:{version or '*'}"
+
+def get_cached_license(package_name: str, platform: str = "pypi", version: str | None = None) -> dict | None:
+    """
+    Return a cached `fetch_license` result without touching the network, or None on a miss.
+    """
+    key = license_cache_key(package_name, platform, version)
+    with _license_memory_lock:
+        cached = _license_memory.get(key)
+    if cached is not None:
+        record_cache("licenses", True)
+    else:
+        cached = _license_cache.get(key)
+        if cached is None:
+            return None
+        with _license_memory_lock:
+            _license_memory[key] = cached
+    return {**cached, "name": package_name}
 
-def fetch_license(package_name: str, platform = "pypi"):
+def fetch_license(package_name: str, platform = "pypi", version: str | None = None):
     """
     Fetch license information for a given package from Libraries.io API, with fallback
     to PyPI and normalization.
 
+    Local wheels and sdists under `LICENSE_ARCHIVE_DIRS` are checked before any
+    network lookup. Successful lookups are cached in memory and on disk under a key that includes
+    the pinned version, so repeated scans only hit the network for new packages. Results of
+    failed requests carry an 'error' key and are never cached.
+
     Args:
         package_name (str): The name of the package to fetch the license for.
         platform (str, optional): The platform to query on Libraries.io (default is "pypi").
+        version (str, optional): Pinned version; the PyPI fallback queries that release.
 
     Returns:
         dict: A dictionary containing:
             - 'name': The original package name.
             - 'license': The normalized license name or "Unknown" if not found.
             - 'rating': A rating value derived from the license.
+            - 'source': Where the license came from ("cache", "archive",
+              "libraries.io" or "pypi").
     """
+    cached = get_cached_license(package_name, platform, version)
+    if cached is not None:
+        return {**cached, "source": "cache"}
+
+    result = _fetch_license_uncached(package_name, platform, version)
+    if "error" not in result:
+        key = license_cache_key(package_name, platform, version)
+        with _license_memory_lock:
+            _license_memory[key] = result
+        _license_cache.set(key, result)
+    return dict(result)
+
+def _fetch_license_uncached(package_name: str, platform: str, version: str | None) -> dict:
     actual_package = PACKAGE_ALIASES.get(package_name, package_name)
+    if platform == "pypi":
+        archive_license = get_archive_index().python_license(actual_package, version)
+        if archive_license:
+            return {
+                "name": package_name,
+                "license": archive_license,
+                "rating": rate_license(archive_license),
+                "source": "archive",
+            }
+
     url = f"{BASE_URL}/{platform}/{actual_package}?api_key={API_KEY}"
     try:
-        response = requests.get(url)
+        response = traced_get(url, "libraries.io:project", timeout=10)
         if response.status_code == 200:
             data = response.json()
 
@@ -136,19 +193,27 @@ def fetch_license(package_name: str, platform = "pypi"):
                 if declared and isinstance(declared, list):
                     license_name = normalize_license_text(declared[0])
 
+            source, error = "libraries.io", None
             if license_name == "Unknown":
-                license_name = fetch_license_from_pypi(actual_package)
+                license_name, error = fetch_pypi_license_info(actual_package, version)
+                source = "pypi"
 
-            return {
+            result = {
                 "name": package_name,
                 "license": license_name,
                 "rating": rate_license(license_name),
+                "source": source,
             }
+            if error:
+                # A failed fallback is not a real "Unknown"; keep it out of the cache
+                result["error"] = error
+            return result
         else:
             return {
                 "name": package_name,
                 "license": "Unknown",
                 "rating": rate_license("Unknown"),
+                "source": "libraries.io",
                 "error": f"HTTP {response.status_code}"
             }
     except Exception as e:
@@ -156,6 +221,7 @@ def fetch_license(package_name: str, platform = "pypi"):
             "name": package_name,
             "license": "Unknown",
             "rating": rate_license("Unknown"),
+            "source": "libraries.io",
             "error": str(e)
         }
     
@@ -186,7 +252,8 @@ def check_imported_packages_licenses(imports: list[str]) -> list[dict]:
             license_info = {
                 "name": package,
                 "license": license_name,
-                "rating": rate_license(license_name)
+                "rating": rate_license(license_name),
+                "source": "stdlib-map"
             }
         else:
             license_info = fetch_license(actual_pkg)
@@ -5,9 +5,19 @@ Description: This module provides utility functions for rating licenses and fetc
 license information from pypi.
 """
 
-import requests
-from tools.library_license_checker.normalization import normalize_license_text
+import os
+from functools import lru_cache
+from devguard.tools.library_license_checker.normalization import normalize_license_text
+from devguard.tools.library_license_checker.config.license_map import LICENSE_NORMALIZATION_MAP
+from devguard.tools.library_license_checker.tracing import traced_get
 
+PYPI_URL = os.getenv("PYPI_URL", "https://pypi.org/pypi")
+
+TRUSTED_KEYWORDS = ("MIT", "APACHE", "BSD", "PSF")
+CAUTION_KEYWORDS = ("LGPL", "MPL", "EPL")
+RISKY_KEYWORDS = ("GPL", "AGPL", "UNKNOWN", "OTHER")
+
+@lru_cache(maxsize=1024)
 def rate_license(license_name: str):
     """
     Categorize a software license into a trustworthiness rating.
@@ -19,7 +29,8 @@ def rate_license(license_name: str):
     - ⚠️ Unknown: If the license does not match any known patterns.
 
     The classification is based on substring matches in the uppercase form 
-    of the license name.
+    of the license name. Ratings are memoized per license name, and the ratings
+    of every normalized license id are computed once at import time.
 
     Args:
         license_name (str): The normalized license name to rate.
@@ -27,22 +38,22 @@ def rate_license(license_name: str):
     Returns:
         str: A visual indicator and label of the license rating.
     """
-    trusted = ["MIT", "APACHE", "BSD", "PSF"]
-    caution = ["LGPL", "MPL", "EPL"]
-    risky = ["GPL", "AGPL", "UNKNOWN", "OTHER"]
-
     license_upper = license_name.upper()
 
-    if any(t in license_upper for t in trusted):
+    if any(t in license_upper for t in TRUSTED_KEYWORDS):
         return "✅ Trusted"
-    elif any(c in license_upper for c in caution):
+    elif any(c in license_upper for c in CAUTION_KEYWORDS):
         return "⚠️ Caution"
-    elif any(r in license_upper for r in risky):
+    elif any(r in license_upper for r in RISKY_KEYWORDS):
         return "❌ Risky"
     else:
         return "⚠️ Unknown"
+
+# Precompute ratings for every normalized license id
+for _license_id in set(LICENSE_NORMALIZATION_MAP.values()):
+    rate_license(_license_id)
     
-def fetch_license_from_pypi(package_name: str) -> str:
+def fetch_license_from_pypi(package_name: str, version: str | None = None) -> str:
     """
     Fetch and normalize the license of a Python package from the PyPI registry.
 
@@ -54,19 +65,38 @@ def fetch_license_from_pypi(package_name: str) -> str:
 
     Args:
         package_name (str): The name of the Python package to query.
+        version (str, optional): A specific release to query instead of the latest one.
 
     Returns:
         str: The normalized license name if found, otherwise "Unknown".
     """
-    FALLBACK_PYPI_URL = "https://pypi.org/pypi"
+    return fetch_pypi_license_info(package_name, version)[0]
+
+def fetch_pypi_license_info(package_name: str, version: str | None = None) -> tuple[str, str | None]:
+    """
+    Same lookup as `fetch_license_from_pypi`, also reporting whether the request failed.
+
+    A missing package (HTTP 404) or an empty license field is a definitive "Unknown";
+    network errors and other statuses are reported so the result is not cached.
+
+    Returns:
+        tuple[str, str | None]: The normalized license name (or "Unknown") and an error
+        message, or None if the registry answered.
+    """
     try:
-        url = f"{FALLBACK_PYPI_URL}/{package_name}/json"
-        response = requests.get(url)
+        if version:
+            url = f"{PYPI_URL}/{package_name}/{version}/json"
+        else:
+            url = f"{PYPI_URL}/{package_name}/json"
+        response = traced_get(url, "pypi:json", timeout=10)
         if response.status_code == 200:
             data = response.json()
-            license_str = data.get("info", {}).get("license", "").strip()
+            license_str = (data.get("info", {}).get("license") or "").strip()
             if license_str:
-                return normalize_license_text(license_str)
-    except Exception:
-        pass
-    return "Unknown"
\ No newline at end of file
+                return normalize_license_text(license_str), None
+            return "Unknown", None
+        if response.status_code == 404:
+            return "Unknown", None
+        return "Unknown", f"PyPI HTTP {response.status_code}"
+    except Exception as e:
+        return "Unknown", f"PyPI: {e}"
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+File name: license_warmer.py
+
+Description: Background license cache warmer for the Library License Checker tool.
+When the app or file watcher starts, the workspace's dependency declarations
+(requirements and lockfiles, POMs, Python and Java import sets) are discovered and their
+licenses are resolved into the license cache on a single low-priority thread. The warmer
+yields whenever an interactive license check is running, so it never competes with one.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from devguard.tools.library_license_checker.directory_scan import (gather_license_files,
+                                                                   extract_file_packages,
+                                                                   resolve_package)
+from devguard.tools.library_license_checker.license_api import get_cached_license
+from devguard.tools.library_license_checker.maven_versions import resolve_latest_versions
+
+# Seconds to sleep between background lookups, keeping the warmer's network use gentle.
+WARMER_PAUSE = float(os.getenv("LICENSE_WARMER_PAUSE", 0.05))
+
+_interactive_count = 0
+_interactive_cond = threading.Condition()
+
+@contextmanager
+def interactive_lookup():
+    """Mark an interactive license check as running; the warmer pauses until it finishes."""
+    global _interactive_count
+    with _interactive_cond:
+        _interactive_count += 1
+    try:
+        yield
+    finally:
+        with _interactive_cond:
+            _interactive_count -= 1
+            _interactive_cond.notify_all()
+
+def _wait_until_idle() -> None:
+    with _interactive_cond:
+        _interactive_cond.wait_for(lambda: _interactive_count == 0)
+
+class LicenseCacheWarmer(threading.Thread):
+    """
+    Daemon thread that pre-resolves the licenses of every dependency found under `root`.
+
+    Args:
+        root (str): Workspace directory to discover dependency declarations in.
+        pause (float): Seconds to sleep between lookups.
+    """
+
+    def __init__(self, root: str, pause: float = WARMER_PAUSE):
+        super().__init__(name="license-cache-warmer", daemon=True)
+        self.root = root
+        self.pause = pause
+        self.warmed = 0
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def discover_packages(self) -> list[tuple]:
+        """Return the unique package keys declared or imported under the workspace root."""
+        keys = {}
+        for file_path in gather_license_files(self.root):
+            if self._stop_event.is_set():
+                break
+            for key in extract_file_packages(file_path):
+                keys.setdefault(key, None)
+        return list(keys)
+
+    def run(self) -> None:
+        started = time.perf_counter()
+        keys = [key for key in self.discover_packages()
+                if not (key[0] == "pypi" and get_cached_license(key[1], version=key[2]) is not None)]
+        print(f"[INFO] License cache warmer: {len(keys)} packages to pre-resolve under {self.root}")
+
+        _wait_until_idle()
+        resolve_latest_versions([tuple(name.split(":", 1)) for ecosystem, name, version in keys
+                                 if ecosystem == "maven" and version == "latest"])
+        for key in keys:
+            if self._stop_event.is_set():
+                return
+            _wait_until_idle()
+            try:
+                resolve_package(key)
+                self.warmed += 1
+            except Exception as e:
+                print(f"[WARN] License cache warmer failed for {key[1]}: {e}")
+            time.sleep(self.pause)
+        print(f"[INFO] License cache warmer finished {self.warmed} packages in {time.perf_counter() - started:.1f}s")
+
+_warmer = None
+_warmer_lock = threading.Lock()
+
+def start_license_cache_warmer(root: str) -> LicenseCacheWarmer:
+    """Start the process-wide license cache warmer for `root`; later calls return the same warmer."""
+    global _warmer
+    with _warmer_lock:
+        if _warmer is None:
+            _warmer = LicenseCacheWarmer(root)
+            _warmer.start()
+        return _warmer
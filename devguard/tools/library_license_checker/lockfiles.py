@@ -0,0 +1,195 @@
+"""
+File name: lockfiles.py
+
+Description: Dependency-manifest and lockfile support for the Library License Checker tool.
+Streams pinned packages out of requirements files, `pyproject.toml`, `uv.lock` and
+`poetry.lock`, then resolves the whole pinned set as one concurrent batch using
+version-specific license cache keys.
+"""
+
+import io
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+from devguard.tools.library_license_checker.license_api import fetch_license
+from devguard.tools.library_license_checker.tracing import in_trace_context
+
+DEFAULT_MAX_WORKERS = 16
+
+LOCKFILE_NAMES = ("pyproject.toml", "uv.lock", "poetry.lock")
+
+_REQUIREMENT_PATTERN = re.compile(
+    r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*(?:===?\s*([^\s;,#]+))?"
+)
+_TOML_STRING_PATTERN = re.compile(r'^(name|version)\s*=\s*"([^"]*)"')
+
+def is_lockfile(file_path: str) -> bool:
+    """Return True for requirements files, `pyproject.toml`, `uv.lock` and `poetry.lock`."""
+    name = os.path.basename(file_path).lower()
+    if name in LOCKFILE_NAMES:
+        return True
+    return name.startswith("requirements") and name.endswith((".txt", ".in"))
+
+def parse_requirement(spec: str) -> tuple[str, str | None] | None:
+    """
+    Parse a PEP 508 requirement into (name, pinned version).
+
+    The version is only returned for exact `==` / `===` pins; ranges yield None.
+    """
+    spec = spec.split("#", 1)[0].strip()
+    if not spec or spec.startswith(("-", "git+", "http:", "https:", "file:", ".", "/")):
+        return None
+    match = _REQUIREMENT_PATTERN.match(spec)
+    if not match:
+        return None
+    version = match.group(2)
+    if version and "*" in version:
+        version = None
+    return match.group(1), version
+
+def iter_requirements_lines(lines: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+    """Stream (name, version) pairs from the lines of a pip requirements file."""
+    for line in lines:
+        parsed = parse_requirement(line)
+        if parsed:
+            yield parsed
+
+def iter_requirements_file(file_path: str) -> Iterator[tuple[str, str | None]]:
+    """Stream (name, version) pairs from a pip requirements file, line by line."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield from iter_requirements_lines(f)
+
+def iter_pyproject(file_path: str) -> Iterator[tuple[str, str | None]]:
+    """Yield (name, version) pairs from PEP 621 and Poetry dependency tables in `pyproject.toml`."""
+    with open(file_path, "rb") as f:
+        data = tomllib.load(f)
+    return iter_pyproject_data(data)
+
+def iter_pyproject_data(data: dict) -> Iterator[tuple[str, str | None]]:
+    """Yield (name, version) pairs from an already loaded `pyproject.toml` document."""
+    project = data.get("project", {})
+    specs = list(project.get("dependencies", []))
+    for group in project.get("optional-dependencies", {}).values():
+        specs.extend(group)
+    for spec in specs:
+        parsed = parse_requirement(spec)
+        if parsed:
+            yield parsed
+
+    poetry = data.get("tool", {}).get("poetry", {})
+    tables = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+    tables.extend(group.get("dependencies", {}) for group in poetry.get("group", {}).values())
+    for table in tables:
+        for name, constraint in table.items():
+            if name.lower() == "python":
+                continue
+            version = constraint.get("version") if isinstance(constraint, dict) else constraint
+            pinned = version if isinstance(version, str) and re.fullmatch(r"=*\s*[\w.!+-]+", version) else None
+            yield name, pinned.lstrip("= ") if pinned else None
+
+def iter_toml_lockfile(file_path: str) -> Iterator[tuple[str, str | None]]:
+    """
+    Stream (name, version) pairs from the `[[package]]` tables of `uv.lock` or `poetry.lock`.
+
+    The file is scanned line by line rather than loaded as a whole document, so
+    lockfiles with thousands of packages are read in constant memory. Editable and
+    virtual packages (the project itself in `uv.lock`) are skipped.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield from iter_toml_lock_lines(f)
+
+def iter_toml_lock_lines(lines: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+    """Stream (name, version) pairs from the lines of a `uv.lock` or `poetry.lock` file."""
+    name = version = None
+    in_package = local = False
+
+    def flush():
+        if in_package and name and not local:
+            return name, version
+        return None
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("["):
+            entry = flush()
+            if entry:
+                yield entry
+            in_package = stripped == "[[package]]"
+            name = version = None
+            local = False
+            continue
+        if not in_package:
+            continue
+        match = _TOML_STRING_PATTERN.match(stripped)
+        if match:
+            if match.group(1) == "name" and name is None:
+                name = match.group(2)
+            elif match.group(1) == "version" and version is None:
+                version = match.group(2)
+        elif stripped.startswith("source") and ("editable" in stripped or "virtual" in stripped):
+            local = True
+    entry = flush()
+    if entry:
+        yield entry
+
+def iter_lockfile_packages(file_path: str) -> Iterator[tuple[str, str | None]]:
+    """
+    Stream (name, pinned version) pairs from any supported manifest or lockfile.
+
+    Args:
+        file_path (str): Path to a requirements file, pyproject.toml, uv.lock or poetry.lock.
+    """
+    name = os.path.basename(file_path).lower()
+    if name == "pyproject.toml":
+        return iter_pyproject(file_path)
+    if name in ("uv.lock", "poetry.lock"):
+        return iter_toml_lockfile(file_path)
+    return iter_requirements_file(file_path)
+
+def iter_lockfile_content(file_name: str, content: str) -> Iterator[tuple[str, str | None]]:
+    """
+    Stream (name, pinned version) pairs from manifest or lockfile text already in memory.
+
+    Args:
+        file_name (str): File name (or path) used to pick the format.
+        content (str): File contents.
+    """
+    name = os.path.basename(file_name).lower()
+    if name == "pyproject.toml":
+        return iter_pyproject_data(tomllib.loads(content))
+    if name in ("uv.lock", "poetry.lock"):
+        return iter_toml_lock_lines(io.StringIO(content))
+    return iter_requirements_lines(io.StringIO(content))
+
+def check_lockfile_licenses(file_path: str, max_workers: int = DEFAULT_MAX_WORKERS) -> list[dict]:
+    """
+    Resolve the licenses of every package pinned in a manifest or lockfile.
+
+    Packages are deduplicated by (name, version) and looked up concurrently; each
+    lookup uses a version-specific license cache key.
+
+    Args:
+        file_path (str): Path to the manifest or lockfile.
+        max_workers (int): Number of concurrent license lookups.
+
+    Returns:
+        list[dict]: License info per pinned package, including its 'version'.
+    """
+    pins = list(dict.fromkeys((name, version) for name, version in iter_lockfile_packages(file_path)))
+    print(f"[INFO] Resolving {len(pins)} pinned packages from {file_path}")
+
+    def resolve(pin):
+        name, version = pin
+        result = fetch_license(name, version=version)
+        result["version"] = version or "*"
+        return result
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(in_trace_context(resolve), pins))
@@ -2,42 +2,81 @@
 File name: main.py
 
 Description: Entry point for the Library License Checker tool.
-Supports Python and Java files. Determines packages, fetches license info,
-rates licenses by trust level, and optionally exports results.
+Supports Python and Java files, or whole directories. Determines packages,
+fetches license info, rates licenses by trust level, and optionally exports results.
 
 Designed to be CLI-invokable and LLM-callable.
 """
 
 import os
 import argparse
-import pandas as pd
 from devguard.tools.library_license_checker.helpers import (print_license_report,
                                                             check_java_import_file,
                                                             check_java_licenses,
                                                             check_python_licenses,
                                                             deduplicate_license_results)
 from devguard.tools.library_license_checker.pom_parser import is_parent_pom
-
-def check_licenses(file_path: str, export: bool = False, output_path: str = "license_report.xlsx"):
+from devguard.tools.library_license_checker.directory_scan import scan_directory_licenses
+from devguard.tools.library_license_checker.lockfiles import is_lockfile, check_lockfile_licenses
+from devguard.tools.library_license_checker.exporters import export_results
+from devguard.tools.library_license_checker.license_warmer import interactive_lookup
+from devguard.tools.library_license_checker.tracing import trace_scan
+
+def check_licenses(file_path: str, export: bool = False, output_path: str = "license_report.xlsx",
+                   trace_path: str | None = None):
     """
     Dispatch license checking logic based on file type.
 
     Args:
-        file_path (str): Path to the file (Python or Java).
-        export (bool): Whether to export to Excel.
-        output_path (str): Path to output Excel report.
+        file_path (str): Path to the file (Python, Java, requirements file,
+            pyproject.toml, uv.lock or poetry.lock), or a directory to scan every
+            supported file with cross-file package deduplication.
+        export (bool): Whether to export the report.
+        output_path (str): Path to the report; the extension picks the format
+            (.xlsx, .csv or .parquet).
+        trace_path (str | None): If set, write the scan's network and cache trace
+            (per-host latency percentiles, cache hit ratio, every request) to this JSON file.
 
     Returns:
         list of dicts: License info per package.
     """
-    if not os.path.isfile(file_path):
-        raise FileNotFoundError(f"File does not exist: {file_path}")
+    with interactive_lookup(), trace_scan() as trace:
+        if os.path.isdir(file_path):
+            results, _ = scan_directory_licenses(file_path)
+            deduped_results = results
+        elif not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File does not exist: {file_path}")
+        else:
+            print(f"[INFO] Analyzing file: {file_path}")
+            results = _check_file_licenses(file_path)
+            deduped_results = deduplicate_license_results(results)
+        trace.record_sources(results)
+
+    print(f"[INFO] Lookup trace: {trace.format_summary()}")
+    if trace_path:
+        trace.to_json(trace_path)
+        print(f"[INFO] Trace written to: {trace_path}")
 
-    print(f"[INFO] Analyzing file: {file_path}")
+    if not results:
+        print("[INFO] No packages or dependencies found.")
+        return []
+    
+    print("\n[RESULT] License Check Report:\n")
+    print_license_report(deduped_results)
 
+    if export:
+        export_results(results, output_path)
+        print(f"\n[INFO] Report exported to: {output_path}")
+
+    return deduped_results
+
+def _check_file_licenses(file_path: str) -> list[dict]:
+    """Run the per-file license check matching the file type."""
     file_ext = os.path.splitext(file_path)[-1].lower()
 
-    if file_ext == ".py":
+    if is_lockfile(file_path):
+        results = check_lockfile_licenses(file_path)
+    elif file_ext == ".py":
         results = check_python_licenses(file_path)
     elif file_ext == ".xml" and "pom" in os.path.basename(file_path).lower():
         if is_parent_pom(file_path):
@@ -50,32 +89,18 @@ def check_licenses(file_path: str, export: bool = False, output_path: str = "lic
         raise NotImplementedError("Gradle support coming soon.")
     else:
         raise ValueError(f"Unsupported file type: {file_path}")
-
-    deduped_results = deduplicate_license_results(results)
-
-    if not results:
-        print("[INFO] No packages or dependencies found.")
-        return []
-    
-    print("\n[RESULT] License Check Report:\n")
-    print_license_report(deduped_results)
-
-    if export:
-        df = pd.DataFrame(results)
-        df.to_excel(output_path, index=False)
-        print(f"\n[INFO] Report exported to: {output_path}")
-
-    return deduped_results
+    return results
 
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Library License Checker for Python (.py), Java (.java), and Maven (.xml)")
-    parser.add_argument("file", help="Path to a .py or pom.xml file to check")
-    parser.add_argument("--export", action="store_true", help="Export results to Excel")
-    parser.add_argument("--output", default="license_report.xlsx", help="Path for Excel export")
+    parser = argparse.ArgumentParser(description="Library License Checker for Python (.py), Java (.java), Maven (.xml) and Python lockfiles")
+    parser.add_argument("file", help="Path to a .py, .java, pom.xml, requirements, pyproject.toml, uv.lock or poetry.lock file, or a directory to scan")
+    parser.add_argument("--export", action="store_true", help="Export results to a report file")
+    parser.add_argument("--output", default="license_report.xlsx", help="Path for the export (.xlsx, .csv or .parquet)")
+    parser.add_argument("--trace", default=None, help="Write the network/cache trace of the scan to this JSON file")
     args = parser.parse_args()
 
     try:
-        check_licenses(args.file, export=args.export, output_path=args.output)
+        check_licenses(args.file, export=args.export, output_path=args.output, trace_path=args.trace)
     except Exception as e:
         print(f"[ERROR] {e}")
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+File name: maven_versions.py
+
+Description: Latest-version resolution for Maven artifacts used by the Library License Checker tool.
+Many coordinates are resolved with one OR-combined Solr query against search.maven.org,
+and `maven-metadata.xml` files are kept in a TTL cache refreshed with conditional GETs
+(ETag / Last-Modified), so Java scans make a handful of requests instead of one per import.
+"""
+
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+import requests
+
+from devguard.tools.library_license_checker.cache import DiskCache
+from devguard.tools.library_license_checker.pom_resolver import MAVEN_CENTRAL_URL
+from devguard.tools.library_license_checker.tracing import record_cache, traced_get
+
+MAVEN_SEARCH_URL = os.getenv("MAVEN_SEARCH_URL", "https://search.maven.org/solrsearch/select")
+
+# How long resolved versions and metadata stay fresh before being revalidated.
+VERSION_TTL = float(os.getenv("MAVEN_VERSION_TTL", 24 * 3600))
+
+# Maximum number of coordinates combined into one Solr query.
+SOLR_BATCH_SIZE = 20
+
+_latest_cache = DiskCache("maven_latest", ttl=VERSION_TTL)
+_metadata_cache = DiskCache("maven_metadata")
+_memory: dict[str, tuple[float, str | None]] = {}
+_memory_lock = threading.Lock()
+
+def _coord(group: str, artifact: str) -> str:
+    return f"{group}:{artifact}"
+
+def _remember(group: str, artifact: str, version: str | None) -> None:
+    with _memory_lock:
+        _memory[_coord(group, artifact)] = (time.time(), version)
+    if version:
+        _latest_cache.set(_coord(group, artifact), version)
+
+def cached_latest_version(group: str, artifact: str) -> tuple[bool, str | None]:
+    """
+    Look up a previously resolved latest version without touching the network.
+
+    Returns:
+        tuple[bool, str | None]: (found, version). `found` is True for remembered misses too.
+    """
+    coord = _coord(group, artifact)
+    with _memory_lock:
+        entry = _memory.get(coord)
+    if entry and time.time() - entry[0] <= VERSION_TTL:
+        record_cache("maven_latest", True)
+        return True, entry[1]
+    version = _latest_cache.get(coord)
+    if version:
+        with _memory_lock:
+            _memory[coord] = (time.time(), version)
+        return True, version
+    return False, None
+
+def _solr_query(coords: list[tuple[str, str]]) -> dict[tuple[str, str], str]:
+    query = " OR ".join(f'(g:"{group}" AND a:"{artifact}")' for group, artifact in coords)
+    response = traced_get(MAVEN_SEARCH_URL, "maven:search",
+                          params={"q": query, "rows": len(coords), "wt": "json"},
+                          timeout=10)
+    response.raise_for_status()
+    docs = response.json().get("response", {}).get("docs", [])
+    return {(doc.get("g"), doc.get("a")): doc.get("latestVersion") for doc in docs if doc.get("latestVersion")}
+
+def resolve_latest_versions(coords: list[tuple[str, str]]) -> dict[tuple[str, str], str | None]:
+    """
+    Resolve the latest version of many Maven artifacts with batched Solr queries.
+
+    Cached coordinates are answered locally; the rest are combined into OR queries of
+    up to `SOLR_BATCH_SIZE` coordinates. Artifacts Solr does not know are retried
+    individually against their `maven-metadata.xml`. A miss is only remembered when
+    it is definitive (Solr answered and the metadata does not exist); after network or
+    server errors the last known version is used, even if stale, and nothing is cached.
+
+    Args:
+        coords (list[tuple[str, str]]): (groupId, artifactId) pairs.
+
+    Returns:
+        dict: (groupId, artifactId) → latest version, or None if it could not be resolved.
+    """
+    results = {}
+    pending = []
+    for group, artifact in dict.fromkeys(coords):
+        found, version = cached_latest_version(group, artifact)
+        if found:
+            results[(group, artifact)] = version
+        else:
+            pending.append((group, artifact))
+
+    for start in range(0, len(pending), SOLR_BATCH_SIZE):
+        batch = pending[start:start + SOLR_BATCH_SIZE]
+        solr_answered = True
+        try:
+            found_versions = _solr_query(batch)
+        except (requests.RequestException, ValueError) as e:
+            print(f"[WARN] Batched Maven search failed for {len(batch)} artifacts: {e}")
+            found_versions, solr_answered = {}, False
+        for group, artifact in batch:
+            version, definitive = found_versions.get((group, artifact)), True
+            if not version:
+                version, definitive = _metadata_latest_version(group, artifact)
+                definitive = definitive and (version is not None or solr_answered)
+            if definitive:
+                _remember(group, artifact, version)
+            elif not version:
+                version = _latest_cache.get(_coord(group, artifact), allow_stale=True)
+            results[(group, artifact)] = version
+    return results
+
+def resolve_latest_version(group: str, artifact: str) -> str | None:
+    """Resolve the latest version of a single Maven artifact, using the shared caches."""
+    return resolve_latest_versions([(group, artifact)])[(group, artifact)]
+
+def get_metadata_latest_version(group: str, artifact: str) -> str | None:
+    """
+    Return the latest version recorded in an artifact's `maven-metadata.xml`.
+
+    The metadata is cached on disk and revalidated with a conditional GET once it
+    is older than `VERSION_TTL`; a 304 response reuses the stored copy.
+
+    Args:
+        group (str): Group ID of the artifact.
+        artifact (str): Artifact ID.
+
+    Returns:
+        str or None: Latest (or release) version string if found.
+    """
+    return _metadata_latest_version(group, artifact)[0]
+
+def _metadata_latest_version(group: str, artifact: str) -> tuple[str | None, bool]:
+    """
+    Same lookup as `get_metadata_latest_version`, also reporting whether the answer is definitive.
+
+    Returns:
+        tuple[str | None, bool]: The latest version (or the stored one after an error),
+        and False if the repository could not be reached, answered with an error other
+        than 404, or returned unreadable metadata.
+    """
+    coord = _coord(group, artifact)
+    entry = _metadata_cache.get(coord)
+    if entry and time.time() - entry["checked_at"] <= VERSION_TTL:
+        return entry["latest"], True
+
+    group_path = group.replace(".", "/")
+    url = f"{MAVEN_CENTRAL_URL}/{group_path}/{artifact}/maven-metadata.xml"
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    try:
+        response = traced_get(url, "maven:metadata", headers=headers, timeout=5)
+    except requests.RequestException as e:
+        print(f"[ERROR] Failed to get latest version for {group}:{artifact}: {e}")
+        return (entry["latest"] if entry else None), False
+
+    if response.status_code == 304 and entry:
+        entry["checked_at"] = time.time()
+        _metadata_cache.set(coord, entry)
+        return entry["latest"], True
+    if response.status_code == 404:
+        return None, True
+    if response.status_code != 200:
+        print(f"[WARN] Failed to fetch maven-metadata.xml for {group}:{artifact}: HTTP {response.status_code}")
+        return (entry["latest"] if entry else None), False
+
+    try:
+        tree = ET.fromstring(response.content)
+    except ET.ParseError as e:
+        print(f"[ERROR] Failed to parse maven-metadata.xml for {group}:{artifact}: {e}")
+        return (entry["latest"] if entry else None), False
+    latest = tree.findtext("versioning/latest") or tree.findtext("versioning/release")
+    _metadata_cache.set(coord, {
+        "latest": latest.strip() if latest else None,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "checked_at": time.time(),
+    })
+    return (latest.strip() if latest else None), True
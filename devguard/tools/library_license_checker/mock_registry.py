@@ -0,0 +1,233 @@
+"""
+File name: mock_registry.py
+
+Description: Local stand-in for the registries used by the Library License Checker tool.
+Serves the libraries.io project endpoint, the PyPI JSON API, Maven POM and
+`maven-metadata.xml` paths, and the search.maven.org Solr endpoint from one HTTP
+server, with deterministic license data and configurable latency, error rate and
+429 rate limiting. Point the checker at it with the environment variables from
+`MockRegistry.env()`, or run it standalone:
+
+    python mock_registry.py --port 8765 --latency 40 --rate-limit-rate 0.05
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+MOCK_LICENSES = ("MIT", "Apache-2.0", "BSD-3-Clause", "MPL-2.0", "LGPL-3.0", "GPL-3.0")
+
+_SOLR_CLAUSE = re.compile(r'g:"([^"]+)"\s+AND\s+a:"([^"]+)"')
+
+def mock_license(name: str) -> str:
+    """Return the deterministic license the mock registry reports for a package name."""
+    digest = hashlib.sha1(name.lower().encode("utf-8")).digest()
+    return MOCK_LICENSES[digest[0] % len(MOCK_LICENSES)]
+
+def mock_latest_version(group: str, artifact: str) -> str:
+    """Return the deterministic latest version reported for a Maven artifact."""
+    digest = hashlib.sha1(f"{group}:{artifact}".encode("utf-8")).digest()
+    return f"{digest[0] % 5 + 1}.{digest[1] % 20}.{digest[2] % 10}"
+
+class _MockRegistryHandler(BaseHTTPRequestHandler):
+    server: "_MockRegistryServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        registry = self.server.registry
+        registry.count(self.path)
+        delay = registry.next_delay()
+        if delay:
+            time.sleep(delay)
+
+        fault = registry.next_fault()
+        if fault == 429:
+            self._send(429, b"rate limited", "text/plain", {"Retry-After": str(registry.retry_after)})
+            return
+        if fault == 500:
+            self._send(500, b"internal error", "text/plain")
+            return
+
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        if path.startswith("/api/"):
+            self._libraries_io(path)
+        elif path.startswith("/pypi/"):
+            self._pypi(path)
+        elif path.startswith("/maven2/"):
+            self._maven(path)
+        elif path == "/solrsearch/select":
+            self._solr(parse_qs(url.query))
+        else:
+            self._send(404, b"not found", "text/plain")
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, data: dict):
+        self._send(200, json.dumps(data).encode("utf-8"), "application/json")
+
+    def _libraries_io(self, path: str):
+        # /api/{platform}/{name}
+        parts = path.strip("/").split("/")
+        if len(parts) != 3:
+            self._send(404, b"not found", "text/plain")
+            return
+        name = parts[2]
+        license_name = mock_license(name)
+        self._json({"name": name, "platform": parts[1], "licenses": license_name,
+                    "normalized_licenses": [license_name], "declared_licenses": [license_name]})
+
+    def _pypi(self, path: str):
+        # /pypi/{name}/json or /pypi/{name}/{version}/json
+        parts = path.strip("/").split("/")
+        if parts[-1] != "json" or len(parts) not in (3, 4):
+            self._send(404, b"not found", "text/plain")
+            return
+        name = parts[1]
+        version = parts[2] if len(parts) == 4 else "1.0.0"
+        self._json({"info": {"name": name, "version": version, "license": mock_license(name)}})
+
+    def _maven(self, path: str):
+        parts = path.strip("/").split("/")[1:]
+        if parts and parts[-1] == "maven-metadata.xml" and len(parts) >= 3:
+            group, artifact = ".".join(parts[:-2]), parts[-2]
+            version = mock_latest_version(group, artifact)
+            etag = f'"{hashlib.sha1(f"{group}:{artifact}:{version}".encode()).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, b"", "application/xml", {"ETag": etag})
+                return
+            body = (f"<metadata><groupId>{group}</groupId><artifactId>{artifact}</artifactId>"
+                    f"<versioning><latest>{version}</latest><release>{version}</release></versioning></metadata>")
+            self._send(200, body.encode("utf-8"), "application/xml", {"ETag": etag})
+        elif parts and parts[-1].endswith(".pom") and len(parts) >= 4:
+            group, artifact, version = ".".join(parts[:-3]), parts[-3], parts[-2]
+            body = ('<project xmlns="http://maven.apache.org/POM/4.0.0">'
+                    f"<groupId>{group}</groupId><artifactId>{artifact}</artifactId><version>{version}</version>"
+                    f"<licenses><license><name>{mock_license(f'{group}:{artifact}')}</name></license></licenses>"
+                    "</project>")
+            self._send(200, body.encode("utf-8"), "application/xml")
+        else:
+            self._send(404, b"not found", "text/plain")
+
+    def _solr(self, query: dict):
+        clauses = _SOLR_CLAUSE.findall(query.get("q", [""])[0])
+        docs = [{"id": f"{g}:{a}", "g": g, "a": a, "latestVersion": mock_latest_version(g, a)} for g, a in clauses]
+        self._json({"response": {"numFound": len(docs), "start": 0, "docs": docs}})
+
+class _MockRegistryServer(ThreadingHTTPServer):
+    daemon_threads = True
+    registry: "MockRegistry"
+
+class MockRegistry:
+    """
+    In-process mock registry server.
+
+    Args:
+        host (str): Interface to bind.
+        port (int): Port to bind; 0 picks a free port.
+        latency (float): Mean added latency per request in seconds.
+        jitter (float): Uniform +/- jitter applied to the latency, in seconds.
+        error_rate (float): Fraction of requests answered with HTTP 500.
+        rate_limit_rate (float): Fraction of requests answered with HTTP 429.
+        retry_after (float): `Retry-After` seconds sent with 429 responses.
+        seed (int): Seed for the latency and fault random generator.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0, retry_after: float = 0.1, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.requests = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _MockRegistryServer((host, port), _MockRegistryHandler)
+        self._server.registry = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict[str, str]:
+        """Return the environment variables that point the license checker at this server."""
+        return {
+            "LIBRARIES_IO_URL": f"{self.url}/api",
+            "PYPI_URL": f"{self.url}/pypi",
+            "MAVEN_CENTRAL_URL": f"{self.url}/maven2",
+            "MAVEN_SEARCH_URL": f"{self.url}/solrsearch/select",
+        }
+
+    def count(self, path: str) -> None:
+        kind = path.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+        with self._lock:
+            self.requests[kind] += 1
+
+    def next_delay(self) -> float:
+        with self._lock:
+            return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def next_fault(self) -> int | None:
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+    def start(self) -> "MockRegistry":
+        """Serve requests on a background daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-registry", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockRegistry":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock libraries.io / PyPI / Maven registry for the license checker")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean added latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Latency jitter (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 429")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    registry = MockRegistry(args.host, args.port, args.latency / 1000, args.jitter / 1000,
+                            args.error_rate, args.rate_limit_rate, seed=args.seed)
+    print("[INFO] Mock registry listening; export these to use it:")
+    for key, value in registry.env().items():
+        print(f"export {key}={value}")
+    try:
+        registry._server.serve_forever()
+    except KeyboardInterrupt:
+        registry.stop()
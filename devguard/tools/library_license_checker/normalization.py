@@ -2,16 +2,52 @@
 File name: normalization.py
 
 Description: This module provides functions for normalizing and processing license information.
+The normalization map is compiled once into a single regular expression, and results are
+memoized per raw license string so repeated lookups never rescan the map.
 """
 
 import difflib
-from tools.library_license_checker.config.license_map import LICENSE_NORMALIZATION_MAP
+import re
+from functools import lru_cache
+from devguard.tools.library_license_checker.config.license_map import LICENSE_NORMALIZATION_MAP
+
+# Upper bound on distinct raw license strings remembered by the memo.
+NORMALIZATION_MEMO_SIZE = 4096
+
+_NORMALIZATION_KEYS = sorted(LICENSE_NORMALIZATION_MAP, key=lambda key: (-len(key), key))
+_NORMALIZATION_PATTERN = re.compile("|".join(re.escape(key) for key in _NORMALIZATION_KEYS))
+
+def _match_license_key(norm: str) -> str | None:
+    """
+    Return the map key matching `norm`, preferring the longest key and then the earliest position.
+    """
+    best = None
+    for match in _NORMALIZATION_PATTERN.finditer(norm):
+        if best is None or len(match.group(0)) > len(best):
+            best = match.group(0)
+    return best
+
+@lru_cache(maxsize=NORMALIZATION_MEMO_SIZE)
+def _normalize_cached(norm: str) -> str:
+    # 1. Longest exact substring match
+    key = _match_license_key(norm)
+    if key is not None:
+        return LICENSE_NORMALIZATION_MAP[key]
+
+    # 2. Fuzzy match - find closest keys
+    close_matches = difflib.get_close_matches(norm, _NORMALIZATION_KEYS, n=1, cutoff=0.7)
+    if close_matches:
+        return LICENSE_NORMALIZATION_MAP[close_matches[0]]
+
+    return "Unknown"
 
 def normalize_license_text(license_str: str) -> str:
     """
     Normalize a given license string to a standardized license identifier.
 
-    Tries exact substring matches first, then fuzzy matching on keys to handle typos or variants.
+    Tries exact substring matches first (the longest matching key wins), then fuzzy
+    matching on keys to handle typos or variants. Results are memoized, so fuzzy
+    matching runs at most once per distinct string.
 
     Args:
         license_str (str): The raw license string to normalize.
@@ -23,19 +59,6 @@ def normalize_license_text(license_str: str) -> str:
         if not license_str:
             return "Unknown"
 
-        norm = license_str.strip().lower()
-
-        # 1. Exact substring match
-        for key in LICENSE_NORMALIZATION_MAP:
-            if key in norm:
-                return LICENSE_NORMALIZATION_MAP[key]
-
-        # 2. Fuzzy match - find closest keys
-        keys = list(LICENSE_NORMALIZATION_MAP.keys())
-        close_matches = difflib.get_close_matches(norm, keys, n=1, cutoff=0.7)
-        if close_matches:
-            return LICENSE_NORMALIZATION_MAP[close_matches[0]]
-
-        return "Unknown"
+        return _normalize_cached(license_str.strip().lower())
     except Exception:
-        return "Unknown"
\ No newline at end of file
+        return "Unknown"
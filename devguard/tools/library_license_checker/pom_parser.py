@@ -1,4 +1,168 @@
+"""
+File name: pom_parser.py
+
+Description: Single-parse Maven POM model shared by the Library License Checker and the
+Internal Guideline Compliance Checker. Each version of a POM file is parsed exactly once
+into a `PomModel` (coordinates, dependencies with line numbers, packaging, modules,
+properties and the element tree itself), which is cached by path, size and mtime.
+"""
+
+import os
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from xml.parsers import expat
+
+from devguard.tools.library_license_checker.pom_resolver import interpolate
+
+# Number of parsed POM versions kept in memory.
+POM_MODEL_CACHE_SIZE = 256
+
+class _LineElement(ET.Element):
+    """Element that records the line its start tag appeared on, like lxml's `sourceline`."""
+
+@dataclass
+class PomDependency:
+    group: str | None
+    artifact: str | None
+    version: str | None
+    scope: str | None
+    line: int
+
+@dataclass
+class PomModel:
+    group: str | None = None
+    artifact: str | None = None
+    version: str | None = None
+    packaging: str | None = None
+    modules: list[str] | None = None
+    properties: dict[str, str] = field(default_factory=dict)
+    dependencies: list[PomDependency] = field(default_factory=list)
+    tree: ET.ElementTree | None = None
+    error: str | None = None
+
+    @property
+    def is_parent(self) -> bool:
+        """True for aggregator POMs (`<packaging>pom</packaging>` with `<modules>`)."""
+        return self.packaging == "pom" and self.modules is not None
+
+def _qualify(name: str) -> str:
+    # expat reports namespaced names as "uri}local"; ElementTree expects "{uri}local"
+    return "{" + name if "}" in name else name
+
+def parse_xml_with_lines(content: bytes | str) -> ET.ElementTree:
+    """
+    Parse XML into an ElementTree whose elements carry a `sourceline` attribute.
+
+    Raises:
+        ET.ParseError: If the document is not well-formed.
+    """
+    builder = ET.TreeBuilder(element_factory=_LineElement)
+    parser = expat.ParserCreate(namespace_separator="}")
+
+    def start(tag, attrs):
+        elem = builder.start(_qualify(tag), {_qualify(k): v for k, v in attrs.items()})
+        elem.sourceline = parser.CurrentLineNumber
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = lambda tag: builder.end(_qualify(tag))
+    parser.CharacterDataHandler = builder.data
+    parser.buffer_text = True
+    try:
+        parser.Parse(content, True)
+    except expat.ExpatError as e:
+        raise ET.ParseError(str(e)) from e
+    return ET.ElementTree(builder.close())
+
+def _text(elem: ET.Element, path: str) -> str | None:
+    found = elem.find(path)
+    return found.text.strip() if found is not None and found.text and found.text.strip() else None
+
+def parse_pom_content(content: bytes | str) -> PomModel:
+    """
+    Build a `PomModel` from raw POM content in a single parse.
+
+    Dependency versions are interpolated with the POM's own properties. A document
+    that fails to parse yields a model with `error` set and no tree.
+    """
+    try:
+        tree = parse_xml_with_lines(content)
+    except ET.ParseError as e:
+        return PomModel(error=str(e))
+
+    root = tree.getroot()
+    parent = root.find("{*}parent")
+    model = PomModel(
+        group=_text(root, "{*}groupId") or (_text(parent, "{*}groupId") if parent is not None else None),
+        artifact=_text(root, "{*}artifactId"),
+        version=_text(root, "{*}version") or (_text(parent, "{*}version") if parent is not None else None),
+        packaging=_text(root, "{*}packaging"),
+        tree=tree,
+    )
+
+    modules = root.find("{*}modules")
+    if modules is not None:
+        model.modules = [m.text.strip() for m in modules.findall("{*}module") if m.text]
+
+    props = root.find("{*}properties")
+    if props is not None:
+        for prop in props:
+            if isinstance(prop.tag, str):
+                model.properties[prop.tag.split("}", 1)[-1]] = (prop.text or "").strip()
+    model.properties.update({
+        "project.groupId": model.group or "",
+        "project.artifactId": model.artifact or "",
+        "project.version": model.version or "",
+    })
+
+    for dep in root.findall(".//{*}dependency"):
+        model.dependencies.append(PomDependency(
+            group=interpolate(_text(dep, "{*}groupId"), model.properties),
+            artifact=interpolate(_text(dep, "{*}artifactId"), model.properties),
+            version=interpolate(_text(dep, "{*}version"), model.properties),
+            scope=_text(dep, "{*}scope"),
+            line=getattr(dep, "sourceline", 0),
+        ))
+    return model
+
+_model_cache: OrderedDict = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+def load_pom_model(file_path: str) -> PomModel:
+    """
+    Return the `PomModel` for a POM file, parsing it only when the file has changed.
+
+    Models are cached by (absolute path, size, mtime), so the license checker, its
+    parent-POM detection and the XML compliance rules all share one parse per file version.
+
+    Args:
+        file_path (str): Path to the POM file.
+
+    Returns:
+        PomModel: The parsed model, or a model with `error` set if the file cannot be parsed.
+    """
+    path = os.path.abspath(file_path)
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        return PomModel(error=str(e))
+    key = (path, stat.st_size, stat.st_mtime_ns)
+
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+        if model is not None:
+            _model_cache.move_to_end(key)
+            return model
+
+    with open(path, "rb") as f:
+        model = parse_pom_content(f.read())
+
+    with _model_cache_lock:
+        _model_cache[key] = model
+        while len(_model_cache) > POM_MODEL_CACHE_SIZE:
+            _model_cache.popitem(last=False)
+    return model
 
 def is_parent_pom(file_path: str) -> bool:
     """
@@ -10,15 +174,7 @@ def is_parent_pom(file_path: str) -> bool:
     Returns:
         bool: True if it's a parent POM, False otherwise.
     """
-    try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        ns = {'m': 'http://maven.apache.org/POM/4.0.0'}
-
-        packaging = root.find("m:packaging", ns)
-        modules = root.find("m:modules", ns)
-        if packaging is not None and packaging.text == "pom" and modules is not None:
-            return True
-    except Exception as e:
-        print(f"[ERROR] Failed to parse POM file for parent detection: {e}")
-    return False
\ No newline at end of file
+    model = load_pom_model(file_path)
+    if model.error:
+        print(f"[ERROR] Failed to parse POM file for parent detection: {model.error}")
+    return model.is_parent
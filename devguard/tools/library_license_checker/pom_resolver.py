@@ -0,0 +1,255 @@
+"""
+File name: pom_resolver.py
+
+Description: Resolves effective Maven POMs for the Library License Checker tool.
+POM files are looked up in the local Maven repository (and any configured directory
+mirrors) before falling back to Maven Central. `<parent>` chains are walked so that
+licenses and properties declared in parent POMs are inherited, and `${...}` property
+references are interpolated, including CI-friendly versions such as `${revision}` in
+the parent and project coordinates. Effective POMs are cached in memory and on disk,
+except for SNAPSHOT versions, whose POM can change under the same coordinates, and
+POMs whose parent could not be fetched because of a network or server error.
+"""
+
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+
+import requests
+
+from devguard.tools.library_license_checker.cache import DiskCache
+from devguard.tools.library_license_checker.tracing import record_cache, traced_get
+
+MAVEN_CENTRAL_URL = os.getenv("MAVEN_CENTRAL_URL", "https://repo1.maven.org/maven2")
+MAVEN_LOCAL_REPO = os.path.expanduser(os.getenv("MAVEN_LOCAL_REPO", "~/.m2/repository"))
+
+# Extra directory mirrors laid out like a Maven repository, separated by os.pathsep.
+MAVEN_MIRROR_DIRS = [os.path.expanduser(p) for p in os.getenv("MAVEN_MIRROR_DIRS", "").split(os.pathsep) if p]
+
+MAX_PARENT_DEPTH = 10
+PROPERTY_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+class PomUnavailableError(Exception):
+    """Raised when a POM could not be fetched because of a network or server error, as opposed to not existing."""
+
+def strip_namespaces(root: ET.Element) -> ET.Element:
+    """Remove XML namespaces from every tag in the tree, in place."""
+    for elem in root.iter():
+        if isinstance(elem.tag, str) and '}' in elem.tag:
+            elem.tag = elem.tag.split('}', 1)[1]
+    return root
+
+def pom_relative_path(group: str, artifact: str, version: str) -> str:
+    """Return the repository-relative path of an artifact's POM file."""
+    group_path = group.replace('.', '/')
+    return f"{group_path}/{artifact}/{version}/{artifact}-{version}.pom"
+
+def interpolate(value: str | None, properties: dict[str, str]) -> str | None:
+    """
+    Replace `${name}` references in a value using the given properties.
+
+    Nested references are resolved up to a fixed depth; unknown references are left untouched.
+    """
+    if not value or "${" not in value:
+        return value
+    for _ in range(5):
+        new_value = PROPERTY_PATTERN.sub(lambda m: properties.get(m.group(1), m.group(0)), value)
+        if new_value == value:
+            break
+        value = new_value
+    return value
+
+def is_snapshot(version: str | None) -> bool:
+    """Return True for Maven SNAPSHOT versions, which are republished under the same coordinates."""
+    return bool(version) and version.upper().endswith("-SNAPSHOT")
+
+def _text(root: ET.Element, path: str) -> str | None:
+    el = root.find(path)
+    return el.text.strip() if el is not None and el.text else None
+
+class PomResolver:
+    """
+    Local-first resolver of effective POMs with parent and property inheritance.
+
+    Args:
+        local_repos (list[str] | None): Maven repository directories to search before
+            the network. Defaults to `~/.m2/repository` plus `MAVEN_MIRROR_DIRS`.
+        remote_url (str | None): Remote repository base URL, or None to stay offline.
+        disk_cache (DiskCache | None): Persistent cache for effective POMs.
+    """
+
+    def __init__(self, local_repos: list[str] | None = None,
+                 remote_url: str | None = MAVEN_CENTRAL_URL,
+                 disk_cache: DiskCache | None = None):
+        self.local_repos = local_repos if local_repos is not None else [MAVEN_LOCAL_REPO, *MAVEN_MIRROR_DIRS]
+        self.remote_url = remote_url
+        self.disk_cache = disk_cache if disk_cache is not None else DiskCache("effective_poms")
+        self._memory: dict[str, dict | None] = {}
+        self._lock = threading.Lock()
+
+    def load_raw_pom(self, group: str, artifact: str, version: str) -> tuple[bytes | None, str | None]:
+        """
+        Read a POM file from the local repositories, falling back to the remote repository.
+
+        Returns:
+            tuple[bytes | None, str | None]: Raw POM content and where it was read from
+            ("maven-local" or "maven-central"), or (None, None) if it does not exist.
+
+        Raises:
+            PomUnavailableError: If the remote repository could not be reached or answered
+                with an error other than 404; the POM may exist.
+        """
+        rel_path = pom_relative_path(group, artifact, version)
+        for repo in self.local_repos:
+            path = os.path.join(repo, *rel_path.split('/'))
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    return f.read(), "maven-local"
+
+        if not self.remote_url:
+            return None, None
+        try:
+            response = traced_get(f"{self.remote_url}/{rel_path}", "maven:pom", timeout=10)
+        except requests.RequestException as e:
+            print(f"[ERROR] Failed to fetch POM for {group}:{artifact}:{version}: {e}")
+            raise PomUnavailableError(f"{group}:{artifact}:{version}: {e}") from e
+        if response.status_code == 200:
+            return response.content, "maven-central"
+        if response.status_code in (404, 410):
+            return None, None
+        print(f"[ERROR] Failed to fetch POM for {group}:{artifact}:{version}: HTTP {response.status_code}")
+        raise PomUnavailableError(f"{group}:{artifact}:{version}: HTTP {response.status_code}")
+
+    def resolve(self, group: str, artifact: str, version: str) -> dict | None:
+        """
+        Resolve the effective POM of an artifact.
+
+        Args:
+            group (str): Maven groupId.
+            artifact (str): Maven artifactId.
+            version (str): Concrete version string.
+
+        Returns:
+            dict | None: Effective POM with 'group', 'artifact', 'version', 'licenses',
+            'properties', 'parent', 'snapshot' (True if the artifact or a parent is a
+            SNAPSHOT), 'incomplete' (True if a declared parent could not be fetched) and
+            'source' (where the POM was read from: "maven-local", "maven-central" or
+            "cache"), or None if the POM could not be found, fetched or parsed. SNAPSHOT
+            and incomplete POMs, and failed fetches, are not cached.
+        """
+        try:
+            return self._resolve(group, artifact, version, depth=0)
+        except PomUnavailableError:
+            return None
+
+    def _resolve(self, group: str, artifact: str, version: str, depth: int) -> dict | None:
+        key = f"{group}:{artifact}:{version}"
+        with self._lock:
+            if key in self._memory:
+                record_cache("effective_poms", True)
+                return self._memory[key]
+
+        cached = None if is_snapshot(version) else self.disk_cache.get(key)
+        if cached is not None:
+            effective = {**cached, "source": "cache"}
+        else:
+            effective = self._build_effective_pom(group, artifact, version, depth)
+            if effective is not None and (effective["snapshot"] or effective["incomplete"]):
+                # SNAPSHOT POMs change without a new version, and a missing parent may be
+                # fetched next time; read them again instead of caching
+                return effective
+            if effective is not None:
+                # The origin belongs to this fetch only; later reads report "cache"
+                self.disk_cache.set(key, {k: v for k, v in effective.items() if k != "source"})
+
+        with self._lock:
+            self._memory[key] = {**effective, "source": "cache"} if effective is not None else None
+        return effective
+
+    def _build_effective_pom(self, group: str, artifact: str, version: str, depth: int) -> dict | None:
+        content, source = self.load_raw_pom(group, artifact, version)
+        if content is None:
+            return None
+        try:
+            root = strip_namespaces(ET.fromstring(content))
+        except ET.ParseError as e:
+            print(f"[ERROR] Failed to parse POM for {group}:{artifact}:{version}: {e}")
+            return None
+
+        own_properties = {}
+        props_el = root.find("properties")
+        if props_el is not None:
+            for prop in props_el:
+                own_properties[prop.tag] = (prop.text or "").strip()
+
+        parent = None
+        parent_pom = None
+        parent_unavailable = False
+        parent_el = root.find("parent")
+        if parent_el is not None:
+            # Parent coordinates may use the POM's own properties, e.g. <version>${revision}</version>
+            parent = {
+                "group": _coordinate(_text(parent_el, "groupId"), own_properties),
+                "artifact": _coordinate(_text(parent_el, "artifactId"), own_properties),
+                "version": _coordinate(_text(parent_el, "version"), own_properties),
+            }
+            if all(parent.values()) and depth < MAX_PARENT_DEPTH:
+                try:
+                    parent_pom = self._resolve(parent["group"], parent["artifact"], parent["version"], depth + 1)
+                except PomUnavailableError:
+                    parent_unavailable = True
+
+        properties = dict(parent_pom["properties"]) if parent_pom else {}
+        properties.update(own_properties)
+
+        project_version = (_coordinate(_text(root, "version"), properties)
+                           or (parent or {}).get("version") or version)
+        project_group = (_coordinate(_text(root, "groupId"), properties)
+                         or (parent or {}).get("group") or group)
+        properties.update({
+            "project.groupId": project_group,
+            "project.artifactId": _text(root, "artifactId") or artifact,
+            "project.version": project_version,
+            "pom.version": project_version,
+            "version": project_version,
+        })
+        if parent:
+            properties.update({
+                "project.parent.groupId": parent["group"],
+                "project.parent.artifactId": parent["artifact"],
+                "project.parent.version": parent["version"],
+            })
+
+        licenses = [interpolate(lic.text.strip(), properties)
+                    for lic in root.findall("licenses/license/name") if lic.text and lic.text.strip()]
+        if not licenses and parent_pom:
+            licenses = list(parent_pom["licenses"])
+
+        return {
+            "group": group,
+            "artifact": artifact,
+            "version": version,
+            "licenses": licenses,
+            "properties": {k: interpolate(v, properties) for k, v in properties.items()},
+            "parent": parent,
+            "snapshot": is_snapshot(version) or bool(parent_pom and parent_pom.get("snapshot")),
+            "incomplete": parent_unavailable or bool(parent_pom and parent_pom.get("incomplete")),
+            "source": source,
+        }
+
+def _coordinate(value: str | None, properties: dict[str, str]) -> str | None:
+    """Interpolate a groupId/artifactId/version; None if a reference stays unresolved."""
+    value = interpolate(value, properties)
+    return None if value is None or "${" in value else value
+
+_default_resolver = None
+_default_resolver_lock = threading.Lock()
+
+def get_pom_resolver() -> PomResolver:
+    """Return the process-wide POM resolver, creating it on first use."""
+    global _default_resolver
+    with _default_resolver_lock:
+        if _default_resolver is None:
+            _default_resolver = PomResolver()
+        return _default_resolver
@@ -0,0 +1,242 @@
+"""
+File name: tracing.py
+
+Description: Network and cache tracing for the Library License Checker tool.
+Every registry request made by the license subsystem goes through `traced_get`, which
+records the upstream host, URL class, latency, status, response size and retries, and
+retries rate-limited or failing requests. Cache lookups report hits and misses. A
+`trace_scan()` block collects these events for one scan and summarises them
+(p50/p95 latency per host, cache hit ratio, license sources), exportable as JSON.
+The active trace is scoped to the calling context, so concurrent scans on other
+threads never feed each other's summaries; worker pools opt in with `in_trace_context`.
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from urllib.parse import urlsplit
+
+import requests
+
+# Extra attempts for connection errors, timeouts and 429/5xx responses.
+HTTP_RETRIES = int(os.getenv("LICENSE_HTTP_RETRIES", 2))
+
+# Upper bound in seconds for a single backoff, including server-sent Retry-After values.
+MAX_BACKOFF = float(os.getenv("LICENSE_HTTP_MAX_BACKOFF", 10))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+@dataclass
+class RequestTrace:
+    """One upstream HTTP request, including all of its retries."""
+    host: str
+    url_class: str
+    status: int | None
+    latency_ms: float
+    bytes: int
+    retries: int
+    error: str | None = None
+    started_at: float = field(default_factory=time.time)
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 1)
+
+class ScanTrace:
+    """Requests, cache lookups and license sources recorded during one scan."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.finished_at = None
+        self.requests: list[RequestTrace] = []
+        self.cache: dict[str, list[int]] = {}
+        self.sources = Counter()
+        self._lock = threading.Lock()
+
+    def record_request(self, trace: RequestTrace) -> None:
+        with self._lock:
+            self.requests.append(trace)
+
+    def record_cache(self, namespace: str, hit: bool) -> None:
+        with self._lock:
+            counts = self.cache.setdefault(namespace, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def record_sources(self, results: list[dict]) -> None:
+        """Count where each result's license came from (its 'source' field)."""
+        with self._lock:
+            self.sources.update(r.get("source", "unknown") for r in results)
+
+    def summary(self) -> dict:
+        """
+        Summarise the scan.
+
+        Returns:
+            dict: Request count and duration, per-host latency percentiles, status
+            codes, bytes and retries, per-namespace cache hit ratios, and license sources.
+        """
+        with self._lock:
+            requests_ = list(self.requests)
+            cache = {ns: list(counts) for ns, counts in self.cache.items()}
+            sources = dict(self.sources)
+
+        hosts = {}
+        for trace in requests_:
+            hosts.setdefault(trace.host, []).append(trace)
+        host_summary = {}
+        for host, traces in sorted(hosts.items()):
+            latencies = [t.latency_ms for t in traces]
+            host_summary[host] = {
+                "requests": len(traces),
+                "p50_ms": _percentile(latencies, 50),
+                "p95_ms": _percentile(latencies, 95),
+                "statuses": dict(Counter(str(t.status or t.error) for t in traces)),
+                "bytes": sum(t.bytes for t in traces),
+                "retries": sum(t.retries for t in traces),
+                "url_classes": dict(Counter(t.url_class for t in traces)),
+            }
+
+        hits = sum(counts[0] for counts in cache.values())
+        lookups = sum(sum(counts) for counts in cache.values())
+        return {
+            "duration_s": round((self.finished_at or time.time()) - self.started_at, 3),
+            "requests": len(requests_),
+            "hosts": host_summary,
+            "cache": {
+                "hit_ratio": round(hits / lookups, 3) if lookups else None,
+                "namespaces": {ns: {"hits": h, "misses": m, "hit_ratio": round(h / (h + m), 3)}
+                               for ns, (h, m) in sorted(cache.items())},
+            },
+            "sources": sources,
+        }
+
+    def to_json(self, path: str, include_requests: bool = True) -> None:
+        """Write the summary, and optionally every request trace, to a JSON file."""
+        data = {"summary": self.summary()}
+        if include_requests:
+            with self._lock:
+                data["requests"] = [asdict(t) for t in self.requests]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def format_summary(self) -> str:
+        """Return a short human-readable summary for console output."""
+        summary = self.summary()
+        lines = [f"{summary['requests']} requests in {summary['duration_s']}s, "
+                 f"cache hit ratio {summary['cache']['hit_ratio']}"]
+        for host, stats in summary["hosts"].items():
+            lines.append(f"  {host:28} n={stats['requests']:<5} p50={stats['p50_ms']}ms "
+                         f"p95={stats['p95_ms']}ms retries={stats['retries']}")
+        if summary["sources"]:
+            lines.append("  sources: " + ", ".join(f"{k}={v}" for k, v in sorted(summary["sources"].items())))
+        return "\n".join(lines)
+
+# Scan traces open in the current context (outermost first); empty when nothing is traced.
+_active_traces: contextvars.ContextVar[tuple[ScanTrace, ...]] = contextvars.ContextVar("active_traces", default=())
+
+@contextmanager
+def trace_scan():
+    """
+    Collect tracing events for the duration of the block.
+
+    Only events from the current context are recorded. Work handed to other threads
+    is included when the callable is wrapped with `in_trace_context`.
+    """
+    trace = ScanTrace()
+    token = _active_traces.set(_active_traces.get() + (trace,))
+    try:
+        yield trace
+    finally:
+        trace.finished_at = time.time()
+        _active_traces.reset(token)
+
+def in_trace_context(fn):
+    """
+    Bind `fn` to the caller's active scan traces, for use with worker pools.
+
+    Each call runs in its own copy of the caller's context, so the wrapper can be
+    called from several threads at once.
+    """
+    context = contextvars.copy_context()
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+    return run
+
+def _active() -> tuple[ScanTrace, ...]:
+    return _active_traces.get()
+
+def record_cache(namespace: str, hit: bool) -> None:
+    """Report a cache lookup to the scan traces active in the current context."""
+    for trace in _active():
+        trace.record_cache(namespace, hit)
+
+def _backoff(attempt: int, response: requests.Response | None) -> float:
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(MAX_BACKOFF, float(retry_after))
+        except ValueError:
+            pass
+    return min(MAX_BACKOFF, 0.5 * 2 ** attempt)
+
+def traced_get(url: str, url_class: str, retries: int = HTTP_RETRIES, **kwargs) -> requests.Response:
+    """
+    Perform `requests.get` with retries, recording one trace event per logical request.
+
+    Connection errors, timeouts and 429/5xx responses are retried with exponential
+    backoff (honouring `Retry-After`). The last response is returned as-is.
+
+    Args:
+        url (str): Request URL.
+        url_class (str): Stable label for the kind of request (e.g. "pypi:json").
+        retries (int): Extra attempts after the first one.
+        **kwargs: Passed through to `requests.get`.
+
+    Returns:
+        requests.Response: The final response.
+
+    Raises:
+        requests.RequestException: If the last attempt failed without a response.
+    """
+    host = urlsplit(url).netloc
+    started = time.perf_counter()
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = requests.get(url, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                _record(host, url_class, started, attempt, response=response)
+                return response
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= retries:
+                _record(host, url_class, started, attempt, error=type(e).__name__)
+                raise
+        except requests.RequestException as e:
+            _record(host, url_class, started, attempt, error=type(e).__name__)
+            raise
+        time.sleep(_backoff(attempt, response))
+        attempt += 1
+
+def _record(host: str, url_class: str, started: float, retries: int,
+            response: requests.Response | None = None, error: str | None = None) -> None:
+    traces = _active()
+    if not traces:
+        return
+    event = RequestTrace(
+        host=host,
+        url_class=url_class,
+        status=response.status_code if response is not None else None,
+        latency_ms=round((time.perf_counter() - started) * 1000, 1),
+        bytes=len(response.content) if response is not None else 0,
+        retries=retries,
+        error=error,
+    )
+    for trace in traces:
+        trace.record_request(event)
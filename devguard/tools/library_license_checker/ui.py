@@ -1,11 +1,137 @@
 import streamlit as st
-import pandas as pd
 import tempfile
 import os
 import io
-
-from devguard.tools.library_license_checker.helpers import extract_java_imports
-from devguard.tools.library_license_checker.license_api import fetch_license
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+
+from devguard.tools.library_license_checker.helpers import (extract_python_imports,
+                                                            extract_java_imports,
+                                                            find_java_alias_for_import,
+                                                            parse_pom_xml,
+                                                            deduplicate_license_results)
+from devguard.tools.library_license_checker.license_api import (fetch_license,
+                                                                fetch_java_license_info,
+                                                                get_cached_license)
+from devguard.tools.library_license_checker.license_utils import rate_license
+from devguard.tools.library_license_checker.maven_versions import resolve_latest_versions
+from devguard.tools.library_license_checker.license_warmer import interactive_lookup
+from devguard.tools.library_license_checker.exporters import export_xlsx
+from devguard.tools.library_license_checker.tracing import in_trace_context
+
+# Concurrent license lookups started by the UI.
+UI_MAX_WORKERS = int(os.getenv("LICENSE_UI_MAX_WORKERS", 16))
+
+# Minimum seconds between table redraws while lookups stream in.
+RENDER_INTERVAL = 0.2
+
+PENDING_LICENSE = "⏳ Resolving..."
+
+def _unknown_result(name: str, version: str = "?") -> dict:
+    return {
+        "name": name,
+        "version": version,
+        "license": "Unknown",
+        "rating": rate_license("Unknown")
+    }
+
+def _java_result(group: str, artifact: str, version: str | None) -> dict:
+    if not version:
+        # Archived JARs can still answer when the latest version cannot be looked up
+        print(f"[WARN] Could not resolve version for {group}:{artifact}")
+    info = fetch_java_license_info(group, artifact, version or "latest")
+    return {
+        "name": f"{group}:{artifact}",
+        "version": version or "latest",
+        "license": info["license"],
+        "rating": rate_license(info["license"]),
+        "source": info["source"]
+    }
+
+def _plan_lookups(ext: str, temp_path: str) -> tuple[dict[str, dict], dict[str, partial]]:
+    """
+    Split the packages of an uploaded file into results that are already known
+    (cached licenses, unmapped Java imports) and lookups that still have to run.
+
+    Returns:
+        tuple: (package → ready result, package → zero-argument lookup callable)
+    """
+    ready, pending = {}, {}
+    if ext == ".py":
+        for pkg in extract_python_imports(temp_path):
+            cached = get_cached_license(pkg)
+            if cached is not None:
+                ready[pkg] = {**cached, "source": "cache"}
+            else:
+                pending[pkg] = partial(fetch_license, pkg)
+
+    elif ext == ".java":
+        coords = {}
+        for imp in extract_java_imports(temp_path):
+            # Find longest matching alias prefix
+            group, artifact = find_java_alias_for_import(imp)
+            if group and artifact:
+                coords.setdefault(f"{group}:{artifact}", (group, artifact))
+            else:
+                ready[imp] = _unknown_result(imp)
+        # One batched query resolves every artifact's latest version
+        versions = resolve_latest_versions(list(coords.values()))
+        for name, (group, artifact) in coords.items():
+            pending[name] = partial(_java_result, group, artifact, versions.get((group, artifact)))
+
+    else:
+        deps = parse_pom_xml(temp_path)
+        versions = resolve_latest_versions([(group, artifact) for group, artifact, version in deps if not version])
+        for group, artifact, version in deps:
+            pending.setdefault(f"{group}:{artifact}",
+                               partial(_java_result, group, artifact, version or versions.get((group, artifact))))
+    return ready, pending
+
+def _table_rows(order: list[str], results: dict[str, dict]) -> list[dict]:
+    return [
+        {
+            "Package": results[name]["name"] if name in results else name,
+            "License": results[name]["license"] if name in results else PENDING_LICENSE,
+            "Rating": results[name]["rating"] if name in results else ""
+        }
+        for name in order
+    ]
+
+def _stream_lookups(ready: dict[str, dict], pending: dict[str, partial]) -> list[dict]:
+    """
+    Run the pending lookups concurrently, redrawing the table and progress as each resolves.
+
+    Ready results are shown immediately; pending rows show a placeholder until their lookup finishes.
+    """
+    order = list(ready) + list(pending)
+    results = dict(ready)
+    total = len(order)
+
+    st.subheader("📦 Detected Packages and License Info")
+    progress = st.progress(len(results) / total, text=f"{len(results)}/{total} packages resolved")
+    table = st.empty()
+    table.table(_table_rows(order, results))
+
+    last_render = time.monotonic()
+    with interactive_lookup(), ThreadPoolExecutor(max_workers=UI_MAX_WORKERS) as pool:
+        futures = {pool.submit(in_trace_context(lookup)): name for name, lookup in pending.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = {**_unknown_result(name), "error": str(e)}
+
+            done = len(results)
+            progress.progress(done / total, text=f"{done}/{total} packages resolved")
+            if done == total or time.monotonic() - last_render >= RENDER_INTERVAL:
+                table.table(_table_rows(order, results))
+                last_render = time.monotonic()
+
+    progress.empty()
+    table.empty()
+    return [results[name] for name in order]
 
 def render():
     uploaded_file = st.file_uploader(
@@ -20,71 +146,27 @@ def render():
 
         st.success("File uploaded successfully!")
         st.info(f"📄 File: `{uploaded_file.name}`")
-        
+
         ext = os.path.splitext(uploaded_file.name)[-1].lower()
 
-        with st.spinner("Analyzing file and retrieving license info..."):
-            results = []
-
-            if ext == ".py":
-                packages = extract_python_imports(temp_path)
-                results = [fetch_license(pkg) for pkg in packages]
-
-            elif ext == ".java":
-                imports = extract_java_imports(temp_path)
-                for imp in imports:
-                    # Find best matching alias prefix
-                    matched = next((key for key in JAVA_IMPORT_ALIASES if imp.startswith(key)), None)
-                    if not matched:
-                        results.append({
-                            "name": imp,
-                            "version": "?",
-                            "license": "Unknown",
-                            "rating": rate_license("Unknown")
-                        })
-                        continue
-
-                    group, artifact = JAVA_IMPORT_ALIASES[matched]
-                    license_name = fetch_java_license(group, artifact, "latest")
-                    results.append({
-                        "name": f"{group}:{artifact}",
-                        "version": "latest",
-                        "license": license_name,
-                        "rating": rate_license(license_name)
-                    })
-
-            elif ext == ".xml" and "pom" in uploaded_file.name.lower():
-                deps = parse_pom_xml(temp_path)
-                for group, artifact, version in deps:
-                    resolved_version = version or get_latest_version(group, artifact)
-                    if not resolved_version:
-                        print(f"[WARN] Could not resolve version for {group}:{artifact}")
-                        license_name = "Unknown"
-                    else:
-                        license_name = fetch_java_license(group, artifact, resolved_version)
-                    results.append({
-                        "name": f"{group}:{artifact}",
-                        "version": resolved_version,
-                        "license": license_name,
-                        "rating": rate_license(license_name)
-                    })
-            
-            elif ext == ".gradle":
-                st.warning("Gradle support is not yet implemented. Stay tuned!")
-                os.remove(temp_path)
-                st.stop()
+        if ext == ".gradle":
+            st.warning("Gradle support is not yet implemented. Stay tuned!")
+            os.remove(temp_path)
+            st.stop()
 
-            else:
-                st.warning("❌ Unsupported file type or structure.")
-                os.remove(temp_path)
-                st.stop()
+        elif ext not in (".py", ".java") and not (ext == ".xml" and "pom" in uploaded_file.name.lower()):
+            st.warning("❌ Unsupported file type or structure.")
+            os.remove(temp_path)
+            st.stop()
 
+        with st.spinner("Reading dependencies..."):
+            ready, pending = _plan_lookups(ext, temp_path)
+
+        results = _stream_lookups(ready, pending) if ready or pending else []
         results = deduplicate_license_results(results)
         if not results:
             st.warning("No packages or dependencies found.")
         else:
-            st.subheader("📦 Detected Packages and License Info")
-
             result_table = [
                 {
                     "Package": r["name"],
@@ -97,16 +179,17 @@ def render():
             st.table(result_table)
 
             # Export to Excel
-            df = pd.DataFrame(result_table)
             excel_buffer = io.BytesIO()
-            with pd.ExcelWriter(excel_buffer, engine="xlsxwriter") as writer:
-                df.to_excel(writer, index=False, sheet_name="Licenses")
-
-            st.download_button(
-                label="📥 Download results as Excel",
-                data=excel_buffer.getvalue(),
-                file_name="license_check_results.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
-
-        os.remove(temp_path)
\ No newline at end of file
+            try:
+                export_xlsx(result_table, excel_buffer, columns=["Package", "License", "Rating"])
+            except ImportError as e:
+                st.warning(f"Excel download unavailable: {e}")
+            else:
+                st.download_button(
+                    label="📥 Download results as Excel",
+                    data=excel_buffer.getvalue(),
+                    file_name="license_check_results.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+
+        os.remove(temp_path)
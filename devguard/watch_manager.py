@@ -0,0 +1,322 @@
+# watch_manager.py
+
+import os
+import sys
+import threading
+import time
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from path_filter import PathFilter
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Directories to watch, separated by os.pathsep; defaults to ALLOWED_FILE_DIR.
+WATCHER_ROOTS = [root for root in os.getenv("WATCHER_ROOTS", "").split(os.pathsep) if root]
+
+# Directories watched natively before falling back to polling (Linux: fs.inotify.max_user_watches).
+WATCHER_MAX_WATCHES = int(os.getenv("WATCHER_MAX_WATCHES", 8192))
+
+# Poll interval bounds (seconds); the interval shrinks after changes and grows while idle.
+WATCHER_POLL_MIN_INTERVAL = float(os.getenv("WATCHER_POLL_MIN_INTERVAL", 1.0))
+WATCHER_POLL_MAX_INTERVAL = float(os.getenv("WATCHER_POLL_MAX_INTERVAL", 10.0))
+
+# Skip native watching entirely, e.g. on network drives.
+WATCHER_FORCE_POLLING = os.getenv("WATCHER_FORCE_POLLING", "false").lower() == "true"
+
+def plan_watches(root: str, path_filter: PathFilter) -> list[tuple[str, bool, int]]:
+    """
+    Choose the directories to watch under `root`.
+
+    Every directory that is not excluded is covered, so a supported file appearing
+    anywhere triggers an event. A subtree without excluded directories becomes one
+    recursive watch; a directory with excluded children is watched non-recursively and
+    its children are planned separately, so `.git`, `venv`, `node_modules` and similar
+    never cost a watch.
+
+    Args:
+        root (str): Watch root.
+        path_filter (PathFilter): Filter for `root`.
+
+    Returns:
+        list[tuple[str, bool, int]]: `(directory, recursive, directories covered)` per watch.
+    """
+    def visit(path: str) -> tuple[bool, int, list]:
+        clean, subtree_dirs, child_plans = True, 1, []
+        try:
+            with os.scandir(path) as entries:
+                subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            subdirs = []
+        for subdir in subdirs:
+            if path_filter.excludes_dir(subdir):
+                clean = False
+                continue
+            child_clean, child_dirs, child_plan = visit(subdir)
+            clean = clean and child_clean
+            subtree_dirs += child_dirs
+            child_plans.extend(child_plan)
+        if clean:
+            return True, subtree_dirs, [(path, True, subtree_dirs)]
+        return False, subtree_dirs, [(path, False, 1)] + child_plans
+
+    _, _, plan = visit(os.path.abspath(root))
+    return plan
+
+def scan_files(filters: dict[str, PathFilter]) -> dict[str, tuple[int, int]]:
+    """
+    Stat every supported file under the filters' roots, pruning excluded directories.
+
+    Args:
+        filters (dict[str, PathFilter]): Path filter per root.
+
+    Returns:
+        dict[str, tuple[int, int]]: `path → (size, mtime_ns)`.
+    """
+    stats = {}
+    for root, path_filter in filters.items():
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not path_filter.excludes_dir(entry.path):
+                                stack.append(entry.path)
+                        elif path_filter.matches(entry.path):
+                            st = entry.stat()
+                            stats[entry.path] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                continue
+    return stats
+
+def _max_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+class PollingWatcher:
+    """
+    Stat-based fallback watcher using `os.scandir`, pruned by the path filters.
+
+    Each pass compares size and mtime of every supported file against the previous pass
+    and reports changed and deleted files. The interval drops to `min_interval` after
+    a pass with changes and doubles while idle up to `max_interval`, and is never
+    shorter than a few times the duration of one pass.
+
+    Args:
+        filters (dict[str, PathFilter]): Path filter per watch root.
+        on_change (callable): Called with the path of each new or changed file.
+        on_delete (callable): Called with the path of each deleted file.
+        min_interval (float): Shortest delay between passes.
+        max_interval (float): Longest delay between passes.
+    """
+
+    def __init__(self, filters: dict[str, PathFilter], on_change, on_delete,
+                 min_interval: float = WATCHER_POLL_MIN_INTERVAL, max_interval: float = WATCHER_POLL_MAX_INTERVAL):
+        self.filters = filters
+        self.on_change = on_change
+        self.on_delete = on_delete
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.passes = 0
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="watcher-poll", daemon=True)
+
+    def start(self) -> "PollingWatcher":
+        self._stats = scan_files(self.filters)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def file_count(self) -> int:
+        return len(self._stats)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            started = time.monotonic()
+            stats = scan_files(self.filters)
+            changed = [path for path, stat in stats.items() if self._stats.get(path) != stat]
+            deleted = [path for path in self._stats if path not in stats]
+            self._stats = stats
+            self.passes += 1
+            for path in deleted:
+                self.on_delete(path)
+            for path in changed:
+                self.on_change(path)
+            elapsed = time.monotonic() - started
+            idle_interval = self.min_interval if changed or deleted else min(self.interval * 2, self.max_interval)
+            self.interval = max(idle_interval, elapsed * 4)
+
+class _DirectoryHandler(FileSystemEventHandler):
+    """Schedules watches for directories created under a non-recursive watch and drops those of removed ones."""
+
+    def __init__(self, manager: "WatchManager", root: str):
+        self.manager = manager
+        self.root = root
+
+    def on_created(self, event):
+        if event.is_directory:
+            self.manager.watch_new_directory(self.root, event.src_path)
+
+    def on_deleted(self, event):
+        if event.is_directory:
+            self.manager.unwatch_directory(event.src_path)
+
+    def on_moved(self, event):
+        if event.is_directory:
+            self.manager.unwatch_directory(event.src_path)
+            self.manager.watch_new_directory(self.root, event.dest_path)
+
+class WatchManager:
+    """
+    Watches several roots natively with as few watches as possible, or by polling.
+
+    Native watches follow `plan_watches`. Directories created later under a
+    non-recursive watch are planned and scheduled when they appear, and the supported
+    files they already contain are reported. Watches of directories that are deleted or
+    moved away are dropped, so a directory recreated later (e.g. by a checkout) is
+    watched again. When the native watcher fails (e.g. the
+    inotify limit is hit) or would need more than `max_watches` directories, the
+    manager switches to `PollingWatcher`.
+
+    Args:
+        roots (list[str]): Directories to watch.
+        make_handler (callable): `make_handler(path_filter)` returning the file event handler for a root.
+        on_change (callable): Called with changed file paths found outside native events.
+        on_delete (callable): Called with deleted file paths found while polling.
+        max_watches (int): Most directories to watch natively.
+        force_polling (bool): Skip native watching.
+    """
+
+    def __init__(self, roots: list[str], make_handler, on_change, on_delete,
+                 max_watches: int = WATCHER_MAX_WATCHES, force_polling: bool = WATCHER_FORCE_POLLING):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.filters = {root: PathFilter(root) for root in self.roots}
+        self.make_handler = make_handler
+        self.on_change = on_change
+        self.on_delete = on_delete
+        self.max_watches = max_watches
+        self.force_polling = force_polling
+        self.mode = None
+        self.metrics: dict = {}
+        self.observer = None
+        self.poller = None
+        self._handlers: dict[str, FileSystemEventHandler] = {}
+        self._watches: dict[str, tuple] = {}  # directory → (ObservedWatch, directories covered)
+        self._lock = threading.RLock()
+
+    @property
+    def watched_dirs(self) -> int:
+        with self._lock:
+            return sum(covered for _, covered in self._watches.values())
+
+    def start(self) -> "WatchManager":
+        started = time.perf_counter()
+        if self.force_polling or not self._start_native():
+            self._start_polling()
+        self.metrics = {
+            "mode": self.mode,
+            "roots": len(self.roots),
+            "setup_seconds": round(time.perf_counter() - started, 3),
+            "watches": len(self._watches) if self.mode == "native" else 0,
+            "watched_dirs": self.watched_dirs if self.mode == "native" else 0,
+            "polled_files": self.poller.file_count if self.poller else 0,
+            "max_rss_mb": _max_rss_mb(),
+        }
+        print(f"📈 Watcher setup: {self.metrics}")
+        return self
+
+    def stop(self) -> None:
+        if self.observer:
+            self.observer.stop()
+        if self.poller:
+            self.poller.stop()
+
+    def _start_native(self) -> bool:
+        plans = {root: plan_watches(root, self.filters[root]) for root in self.roots}
+        planned = sum(covered for plan in plans.values() for _, _, covered in plan)
+        if planned > self.max_watches:
+            print(f"⚠️ {planned} directories exceed WATCHER_MAX_WATCHES={self.max_watches}, polling instead")
+            return False
+        self.observer = Observer()
+        self.observer.start()
+        self.mode = "native"
+        try:
+            for root, plan in plans.items():
+                self._handlers[root] = self.make_handler(self.filters[root])
+                for path, recursive, covered in plan:
+                    self._schedule(root, path, recursive, covered)
+        except OSError as e:
+            print(f"⚠️ Native watching failed, polling instead: {e}")
+            self._stop_native()
+            return False
+        return True
+
+    def _stop_native(self) -> None:
+        self.observer.stop()
+        self._watches.clear()
+
+    def _schedule(self, root: str, path: str, recursive: bool, covered: int) -> None:
+        with self._lock:
+            if path in self._watches:
+                return
+            if self.watched_dirs + covered > self.max_watches:
+                raise OSError(f"watch limit WATCHER_MAX_WATCHES={self.max_watches} reached")
+            watch = self.observer.schedule(self._handlers[root], path, recursive=recursive)
+            if not recursive:
+                self.observer.add_handler_for_watch(_DirectoryHandler(self, root), watch)
+            self._watches[path] = (watch, covered)
+
+    def unwatch_directory(self, path: str) -> None:
+        """Drop the watches of a deleted or moved-away directory and of everything below it."""
+        prefix = os.path.join(path, "")
+        with self._lock:
+            stale = [p for p in self._watches if p == path or p.startswith(prefix)]
+            for dir_path in stale:
+                watch, _ = self._watches.pop(dir_path)
+                try:
+                    self.observer.unschedule(watch)
+                except (KeyError, OSError):
+                    pass  # The emitter already stopped with its directory
+
+    def watch_new_directory(self, root: str, path: str) -> None:
+        """Watch a directory created after startup and report the supported files it holds."""
+        path_filter = self.filters[root]
+        if self.mode != "native" or path_filter.excludes_dir(path):
+            return
+        try:
+            for dir_path, recursive, covered in plan_watches(path, path_filter):
+                self._schedule(root, dir_path, recursive, covered)
+        except OSError as e:
+            self._fallback(f"cannot watch {path}: {e}")
+            return
+        # Files written before the watch existed produced no events
+        for dir_path, dirnames, filenames in os.walk(path):
+            dirnames[:] = [d for d in dirnames if not path_filter.excludes_dir(os.path.join(dir_path, d))]
+            for name in filenames:
+                file_path = os.path.join(dir_path, name)
+                if path_filter.matches(file_path):
+                    self.on_change(file_path)
+
+    def _fallback(self, reason: str) -> None:
+        with self._lock:
+            if self.mode == "polling":
+                return
+            print(f"⚠️ Switching the watcher to polling: {reason}")
+            self._stop_native()
+            self._start_polling()
+
+    def _start_polling(self) -> None:
+        self.mode = "polling"
+        self.poller = PollingWatcher(self.filters, self.on_change, self.on_delete).start()
@@ -0,0 +1,35 @@
+# conftest.py
+
+import pytest
+import requests
+
+from devguard.tools.library_license_checker import tracing
+
+class MemoryCache:
+    """In-memory stand-in for `DiskCache`, so tests never touch the user's cache directory."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key, default=None, allow_stale: bool = False):
+        return self.entries.get(key, default)
+
+    def set(self, key, value):
+        self.entries[key] = value
+
+@pytest.fixture
+def memory_cache():
+    return MemoryCache()
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Fail every HTTP request immediately, like an air-gapped runner; returns the attempted URLs."""
+    attempted = []
+
+    def refuse(url, *args, **kwargs):
+        attempted.append(url)
+        raise requests.ConnectionError(f"network disabled in tests: {url}")
+
+    monkeypatch.setattr(requests, "get", refuse)
+    monkeypatch.setattr(tracing, "_backoff", lambda attempt, response: 0)
+    return attempted
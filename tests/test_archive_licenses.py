@@ -0,0 +1,30 @@
+# test_archive_licenses.py
+
+import pytest
+
+from devguard.tools.library_license_checker.archive_licenses import _license_from_text_head
+
+@pytest.mark.parametrize("text, expected", [
+    ("MIT License\n\nCopyright (c) 2020 Someone\n", "MIT"),
+    ("Copyright (c) 2020 Someone\n\nPermission is hereby granted, free of charge, to any person obtaining a copy\n", "MIT"),
+    ("                                 Apache License\n                           Version 2.0, January 2004\n", "Apache-2.0"),
+    ("BSD 3-Clause License\n\nCopyright (c) 2019, Someone\n", "BSD-3-Clause"),
+    ("                    GNU GENERAL PUBLIC LICENSE\n                       Version 2, June 1991\n", "GPL-2.0"),
+    ("                    GNU GENERAL PUBLIC LICENSE\n                       Version 3, 29 June 2007\n", "GPL-3.0"),
+    ("                   GNU LESSER GENERAL PUBLIC LICENSE\n                       Version 2.1, February 1999\n", "LGPL-2.1"),
+])
+def test_known_titles(text, expected):
+    assert _license_from_text_head(text.encode()) == expected
+
+@pytest.mark.parametrize("text", [
+    # Substrings of names and companies must not look like licenses
+    "Copyright (c) 2014 Adam Smith\n\nAll rights reserved.\n",
+    "Copyright (c) 2010-2020 Submitted Works Inc\n",
+    # GPL family titles without their version line
+    "GNU GENERAL PUBLIC LICENSE\n\nThis program is free software.\n",
+    "GNU LESSER GENERAL PUBLIC LICENSE\n",
+    "Proprietary License Agreement\n",
+    "",
+])
+def test_unknown_titles(text):
+    assert _license_from_text_head(text.encode()) == "Unknown"
@@ -0,0 +1,28 @@
+# test_benchmark.py
+
+import pytest
+
+from devguard.tools.library_license_checker.benchmark import _reset_caches, bench_cache_dir
+
+def test_reset_refuses_directories_outside_the_work_dir(tmp_path):
+    outside = tmp_path / "user-cache"
+    outside.mkdir()
+    (outside / "entry.json").write_text("{}")
+    work_dir = tmp_path / "bench"
+    work_dir.mkdir()
+
+    with pytest.raises(ValueError):
+        _reset_caches(str(outside), str(work_dir))
+    with pytest.raises(ValueError):
+        _reset_caches(str(work_dir), str(work_dir))
+    assert (outside / "entry.json").exists()
+
+def test_reset_refuses_when_the_checker_uses_another_cache(tmp_path):
+    work_dir = tmp_path / "bench"
+    cache_dir = bench_cache_dir(str(work_dir))
+    (work_dir / "cache").mkdir(parents=True)
+
+    # The checker was imported with the user's DEVGUARD_CACHE_DIR, not the benchmark's
+    with pytest.raises(ValueError):
+        _reset_caches(cache_dir, str(work_dir))
+    assert (work_dir / "cache").exists()
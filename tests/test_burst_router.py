@@ -0,0 +1,50 @@
+# test_burst_router.py
+
+import threading
+
+from burst_router import BurstRouter
+from fingerprints import FingerprintGate
+from result_store import LatestResultStore
+
+def test_batched_files_are_retracted_before_the_batch_scan(tmp_path):
+    files = []
+    for i in range(4):
+        path = tmp_path / f"f{i}.py"
+        path.write_text(f"import mod{i}\n")
+        files.append(str(path))
+
+    store = LatestResultStore()
+    gate = FingerprintGate()
+    for path in files:
+        store.put(path, [("old", [])])
+        gate.record(path, gate.fingerprint(path), [("old", [])])
+
+    events, done = [], threading.Event()
+
+    def retract(batch):
+        gate.forget(batch)
+        for path in batch:
+            store.discard(path)
+        events.append(("retract", sorted(batch)))
+
+    def analyze_batch(batch):
+        events.append(("analyze", sorted(batch)))
+        return [("summary", [])]
+
+    def publish(label, results):
+        store.put(label, results)
+        done.set()
+
+    router = BurstRouter(lambda path: None, analyze_batch, publish, retract=retract,
+                         threshold=1, burst_window=10, batch_window=0.05).start()
+    for path in files:
+        router.dispatch(path)
+    assert done.wait(5)
+    router.stop()
+
+    batched = events[0][1]
+    assert events == [("retract", batched), ("analyze", batched)]
+    latest = {entry["file"]: entry["results"] for entry in store.since(0)}
+    for path in batched:
+        assert latest[path] is None
+        assert gate.unchanged_results(path, gate.fingerprint(path)) is None
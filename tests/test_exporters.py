@@ -0,0 +1,19 @@
+# test_exporters.py
+
+import sys
+
+import pytest
+
+from devguard.tools.library_license_checker.exporters import export_results
+
+ROWS = [{"name": "requests", "version": "2.32.3", "license": "Apache-2.0", "rating": "✅ Trusted"}]
+
+def test_csv_export(tmp_path):
+    output = tmp_path / "report.csv"
+    assert export_results(ROWS, str(output)) == 1
+    assert output.read_text(encoding="utf-8").splitlines()[1].startswith("requests,2.32.3,Apache-2.0")
+
+def test_xlsx_export_without_xlsxwriter_explains_the_fix(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "xlsxwriter", None)
+    with pytest.raises(ImportError, match="pip install xlsxwriter"):
+        export_results(ROWS, str(tmp_path / "report.xlsx"))
@@ -0,0 +1,42 @@
+# test_file_watcher.py
+
+import time
+
+import pytest
+
+import file_watcher
+from file_watcher import WatcherService
+
+def _wait_for_state(service, states, timeout=5):
+    deadline = time.monotonic() + timeout
+    while service.state not in states and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return service.state
+
+@pytest.fixture
+def watched_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_watcher, "ALLOWED_FILE_DIR", str(tmp_path))
+    monkeypatch.setattr(file_watcher, "WATCHER_ROOTS", [])
+    monkeypatch.setattr(file_watcher, "WATCHER_SNAPSHOT_PATH", str(tmp_path / "snapshot.json"))
+    monkeypatch.setattr(file_watcher, "start_license_cache_warmer", lambda root: None)
+    return tmp_path
+
+def test_failed_setup_is_reported_and_retried(watched_dir, monkeypatch):
+    real_watch_manager = file_watcher.WatchManager
+
+    def broken_watch_manager(*args, **kwargs):
+        raise OSError("inotify unavailable")
+
+    monkeypatch.setattr(file_watcher, "WatchManager", broken_watch_manager)
+    service = WatcherService()
+    service.start(lambda path: [], lambda path, results: None)
+    assert _wait_for_state(service, ("running", "failed")) == "failed"
+    assert not service.running
+    assert service.analysis_pool is None
+
+    monkeypatch.setattr(file_watcher, "WatchManager", real_watch_manager)
+    service.start(lambda path: [], lambda path, results: None)
+    assert _wait_for_state(service, ("running", "failed")) == "running"
+    assert service.running
+    service.stop()
+    assert service.state == "stopped"
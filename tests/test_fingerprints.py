@@ -0,0 +1,23 @@
+# test_fingerprints.py
+
+from fingerprints import FingerprintGate
+
+def _snapshot_with_one_file(tmp_path, ruleset):
+    source = tmp_path / "a.py"
+    source.write_text("import os\n")
+    gate = FingerprintGate(str(tmp_path / "snapshot.json"), ruleset=ruleset)
+    gate.record(str(source), gate.fingerprint(str(source)), [("check", [])])
+    gate.save()
+    return str(source)
+
+def test_snapshot_is_reused_under_the_same_ruleset(tmp_path):
+    source = _snapshot_with_one_file(tmp_path, "rules-1")
+    gate = FingerprintGate(str(tmp_path / "snapshot.json"), ruleset="rules-1")
+    assert gate.unchanged_results(source, gate.fingerprint(source)) == [["check", []]]
+
+def test_snapshot_is_discarded_when_the_ruleset_changed(tmp_path):
+    source = _snapshot_with_one_file(tmp_path, "rules-1")
+    gate = FingerprintGate(str(tmp_path / "snapshot.json"), ruleset="rules-2")
+    assert gate.unchanged_results(source, gate.fingerprint(source)) is None
+    unchanged, changed = gate.reconcile({source: (0, 0)}, [str(tmp_path)])
+    assert (unchanged, changed) == ([], [source])
@@ -0,0 +1,26 @@
+# test_import_scanner.py
+
+import io
+
+import pytest
+
+from devguard.tools.library_license_checker.import_scanner import (AmbiguousImportError,
+                                                                    scan_python_imports,
+                                                                    scan_python_imports_ast,
+                                                                    scan_python_source_imports)
+
+@pytest.mark.parametrize("source", [
+    'import a\nfrom b.c import d\n"""\nimport not_an_import\n"""\nimport e as f\n',
+    'x = r"""\n"""; import w\n',
+    'doc = """first\nsecond"""; from w import v\n',
+    "s = '''\n''' ; import w, y\n",
+    'def f():\n    """\n    """; import w\n',
+    'import a; import b\n',
+])
+def test_matches_ast(source):
+    assert scan_python_source_imports(source) == scan_python_imports_ast(source)
+
+def test_import_after_closing_triple_quote_is_not_missed():
+    with pytest.raises(AmbiguousImportError):
+        scan_python_imports(io.StringIO('x = r"""\n"""; import w\n'))
+    assert scan_python_source_imports('x = r"""\n"""; import w\n') == {"w"}
@@ -0,0 +1,41 @@
+# test_java_offline.py
+
+import zipfile
+
+import pytest
+
+from devguard.tools.library_license_checker import archive_licenses, maven_versions
+from devguard.tools.library_license_checker.archive_licenses import ArchiveLicenseIndex
+from devguard.tools.library_license_checker.helpers import check_java_import_file
+from devguard.tools.library_license_checker.ui import _java_result
+
+GSON_POM = (b"<project><groupId>com.google.code.gson</groupId><artifactId>gson</artifactId>"
+            b"<licenses><license><name>Apache License, Version 2.0</name></license></licenses></project>")
+
+@pytest.fixture
+def mirrored_gson(tmp_path, monkeypatch, memory_cache, offline):
+    """A mirrored gson JAR in `LICENSE_ARCHIVE_DIRS`, with no network and empty version caches."""
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    with zipfile.ZipFile(mirror / "gson-2.10.1.jar", "w") as jar:
+        jar.writestr("META-INF/maven/com.google.code.gson/gson/pom.xml", GSON_POM)
+    monkeypatch.setattr(archive_licenses, "_archive_index", ArchiveLicenseIndex([str(mirror)]))
+    monkeypatch.setattr(maven_versions, "_latest_cache", memory_cache)
+    monkeypatch.setattr(maven_versions, "_metadata_cache", memory_cache)
+    monkeypatch.setattr(maven_versions, "_memory", {})
+    return offline
+
+def test_single_file_java_scan_uses_the_archive_offline(tmp_path, mirrored_gson):
+    source = tmp_path / "App.java"
+    source.write_text("import com.google.gson.Gson;\n\npublic class App {}\n")
+
+    results = check_java_import_file(str(source))
+
+    assert [(r["name"], r["license"], r["source"]) for r in results] == [
+        ("com.google.code.gson:gson", "Apache-2.0", "archive")]
+    assert mirrored_gson, "the latest-version lookup should have been attempted"
+
+def test_ui_java_result_uses_the_archive_without_a_version(mirrored_gson):
+    result = _java_result("com.google.code.gson", "gson", None)
+
+    assert (result["license"], result["source"], result["version"]) == ("Apache-2.0", "archive", "latest")
@@ -0,0 +1,63 @@
+# test_maven_versions.py
+
+import pytest
+import requests
+
+from devguard.tools.library_license_checker import maven_versions, tracing
+from devguard.tools.library_license_checker.cache import DiskCache
+from devguard.tools.library_license_checker.maven_versions import resolve_latest_versions
+
+class _Response:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload or {}
+        self.content = b""
+        self.headers = {}
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+@pytest.fixture
+def version_caches(tmp_path, monkeypatch, memory_cache):
+    """Expired-on-write latest-version cache, empty metadata and memory caches."""
+    latest = DiskCache("maven_latest", ttl=-1)
+    latest.directory = str(tmp_path)
+    monkeypatch.setattr(maven_versions, "_latest_cache", latest)
+    monkeypatch.setattr(maven_versions, "_metadata_cache", memory_cache)
+    monkeypatch.setattr(maven_versions, "_memory", {})
+    monkeypatch.setattr(tracing, "_backoff", lambda attempt, response: 0)
+    return latest
+
+def test_network_failure_is_not_remembered(version_caches, offline):
+    coord = ("org.acme", "acme-core")
+    assert resolve_latest_versions([coord]) == {coord: None}
+    assert maven_versions._memory == {}
+
+    attempts = len(offline)
+    resolve_latest_versions([coord])
+    assert len(offline) > attempts
+
+def test_network_failure_falls_back_to_the_stale_version(version_caches, offline):
+    version_caches.set("org.acme:acme-core", "1.4.0")
+    assert resolve_latest_versions([("org.acme", "acme-core")]) == {("org.acme", "acme-core"): "1.4.0"}
+    assert maven_versions._memory == {}
+
+def test_server_error_on_metadata_is_not_remembered(version_caches, monkeypatch):
+    def get(url, **kwargs):
+        return _Response(200, {"response": {"docs": []}}) if "solrsearch" in url else _Response(503)
+
+    monkeypatch.setattr(requests, "get", get)
+    assert resolve_latest_versions([("org.acme", "acme-core")]) == {("org.acme", "acme-core"): None}
+    assert maven_versions._memory == {}
+
+def test_definitive_miss_is_remembered(version_caches, monkeypatch):
+    def get(url, **kwargs):
+        return _Response(200, {"response": {"docs": []}}) if "solrsearch" in url else _Response(404)
+
+    monkeypatch.setattr(requests, "get", get)
+    assert resolve_latest_versions([("org.acme", "acme-core")]) == {("org.acme", "acme-core"): None}
+    assert maven_versions._memory["org.acme:acme-core"][1] is None
@@ -0,0 +1,105 @@
+# test_pom_resolver.py
+
+import pytest
+import requests
+
+from devguard.tools.library_license_checker import tracing
+from devguard.tools.library_license_checker.pom_resolver import PomResolver, pom_relative_path
+
+def _write_pom(repo, group, artifact, version, body):
+    path = repo / pom_relative_path(group, artifact, version)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"<project><groupId>{group}</groupId><artifactId>{artifact}</artifactId>{body}</project>")
+
+def test_parent_version_is_interpolated_from_own_properties(tmp_path, memory_cache):
+    _write_pom(tmp_path, "org.acme", "acme-parent", "1.2.0",
+               "<version>1.2.0</version><licenses><license><name>Apache-2.0</name></license></licenses>")
+    _write_pom(tmp_path, "org.acme", "acme-core", "1.2.0",
+               "<parent><groupId>org.acme</groupId><artifactId>acme-parent</artifactId>"
+               "<version>${revision}</version></parent><version>${revision}</version>"
+               "<properties><revision>1.2.0</revision></properties>")
+    resolver = PomResolver(local_repos=[str(tmp_path)], remote_url=None, disk_cache=memory_cache)
+
+    effective = resolver.resolve("org.acme", "acme-core", "1.2.0")
+
+    assert effective["parent"]["version"] == "1.2.0"
+    assert effective["licenses"] == ["Apache-2.0"]
+    assert effective["properties"]["project.version"] == "1.2.0"
+
+def test_unresolved_parent_version_is_not_fetched(tmp_path, memory_cache):
+    _write_pom(tmp_path, "org.acme", "acme-core", "1.2.0",
+               "<parent><groupId>org.acme</groupId><artifactId>acme-parent</artifactId>"
+               "<version>${revision}</version></parent>")
+    resolver = PomResolver(local_repos=[str(tmp_path)], remote_url=None, disk_cache=memory_cache)
+
+    effective = resolver.resolve("org.acme", "acme-core", "1.2.0")
+
+    assert effective["parent"]["version"] is None
+    assert effective["properties"]["project.version"] == "1.2.0"
+
+def test_snapshot_poms_are_not_cached(tmp_path, memory_cache):
+    resolver = PomResolver(local_repos=[str(tmp_path)], remote_url=None, disk_cache=memory_cache)
+    _write_pom(tmp_path, "org.acme", "acme-core", "2.0-SNAPSHOT",
+               "<licenses><license><name>MIT</name></license></licenses>")
+    assert resolver.resolve("org.acme", "acme-core", "2.0-SNAPSHOT")["licenses"] == ["MIT"]
+
+    _write_pom(tmp_path, "org.acme", "acme-core", "2.0-SNAPSHOT",
+               "<licenses><license><name>Apache-2.0</name></license></licenses>")
+    effective = resolver.resolve("org.acme", "acme-core", "2.0-SNAPSHOT")
+
+    assert effective["licenses"] == ["Apache-2.0"]
+    assert effective["source"] == "maven-local"
+    assert memory_cache.entries == {}
+
+class _Response:
+    def __init__(self, status_code, content=b""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+@pytest.fixture
+def remote(monkeypatch):
+    """Serve POMs from a dict of URL → (status, content); unknown URLs answer 404."""
+    responses = {}
+    monkeypatch.setattr(requests, "get", lambda url, **kwargs: _Response(*responses.get(url, (404, b""))))
+    monkeypatch.setattr(tracing, "_backoff", lambda attempt, response: 0)
+    return responses
+
+REMOTE = "https://repo.example"
+PARENT_POM = (b"<project><groupId>org.acme</groupId><artifactId>acme-parent</artifactId><version>1</version>"
+              b"<licenses><license><name>MIT</name></license></licenses></project>")
+
+def test_server_errors_are_not_cached(tmp_path, memory_cache, remote):
+    url = f"{REMOTE}/{pom_relative_path('org.acme', 'acme-parent', '1')}"
+    resolver = PomResolver(local_repos=[str(tmp_path)], remote_url=REMOTE, disk_cache=memory_cache)
+
+    remote[url] = (503, b"")
+    assert resolver.resolve("org.acme", "acme-parent", "1") is None
+    assert memory_cache.entries == {}
+
+    remote[url] = (200, PARENT_POM)
+    assert resolver.resolve("org.acme", "acme-parent", "1")["licenses"] == ["MIT"]
+
+def test_missing_poms_are_remembered(tmp_path, memory_cache, remote):
+    resolver = PomResolver(local_repos=[str(tmp_path)], remote_url=REMOTE, disk_cache=memory_cache)
+    assert resolver.resolve("org.acme", "gone", "1") is None
+
+    remote[f"{REMOTE}/{pom_relative_path('org.acme', 'gone', '1')}"] = (200, PARENT_POM)
+    assert resolver.resolve("org.acme", "gone", "1") is None
+
+def test_pom_with_unreachable_parent_is_not_cached(tmp_path, memory_cache, remote):
+    _write_pom(tmp_path, "org.acme", "acme-core", "1",
+               "<parent><groupId>org.acme</groupId><artifactId>acme-parent</artifactId>"
+               "<version>1</version></parent>")
+    url = f"{REMOTE}/{pom_relative_path('org.acme', 'acme-parent', '1')}"
+    resolver = PomResolver(local_repos=[str(tmp_path)], remote_url=REMOTE, disk_cache=memory_cache)
+
+    remote[url] = (429, b"")
+    effective = resolver.resolve("org.acme", "acme-core", "1")
+    assert (effective["licenses"], effective["incomplete"]) == ([], True)
+    assert memory_cache.entries == {}
+
+    remote[url] = (200, PARENT_POM)
+    effective = resolver.resolve("org.acme", "acme-core", "1")
+    assert (effective["licenses"], effective["incomplete"]) == (["MIT"], False)
+    assert set(memory_cache.entries) == {"org.acme:acme-core:1", "org.acme:acme-parent:1"}
@@ -0,0 +1,54 @@
+# test_watch_manager.py
+
+import os
+import shutil
+import threading
+import time
+
+from watchdog.events import FileSystemEventHandler
+
+from watch_manager import WatchManager
+
+class _Recorder(FileSystemEventHandler):
+    def __init__(self, path_filter, seen):
+        self.path_filter = path_filter
+        self.seen = seen
+
+    def on_any_event(self, event):
+        if not event.is_directory and self.path_filter.matches(event.src_path):
+            self.seen.append(event.src_path)
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return predicate()
+
+def test_recreated_directory_is_watched_again(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "src").mkdir()
+    seen, changed = [], []
+    lock = threading.Lock()
+
+    def on_change(path):
+        with lock:
+            changed.append(path)
+
+    manager = WatchManager([str(tmp_path)], lambda path_filter: _Recorder(path_filter, seen),
+                           on_change=on_change, on_delete=lambda path: None, force_polling=False).start()
+    try:
+        assert manager.mode == "native"
+        src = str(tmp_path / "src")
+        assert src in manager._watches
+
+        shutil.rmtree(src)
+        assert _wait_for(lambda: src not in manager._watches)
+
+        os.mkdir(src)
+        assert _wait_for(lambda: src in manager._watches)
+        target = os.path.join(src, "a.py")
+        with open(target, "w") as f:
+            f.write("import os\n")
+        assert _wait_for(lambda: target in seen or target in changed)
+    finally:
+        manager.stop()